@@ -0,0 +1,81 @@
+# Checks that the fused FieldScanner returns exactly the same fields as the nine
+# individual searchers, and compares how long each takes.
+#
+#   python Benchmarks/fieldscan.py                      (built-in synthetic notes)
+#   python Benchmarks/fieldscan.py TxT_Results/*.txt    (your own text dumps)
+import argparse
+import contextlib
+import io
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mainextractor import search_engineering_fields  # noqa: E402
+from Fields.scanner import FieldScanner  # noqa: E402
+
+SAMPLE_NOTES = [
+    "GENERAL NOTES\nPROJECT NUMBER: 22.00.062.02\nDESIGN CRITERIA\n"
+    "1. BUILDING CODE: 2018 INTERNATIONAL BUILDING CODE, ASCE 7-16, ACI 318-14\n"
+    "2. RISK CATEGORY: II\n3. SITE CLASS = D\n4. SEISMIC DESIGN CATEGORY ........ C\n"
+    "5. ULTIMATE WIND SPEED (VULT) = 115 MPH\n"
+    "SS = 0.267g, S1 = 0.104g, SDS = 0.285g, SD1 = 0.166g, Ie = 1.0, R = 3, OMEGA0 = 3, CD = 3\n"
+    "GROUND SNOW LOAD, Pg = 10 PSF  ROOF LIVE LOAD = 20 PSF\nLIVE LOADS: OFFICE 50 PSF, CORRIDORS 100 PSF\n"
+    "6. SEISMIC FORCE RESISTING SYSTEM: STEEL SYSTEMS NOT SPECIFICALLY DETAILED FOR SEISMIC RESISTANCE\n"
+    "MATERIALS: STRUCTURAL STEEL, CONCRETE MASONRY, STEEL ROOF DECK, DRILLED PIERS, REBAR",
+    "B & P Job Number 70205085 Sheet S-001 IBC 2015 ASCE 7-10 AISC 360-10 "
+    "Seismic Risk Category 3 Site Class C Seismic Design Category: B Basic wind speed 90 mph "
+    "ordinary reinforced masonry shear walls, wood shear walls, cold-formed steel framing, glulam",
+    "PROJECT NO. 19145.1 PROJECT NO. 19145.2 PROJECT NO 19145 The North Carolina State Building Code "
+    "2018 edition. Vult 140 m.p.h. special steel moment frames with buckling-restrained braced frames",
+    "Project No. 2019-95 SHEET 22 . 00 , 092 TMS 402-16 NDS for Wood Construction AWS D1.1-15 "
+    "precast concrete shear walls tilt-up 120mph",
+]
+
+def load_corpus(paths):
+    if not paths:
+        # Repeat the samples the way extract_text_smart joins several extractors
+        return ["\n".join([note] * 4) for note in SAMPLE_NOTES]
+    corpus = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            corpus.append(f.read())
+    return corpus
+
+def main():
+    parser = argparse.ArgumentParser(description="Fused field scanner parity check and timing")
+    parser.add_argument("texts", nargs="*", help="text files to use as the corpus")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.texts)
+    scanner = FieldScanner()
+    mismatches = 0
+    legacy_time = fused_time = 0.0
+
+    for index, text in enumerate(corpus):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = perf_counter()
+            for _ in range(args.repeat):
+                expected = search_engineering_fields(text, fused=False)
+            legacy_time += perf_counter() - start
+
+            start = perf_counter()
+            for _ in range(args.repeat):
+                actual = scanner.scan(text)
+            fused_time += perf_counter() - start
+
+        for field, value in expected.items():
+            if actual.get(field) != value:
+                mismatches += 1
+                name = args.texts[index] if args.texts else f"sample {index + 1}"
+                print(f"❌ {name}: {field} searchers={value!r} scanner={actual.get(field)!r}")
+
+    runs = len(corpus) * args.repeat
+    print(f"📄 {len(corpus)} document(s), {mismatches} mismatch(es)")
+    print(f"⏱️  searchers {legacy_time / runs * 1000:.2f} ms/doc, fused scanner {fused_time / runs * 1000:.2f} ms/doc")
+    sys.exit(1 if mismatches else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# Back-to-front line detection (Extractor/mirror.py) on fixed cases: short
+# all-caps notes that must stay as they are ("TON" is not "NOT"), reversed
+# lines and blocks that must flip, and lines PyMuPDF reports as drawn through a
+# mirror. Also times fix_text on a long page of normal notes.
+#
+#   python Benchmarks/mirror.py --repeat 200
+import argparse
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Extractor.mirror import MirrorFixer  # noqa: E402
+
+# (text, lines PyMuPDF reports as mirrored on the page, expected text)
+CASES = [
+    ("SAW CUT JOINTS AT 15 FT O.C.", [], "SAW CUT JOINTS AT 15 FT O.C."),
+    ("TON", [], "TON"),
+    ("TOP OF SLAB\nTON\n12 GA DECK", [], "TOP OF SLAB\nTON\n12 GA DECK"),
+    ("WAS", [], "WAS"),
+    ("STOP", [], "STOP"),
+    ("LIVE LOAD 50 PSF", [], "LIVE LOAD 50 PSF"),
+    ("SEE S-501 FOR PIER DETAILS\nDRAW NOTES\nTYP.", [], "SEE S-501 FOR PIER DETAILS\nDRAW NOTES\nTYP."),
+    ("20.260.00.22 :REBMUN TCEJORP", [], "PROJECT NUMBER: 22.00.062.02"),
+    ("SETON GNITEEM\nTON\n20.260.00.22", [], "MEETING NOTES\nNOT\n22.00.062.02"),
+    ("MEETING NOTES\n:REBMUN\n22.00.062.02", [], "MEETING NOTES\n:REBMUN\n22.00.062.02"),
+    ("GNITEEM", ["MEETING"], "MEETING"),
+    ("LEETS", ["STEEL"], "STEEL"),
+    ("LEETS", [], "LEETS"),
+]
+
+LONG_PAGE = "\n".join([
+    "ATTENDEES: OWNER, ARCHITECT, STRUCTURAL ENGINEER, GENERAL CONTRACTOR",
+    "SAW CUT JOINTS AT 15 FT O.C. MAX. EACH WAY",
+    "TON",
+    "DISCUSSION: FOUNDATION LAYOUT WAS REVIEWED. DRILLED PIERS AT GRID LINES A-D.",
+] * 50)
+
+def check(fixer):
+    wrong = []
+    for text, mirrored, expected in CASES:
+        fixed, _ = fixer.fix_text(text, lambda mirrored=mirrored: mirrored)
+        if fixed != expected:
+            wrong.append((text, fixed, expected))
+    return wrong
+
+def main():
+    parser = argparse.ArgumentParser(description="Back-to-front line detection cases and timing")
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    fixer = MirrorFixer()
+    wrong = check(fixer)
+    print(f"🪞 {len(CASES) - len(wrong)}/{len(CASES)} case(s) right")
+    for text, fixed, expected in wrong:
+        print(f"   ❌ {text!r} -> {fixed!r} (expected {expected!r})")
+
+    start = perf_counter()
+    for _ in range(args.repeat):
+        fixer.fix_text(LONG_PAGE)
+    elapsed = (perf_counter() - start) / args.repeat * 1000
+    print(f"⏱️ fix_text on a {len(LONG_PAGE.splitlines())}-line page: {elapsed:.2f} ms")
+    sys.exit(1 if wrong else 0)
+
+if __name__ == "__main__":
+    main()
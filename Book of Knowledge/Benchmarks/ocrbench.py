@@ -0,0 +1,101 @@
+# Compares OCR pages/second between the pytesseract (process per page) and
+# tesserocr (persistent API) engines on the pages of one or more PDFs, and with
+# --adaptive the fixed 150 dpi read against adaptive OCR (OCR_LOW_DPI first,
+# OCR_HIGH_DPI only for low-confidence pages) on the configured engine.
+#
+#   python Benchmarks/ocrbench.py some.pdf other.pdf --dpi 150 --repeat 2
+#   python Benchmarks/ocrbench.py scans/*.pdf --adaptive
+import argparse
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mainextractor  # noqa: E402  (sets the Tesseract path)
+from Extractor.extractor import TextExtractor  # noqa: E402
+from Extractor.ocrengine import ENGINES, get_engine  # noqa: E402
+from Datahandler import metrics  # noqa: E402
+import numpy as np  # noqa: E402
+import fitz  # noqa: E402
+import cv2  # noqa: E402
+
+def render_pages(pdf_paths, dpi):
+    images = []
+    for path in pdf_paths:
+        with fitz.open(path) as doc:
+            for page in doc:
+                pix = TextExtractor._render_gray(page, dpi, mainextractor.OCR_MAX_PIXELS)
+                gray = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.stride)[:, :pix.width]
+                _, thresh = cv2.threshold(gray, 150, 255, cv2.THRESH_BINARY)
+                images.append(thresh)
+    return images
+
+def bench_engine(name, images, repeat):
+    engine = get_engine(name)
+    if engine.name != name:
+        return None
+    engine.image_to_string(images[0])  # warm-up (loads language data)
+    start = perf_counter()
+    for _ in range(repeat):
+        for img in images:
+            engine.image_to_string(img)
+    elapsed = perf_counter() - start
+    return len(images) * repeat / elapsed if elapsed else 0.0
+
+def bench_adaptive(pdf_paths):
+    # Seconds per page and mean Tesseract confidence: fixed read vs adaptive
+    modes = {
+        "fixed 150 dpi": {},
+        "adaptive": {"dpi": mainextractor.OCR_LOW_DPI, "adaptive": True, "high_dpi": mainextractor.OCR_HIGH_DPI,
+                     "min_confidence": mainextractor.OCR_MIN_CONFIDENCE},
+    }
+    engine = get_engine(mainextractor.OCR_ENGINE)
+    for label, options in modes.items():
+        pages = escalated = 0
+        confidences = []
+        elapsed = 0.0
+        for path in pdf_paths:
+            # Confidence is recorded per page of the current document
+            record = metrics.begin(path)
+            with fitz.open(path) as doc:
+                start = perf_counter()
+                for page in doc:
+                    TextExtractor._ocr_page(page, max_pixels=mainextractor.OCR_MAX_PIXELS, engine=engine.name,
+                                            **options)
+                    pages += 1
+                elapsed += perf_counter() - start
+            confidences.extend(record.info.get("ocr_confidence", {}).values())
+            escalated += record.info.get("ocr_escalated", 0)
+        confidence = f"{sum(confidences) / len(confidences):.1f}" if confidences else "-"
+        print(f"   {label:14s} {elapsed / max(pages, 1):6.2f} s/page, mean confidence {confidence}, "
+              f"{escalated} page(s) re-read at {mainextractor.OCR_HIGH_DPI} dpi")
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR engine pages/second benchmark")
+    parser.add_argument("pdfs", nargs="+")
+    parser.add_argument("--dpi", type=int, default=150)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--adaptive", action="store_true", help="compare fixed and adaptive OCR instead")
+    args = parser.parse_args()
+
+    if args.adaptive:
+        print(f"📄 Fixed vs adaptive OCR ({mainextractor.OCR_ENGINE})")
+        bench_adaptive(args.pdfs)
+        return
+
+    images = render_pages(args.pdfs, args.dpi)
+    if not images:
+        print("No pages to OCR.")
+        return
+    print(f"📄 {len(images)} page(s) at {args.dpi} dpi, {args.repeat} repeat(s)")
+
+    for name in ENGINES:
+        rate = bench_engine(name, images, args.repeat)
+        if rate is None:
+            print(f"   {name:12s} not installed, skipped")
+        else:
+            print(f"   {name:12s} {rate:6.2f} pages/sec")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Page index speed on a made-up archive: bulk indexing rate and query latency
+# (phrase, prefix, boolean, job-filtered) with BM25 ranking and snippets.
+#
+#   python Benchmarks/pageindex.py --docs 5000 --pages 8
+import argparse
+import os
+import random
+import sys
+import tempfile
+from time import perf_counter
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+from Datahandler.pageindex import PageIndex  # noqa: E402
+from synthetic import FILLER, MATERIALS, SYSTEMS, field_lines, random_fields  # noqa: E402
+
+QUERIES = [
+    ("phrase", '"drilled piers"', {}),
+    ("prefix", "glul*", {}),
+    ("boolean", '"concrete masonry" NOT glulam', {}),
+    ("words", "seismic design category", {}),
+    ("job filter", "steel", {"job_number": "12."}),
+]
+
+def build(path, docs, pages_per_doc, seed, batch_size):
+    rng = random.Random(seed)
+    start = perf_counter()
+    pages_total = 0
+    with PageIndex(path, batch_size) as index:
+        for n in range(docs):
+            fields = random_fields(rng)
+            lines = field_lines(fields)
+            pages = []
+            for _ in range(pages_per_doc):
+                body = [rng.choice(FILLER) for _ in range(rng.randint(10, 30))]
+                body += rng.sample(lines, 3) + [rng.choice(MATERIALS), rng.choice(SYSTEMS)]
+                rng.shuffle(body)
+                pages.append("\n".join(body))
+            index.add(f"archive_{n:06d}.pdf", pages, "merged", [fields["Job_Number"]])
+            pages_total += len(pages)
+        index.optimize()
+    return pages_total, perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Page index benchmark")
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--pages", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "pages.db")
+        pages, seconds = build(path, args.docs, args.pages, args.seed, args.batch_size)
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        print(f"🗂️ Indexed {args.docs} document(s), {pages} page(s) in {seconds:.2f} s "
+              f"({pages / seconds:.0f} pages/s, {size_mb:.1f} MB)")
+        with PageIndex(path) as index:
+            for label, query, filters in QUERIES:
+                index.search(query, limit=20, **filters)  # warm-up
+                start = perf_counter()
+                for _ in range(args.repeat):
+                    results = index.search(query, limit=20, **filters)
+                elapsed = (perf_counter() - start) / args.repeat * 1000
+                print(f"🔎 {label:<11} {query!r:<34} {elapsed:7.2f} ms, {len(results)} result(s)")
+
+if __name__ == "__main__":
+    main()
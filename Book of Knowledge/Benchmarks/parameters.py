@@ -0,0 +1,126 @@
+# Design parameter extraction and range queries on made-up design criteria:
+# how many written-out values (different labels, units and layouts) come back
+# as the right number, and how fast SQLite answers parameter range queries.
+#
+#   python Benchmarks/parameters.py --docs 20000
+import argparse
+import os
+import random
+import sys
+import tempfile
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Fields.parameters import DesignParameterSearcher  # noqa: E402
+from Datahandler.sinks import SQLiteSink  # noqa: E402
+
+# name -> ways it gets written; {v} is the value in the format's own unit,
+# followed by the factor that turns that unit into the one in the name
+FORMATS = {
+    "Ss": [("SS = {v}g", 1), ("Ss: {v} g", 1), ("S_S = {v}%g", 0.01), ("SS ........ {v}", 1)],
+    "S1": [("S1 = {v}g", 1), ("S1: {v}", 1), ("S1 = {v} %g", 0.01)],
+    "SDS": [("SDS = {v}g", 1), ("SDS: {v}", 1), ("S DS = {v} g", 1), ("DESIGN SPECTRAL ACCELERATION (SDS): {v} g", 1)],
+    "SD1": [("SD1 = {v}g", 1), ("SD1: {v}", 1)],
+    "Vult_mph": [("ULTIMATE WIND SPEED (VULT) = {v} MPH", 1), ("VULT: {v} mph", 1), ("Vult = {v} m/s", 2.23694),
+                 ("BASIC WIND SPEED (VULT): {v} MPH", 1)],
+    "Ground_Snow_Load_psf": [("GROUND SNOW LOAD, PG = {v} PSF", 1), ("Pg = {v} psf", 1),
+                             ("GROUND SNOW LOAD: {v} kPa", 20.8854)],
+    "Roof_Live_Load_psf": [("ROOF LIVE LOAD = {v} PSF", 1), ("Lr = {v} psf", 1)],
+    "R": [("RESPONSE MODIFICATION COEFFICIENT, R = {v}", 1), ("R = {v}", 1)],
+    "Cd": [("DEFLECTION AMPLIFICATION FACTOR, Cd = {v}", 1), ("CD = {v}", 1)],
+    "Omega0": [("OVERSTRENGTH FACTOR = {v}", 1), ("Ω0 = {v}", 1), ("OMEGA0 = {v}", 1)],
+    "Ie": [("SEISMIC IMPORTANCE FACTOR (IE) = {v}", 1), ("Ie = {v}", 1)],
+}
+RANGES = {
+    "Ss": (0.1, 2.5, 3), "S1": (0.04, 1.0, 3), "SDS": (0.1, 1.8, 3), "SD1": (0.05, 1.0, 3),
+    "Vult_mph": (95, 180, 0), "Ground_Snow_Load_psf": (0, 70, 0), "Roof_Live_Load_psf": (12, 30, 0),
+    "R": (1.5, 8, 1), "Cd": (1.5, 6.5, 1), "Omega0": (1.5, 3, 1), "Ie": (1.0, 1.5, 2),
+}
+FILLER = "THE CONTRACTOR SHALL VERIFY ALL DIMENSIONS. SS 304 ANCHOR BOLTS. R = 6\" BEND RADIUS."
+QUERIES = [
+    ("SDS 0.5 to 1.0 and Vult >= 140", {"sds": (0.5, 1.0), "vult_mph": (140, None)}),
+    ("Pg > 40 psf", {"ground_snow_load_psf": (40, None)}),
+    ("R <= 3 and Ie = 1.25", {"r": (None, 3), "ie": (1.25, 1.25)}),
+]
+
+def random_criteria(rng):
+    # (text, expected values in the searcher's units)
+    lines, expected = ["DESIGN CRITERIA", FILLER], {}
+    for name, formats in FORMATS.items():
+        if rng.random() < 0.15:
+            continue  # not every sheet lists every parameter
+        low, high, digits = RANGES[name]
+        value = round(rng.uniform(low, high), digits)
+        fmt, factor = rng.choice(formats)
+        written = round(value / factor, 3) if factor != 1 else value
+        if digits == 0 and factor == 1:
+            written = int(written)
+        lines.append(fmt.format(v=written))
+        expected[name] = round(written * factor, 3)
+    loads = sorted(rng.sample([40, 50, 60, 80, 100, 125, 150], 3))
+    lines.append("LIVE LOADS: OFFICE {} PSF, CORRIDORS {} PSF, STORAGE {} PSF".format(*loads))
+    expected["Floor_Live_Load_psf"] = float(loads[-1])  # the highest one in the list
+    rng.shuffle(lines)
+    return "\n".join(lines), expected
+
+def accuracy(docs, seed):
+    rng = random.Random(seed)
+    searcher = DesignParameterSearcher()
+    right = total = 0
+    wrong = {}
+    start = perf_counter()
+    for _ in range(docs):
+        text, expected = random_criteria(rng)
+        found = searcher.search(text)
+        for name, value in expected.items():
+            total += 1
+            if found.get(name) is not None and abs(found[name] - value) <= 0.01 * max(1, value):
+                right += 1
+            else:
+                wrong[name] = wrong.get(name, 0) + 1
+    return right, total, wrong, perf_counter() - start
+
+def fill(path, docs, seed):
+    rng = random.Random(seed)
+    searcher = DesignParameterSearcher()
+    sink = SQLiteSink(path, batch_size=500)
+    for n in range(docs):
+        text, _ = random_criteria(rng)
+        sink.write({"Design_Parameters": searcher.search(text), "Source_Hash": f"{n:064x}"},
+                   f"archive_{n:06d}.pdf")
+    sink.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Design parameter extraction and range query benchmark")
+    parser.add_argument("--docs", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    right, total, wrong, seconds = accuracy(min(args.docs, 2000), args.seed)
+    print(f"🎯 {right}/{total} parameter value(s) correct ({right / total:.1%}), "
+          f"{seconds / min(args.docs, 2000) * 1000:.3f} ms/doc")
+    for name, count in sorted(wrong.items()):
+        print(f"   ❌ {name}: {count}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "results.db")
+        start = perf_counter()
+        fill(path, args.docs, args.seed)
+        print(f"🗂️ Stored {args.docs} document(s) in {perf_counter() - start:.2f} s")
+        sink = SQLiteSink(path)
+        for label, ranges in QUERIES:
+            sink.find(ranges)  # warm-up
+            start = perf_counter()
+            for _ in range(args.repeat):
+                rows = sink.find(ranges, limit=100000)
+            elapsed = (perf_counter() - start) / args.repeat * 1000
+            print(f"🔎 {label:<32} {elapsed:7.2f} ms, {len(rows)} PDF(s)")
+        plan = sink.conn.execute("EXPLAIN QUERY PLAN SELECT id FROM documents WHERE sds BETWEEN 0.5 AND 1.0 "
+                                 "AND vult_mph >= 140").fetchall()
+        print("📋 Plan:", "; ".join(row[-1] for row in plan))
+        sink.close()
+
+if __name__ == "__main__":
+    main()
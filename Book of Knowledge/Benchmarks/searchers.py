@@ -0,0 +1,64 @@
+# Per-document field search time with the searchers built for every PDF (how the
+# pool used to run) versus built once per worker process (get_field_scanner).
+#
+#   python Benchmarks/searchers.py --docs 50
+import argparse
+import contextlib
+import io
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mainextractor  # noqa: E402
+
+PAGE_TEMPLATES = [
+    "MEETING NOTES - PAGE {page}\nPROJECT NUMBER: 22.00.062.02\nATTENDEES: OWNER, ARCHITECT, STRUCTURAL ENGINEER\n"
+    "DISCUSSION: FOUNDATION LAYOUT WAS REVIEWED. DRILLED PIERS AT GRID LINES A-D, REBAR PER DETAIL 4/S-501.\n"
+    "ACTION ITEMS: ARCHITECT TO CONFIRM ROOF DRAIN LOCATIONS. CONTRACTOR TO SUBMIT CONCRETE MIX DESIGNS.\n",
+    "DESIGN CRITERIA\n1. BUILDING CODE: 2018 INTERNATIONAL BUILDING CODE, ASCE 7-16, ACI 318-14, AISC 360-16\n"
+    "2. RISK CATEGORY: II\n3. SITE CLASS = D\n4. SEISMIC DESIGN CATEGORY ........ C\n"
+    "5. ULTIMATE WIND SPEED (VULT) = 115 MPH, EXPOSURE C\n",
+    "STRUCTURAL SYSTEM\nSEISMIC FORCE RESISTING SYSTEM: SPECIAL REINFORCED MASONRY SHEAR WALLS\n"
+    "GRAVITY SYSTEM: STEEL ROOF DECK ON STEEL JOISTS AND JOIST GIRDERS, STRUCTURAL STEEL COLUMNS\n"
+    "MATERIALS: CONCRETE MASONRY, CAST-IN-PLACE CONCRETE, ASTM A992 WIDE FLANGE, GLULAM BEAMS\n",
+    "OPEN ISSUES\nMECHANICAL UNITS ON ROOF NEED CURB DETAILS. THE OWNER ASKED ABOUT FUTURE SOLAR PANELS.\n"
+    "NEXT MEETING: TUESDAY 10:00 AM. MINUTES BY B&P. REVISIONS 1-3 ISSUED FOR PERMIT.\n",
+]
+
+def synthetic_note(pages=5):
+    # Each page is a few paragraphs, repeated the way a real note fills a page
+    out = []
+    for page in range(1, pages + 1):
+        template = PAGE_TEMPLATES[(page - 1) % len(PAGE_TEMPLATES)]
+        out.append(template.format(page=page) * 6)
+    return "\f".join(out)
+
+def time_per_doc(text, docs, fused, per_document):
+    with contextlib.redirect_stdout(io.StringIO()):
+        mainextractor.search_engineering_fields(text, fused=fused)  # warm-up
+        start = perf_counter()
+        for _ in range(docs):
+            if per_document:
+                mainextractor._field_scanner = None  # rebuild every searcher, like before
+            mainextractor.search_engineering_fields(text, fused=fused)
+        return (perf_counter() - start) / docs * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Field search time: searchers per PDF vs per process")
+    parser.add_argument("--docs", type=int, default=50)
+    parser.add_argument("--pages", type=int, default=5)
+    args = parser.parse_args()
+
+    text = synthetic_note(args.pages)
+    print(f"📄 Synthetic {args.pages}-page note, {len(text):,} characters, {args.docs} documents")
+    for fused in (False, True):
+        label = "fused scanner" if fused else "searchers"
+        before = time_per_doc(text, args.docs, fused, per_document=True)
+        after = time_per_doc(text, args.docs, fused, per_document=False)
+        print(f"⏱️  {label}: built per PDF {before:.2f} ms/doc, built once {after:.2f} ms/doc "
+              f"({before / after:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# Worker startup: time to the first finished document from a cold pool, for each
+# start method and preload list, then the same documents again on the now warm
+# workers. Each setup runs in its own Python process so nothing is imported or
+# started (e.g. a forkserver) before it is measured.
+#
+#   python Benchmarks/startup.py --workers 4
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+
+SETUPS = [
+    # (label, start method, preload)
+    ("spawn, lazy", "spawn", []),
+    ("spawn, preload pymupdf", "spawn", ["pymupdf"]),
+    ("spawn, preload text", "spawn", ["pymupdf", "pdfplumber"]),
+    ("spawn, preload all", "spawn", ["pymupdf", "pdfplumber", "pdfminer", "ocr"]),
+    ("forkserver, preload pymupdf", "forkserver", ["pymupdf"]),
+    ("forkserver, preload text", "forkserver", ["pymupdf", "pdfplumber"]),
+    ("forkserver, preload all", "forkserver", ["pymupdf", "pdfplumber", "pdfminer", "ocr"]),
+]
+
+def quiet_init(preload):
+    # Workers print a lot per PDF; keep the benchmark output readable
+    sys.stdout = open(os.devnull, "w")
+    from mainextractor import init_worker
+    init_worker(preload)
+
+def make_pdfs(folder, count, seed=7):
+    sys.path.insert(0, BENCH_DIR)
+    from synthetic import build_pdf, page_texts, random_fields
+    rng = random.Random(seed)
+    paths = []
+    for n in range(count):
+        path = os.path.join(folder, f"startup_{n:03d}.pdf")
+        build_pdf(path, page_texts(rng, random_fields(rng), 2), "digital")
+        paths.append(path)
+    return paths
+
+def run_setup(start_method, preload, workers):
+    # One measurement, in this (fresh) process; prints a JSON line
+    sys.path.insert(0, ROOT)
+    start = perf_counter()
+    import mainextractor
+    import_seconds = perf_counter() - start
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        with contextlib.redirect_stdout(io.StringIO()):
+            paths = make_pdfs(tmp, workers * 2)
+        context = mainextractor.get_pool_context(start_method, preload)
+        start = perf_counter()
+        with context.Pool(processes=workers, initializer=quiet_init, initargs=(preload,)) as pool:
+            cold = paths[:workers]
+            done = []
+            for _ in pool.imap_unordered(mainextractor.process_pdf_file, cold):
+                done.append(perf_counter() - start)
+            warm_start = perf_counter()
+            list(pool.imap_unordered(mainextractor.process_pdf_file, paths[workers:]))
+            warm = perf_counter() - warm_start
+    print(json.dumps({"import": import_seconds, "first": done[0], "all_cold": done[-1], "warm": warm,
+                      "method": context.get_start_method()}))
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker startup benchmark")
+    parser.add_argument("--workers", type=int, default=min(4, multiprocessing.cpu_count()))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--run", nargs=2, metavar=("METHOD", "PRELOAD"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        method, preload = args.run
+        run_setup(method, [p for p in preload.split(",") if p], args.workers)
+        return
+
+    available = multiprocessing.get_all_start_methods()
+    print(f"⚙️ {args.workers} worker(s), {args.workers} cold + {args.workers} warm document(s), "
+          f"best of {args.repeat}")
+    print(f"   {'setup':<26} {'import':>8} {'1st doc':>8} {'all cold':>9} {'warm':>8}")
+    for label, method, preload in SETUPS:
+        if method not in available:
+            print(f"   {label:<26} (not available on this platform)")
+            continue
+        runs = []
+        for _ in range(args.repeat):
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--workers", str(args.workers),
+                 "--run", method, ",".join(preload)],
+                capture_output=True, text=True, cwd=ROOT)
+            lines = [line for line in output.stdout.splitlines() if line.startswith("{")]
+            if not lines:
+                print(f"   {label:<26} ❌ failed: {output.stderr.strip().splitlines()[-1:]}")
+                break
+            runs.append(json.loads(lines[-1]))
+        if runs:
+            best = {key: min(run[key] for run in runs) for key in ("import", "first", "all_cold", "warm")}
+            print(f"   {label:<26} {best['import'] * 1000:6.0f}ms {best['first'] * 1000:6.0f}ms "
+                  f"{best['all_cold'] * 1000:7.0f}ms {best['warm'] * 1000:6.0f}ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+# Benchmark suite on a deterministic synthetic corpus (see synthetic.py):
+# throughput and field accuracy per extractor, per field searcher and end to end
+# through process_pdf_file, compared against a stored baseline.
+#
+#   python Benchmarks/suite.py                     (compare with the baseline)
+#   python Benchmarks/suite.py --save-baseline     (store this run as the baseline)
+#   python Benchmarks/suite.py --docs 40 --seed 3 --skip-e2e
+#
+# Accuracy on the synthetic corpus is the same on every machine, so it is kept in
+# baselines/baseline.json, which is committed. Timings depend on the machine, so
+# they go to baselines/timings.json, which stays on the machine that made it.
+# Exits 1 when accuracy dropped or something got slower than --tolerance allows.
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+from time import perf_counter
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import mainextractor  # noqa: E402  (sets the Tesseract path)
+from synthetic import KINDS, generate_corpus, score_fields  # noqa: E402
+from Extractor.extractor import TextExtractor  # noqa: E402
+from Extractor.document import Document  # noqa: E402
+from Datahandler import metrics  # noqa: E402
+import pytesseract  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baselines", "baseline.json")
+DEFAULT_TIMINGS = os.path.join(BENCH_DIR, "baselines", "timings.json")
+TIMING_KEYS = ("pages_per_sec", "docs_per_sec", "ms_per_doc", "stage_seconds")
+
+def tesseract_available():
+    try:
+        pytesseract.get_tesseract_version()
+        return True
+    except Exception:
+        return False
+
+def quiet():
+    return contextlib.redirect_stdout(io.StringIO())
+
+def accuracy(scores):
+    # scores: list of {field: bool}
+    total = sum(len(s) for s in scores)
+    return round(sum(sum(s.values()) for s in scores) / total, 4) if total else None
+
+def by_kind(truth, scores):
+    out = {}
+    for kind in KINDS:
+        picked = [s for t, s in zip(truth, scores) if t["kind"] == kind]
+        if picked:
+            out[kind] = accuracy(picked)
+    return out
+
+# --- stages ---
+def bench_extractors(corpus_dir, truth):
+    scanner = mainextractor.get_field_scanner()
+    extractors = {
+        "pymupdf": TextExtractor.extract_with_pymupdf,
+        "pdfplumber": TextExtractor.extract_with_pdfplumber,
+        "pdfminer": TextExtractor.extract_with_pdfminer,
+    }
+    if tesseract_available():
+        extractors["ocr"] = lambda d: TextExtractor.extract_with_hybrid_ocr(
+            d, max_pixels=mainextractor.OCR_MAX_PIXELS, engine=mainextractor.OCR_ENGINE)
+    else:
+        print("⚠️ Tesseract not found; skipping the OCR extractor")
+
+    results = {}
+    pages = sum(t["pages"] for t in truth)
+    for name, extractor in extractors.items():
+        elapsed = 0.0
+        scores = []
+        for item in truth:
+            # A fresh Document each time so no extractor reuses another's work
+            with Document(os.path.join(corpus_dir, item["file"])) as document, quiet():
+                start = perf_counter()
+                text = extractor(document)
+                elapsed += perf_counter() - start
+                scores.append(score_fields(item["expected"], scanner.scan(text or "")))
+        results[name] = {
+            "pages_per_sec": round(pages / elapsed, 2) if elapsed else None,
+            "accuracy": accuracy(scores),
+            "accuracy_by_kind": by_kind(truth, scores),
+        }
+    return results
+
+def bench_searchers(truth, repeat=5):
+    # Each field searcher on the ground-truth text, so extraction errors don't count
+    scanner = mainextractor.get_field_scanner()
+    searchers = {
+        "Job_Number": scanner.jobnumber_searcher.search,
+        "Design_Codes": lambda t: scanner.code_searcher.standardize_design_codes(
+            scanner.code_searcher.search_codes(t)),
+        "Materials": scanner.materials_searcher.search,
+        "Seismic_Resistance_System": scanner.seismicR_searcher.search,
+        "Risk_Category": lambda t: scanner.risk_searcher.standardize(scanner.risk_searcher.search(t)),
+        "Site_Class": lambda t: scanner.site_searcher.standardize(scanner.site_searcher.search(t)),
+        "Seismic_Design_Category": scanner.seismic_searcher.search,
+        "Wind_Speed": scanner.wind_searcher.search,
+        "fused_scanner": None,
+    }
+    results = {}
+    for field, search in searchers.items():
+        elapsed = 0.0
+        correct = []
+        for item in truth:
+            with quiet():
+                start = perf_counter()
+                for _ in range(repeat):
+                    value = scanner.scan(item["text"]) if search is None else search(item["text"])
+                elapsed += perf_counter() - start
+            if search is None:
+                correct.extend(score_fields(item["expected"], value).values())
+            else:
+                correct.append(score_fields({field: item["expected"][field]}, {field: value})[field])
+        results[field] = {
+            "ms_per_doc": round(elapsed / (len(truth) * repeat) * 1000, 3),
+            "accuracy": round(sum(correct) / len(correct), 4) if correct else None,
+        }
+    return results
+
+def bench_end_to_end(corpus_dir, truth):
+    # process_pdf_file exactly as a pool worker runs it (no cache, dumps go to the corpus folder)
+    mainextractor.CACHE_ENABLED = False
+    report = metrics.MetricsReport()
+    scores = []
+    cwd = os.getcwd()
+    os.chdir(corpus_dir)
+    try:
+        start = perf_counter()
+        for item in truth:
+            with quiet():
+                _, fields = mainextractor.process_pdf_file(item["file"])
+            fields = fields or {}
+            report.add(fields.get("Metrics"))
+            scores.append(score_fields(item["expected"], fields))
+        elapsed = perf_counter() - start
+    finally:
+        os.chdir(cwd)
+    pages = sum(t["pages"] for t in truth)
+    stages = {stage: round(sum(s for s, _ in samples), 4) for stage, samples in report.samples.items()}
+    return {
+        "pages_per_sec": round(pages / elapsed, 2) if elapsed else None,
+        "docs_per_sec": round(len(truth) / elapsed, 2) if elapsed else None,
+        "accuracy": accuracy(scores),
+        "accuracy_by_kind": by_kind(truth, scores),
+        "field_accuracy": {field: accuracy([{field: s[field]} for s in scores]) for field in truth[0]["expected"]},
+        "stage_seconds": stages,
+    }
+
+# --- baseline comparison ---
+def split_timings(results):
+    # (everything but the timings, just the timings) with the same nesting
+    fixed, timings = {}, {}
+    for key, value in results.items():
+        if key in TIMING_KEYS:
+            timings[key] = value
+        elif isinstance(value, dict):
+            fixed[key], nested = split_timings(value)
+            if nested:
+                timings[key] = nested
+        else:
+            fixed[key] = value
+    return fixed, timings
+
+def load(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def save(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+        f.write("\n")
+
+def compare(current, baseline, tolerance, path=""):
+    # Yields a message for every metric that got worse than the baseline allows
+    for key, old in baseline.items():
+        new = current.get(key) if isinstance(current, dict) else None
+        name = f"{path}.{key}" if path else key
+        if isinstance(old, dict):
+            yield from compare(new or {}, old, tolerance, name)
+        elif old is None or new is None or isinstance(old, (str, bool)):
+            continue
+        elif "accuracy" in key or "accuracy" in path.rsplit(".", 1)[-1]:
+            if new < old - 0.01:
+                yield f"{name}: accuracy {old} -> {new}"
+        elif key.endswith("per_sec") and new < old * (1 - tolerance):
+            yield f"{name}: {old} -> {new} (slower)"
+        elif key.startswith("ms_per") and new > old * (1 + tolerance):
+            yield f"{name}: {old} -> {new} ms (slower)"
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthetic-corpus benchmark suite")
+    parser.add_argument("--docs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--corpus", default=os.path.join(BENCH_DIR, "corpus"))
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="accuracy baseline (committed)")
+    parser.add_argument("--timings", default=DEFAULT_TIMINGS, help="timing baseline (this machine only)")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown (0.2 = 20%%)")
+    parser.add_argument("--skip-e2e", action="store_true")
+    parser.add_argument("--json", help="also write this run's results here")
+    args = parser.parse_args()
+
+    with quiet():
+        truth = generate_corpus(args.corpus, args.docs, args.seed)
+    print(f"📄 {len(truth)} synthetic PDF(s), {sum(t['pages'] for t in truth)} page(s), seed {args.seed}")
+
+    results = {"corpus": {"docs": args.docs, "seed": args.seed}, "tesseract": tesseract_available()}
+    results["extractors"] = bench_extractors(args.corpus, truth)
+    for name, r in results["extractors"].items():
+        print(f"🧪 extractor {name:<11} {r['pages_per_sec']} pages/s, accuracy {r['accuracy']} {r['accuracy_by_kind']}")
+
+    results["searchers"] = bench_searchers(truth)
+    for name, r in results["searchers"].items():
+        print(f"🔎 searcher {name:<26} {r['ms_per_doc']:.3f} ms/doc, accuracy {r['accuracy']}")
+
+    if not args.skip_e2e:
+        results["end_to_end"] = bench_end_to_end(args.corpus, truth)
+        r = results["end_to_end"]
+        print(f"🚀 end to end: {r['pages_per_sec']} pages/s, {r['docs_per_sec']} docs/s, "
+              f"accuracy {r['accuracy']} {r['accuracy_by_kind']}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1)
+
+    fixed, timings = split_timings(results)
+    if args.save_baseline:
+        save(args.baseline, fixed)
+        save(args.timings, {"corpus": results["corpus"], **timings})
+        print(f"💾 Saved baseline: {args.baseline} (accuracy) and {args.timings} (timings)")
+        return
+
+    baseline = load(args.baseline)
+    if baseline is None:
+        print("ℹ️ No baseline yet; run with --save-baseline to store one")
+        return
+    if baseline.get("corpus") != results["corpus"]:
+        print(f"⚠️ Baseline was made with {baseline.get('corpus')}; comparing anyway")
+    if baseline.get("tesseract") and not results["tesseract"]:
+        # Scanned PDFs can't be read without it, which isn't a regression
+        print("⚠️ Baseline was made with Tesseract, which isn't installed here; skipping end-to-end accuracy")
+        baseline.pop("end_to_end", None)
+    regressions = list(compare(results, baseline, args.tolerance))
+    saved_timings = load(args.timings)
+    if saved_timings is None:
+        print(f"ℹ️ No timings for this machine yet ({args.timings}); run with --save-baseline to compare speed")
+    else:
+        regressions += compare(results, saved_timings, args.tolerance)
+    for message in regressions:
+        print(f"❌ {message}")
+    print(f"{'❌' if regressions else '✅'} {len(regressions)} regression(s) against {args.baseline}")
+    sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
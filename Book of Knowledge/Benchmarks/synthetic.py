@@ -0,0 +1,151 @@
+# Deterministic synthetic meeting-note PDFs with known field values, built with
+# PyMuPDF. Same seed -> same text, same layout, same expected fields.
+#
+# Page kinds:
+#   digital   normal text layer
+#   scanned   every page is a grayscale image only (needs OCR)
+#   rotated   lines drawn at 90 degrees
+#   mirrored  lines drawn through a mirror matrix (text layers come out scrambled
+#             in some extractors, e.g. pdfplumber)
+#   reversed  characters stored back to front, like the title blocks flip.py fixes
+import json
+import os
+import random
+
+import fitz
+
+KINDS = ["digital", "scanned", "rotated", "mirrored", "reversed"]
+
+FILLER = [
+    "ATTENDEES: OWNER, ARCHITECT, STRUCTURAL ENGINEER, GENERAL CONTRACTOR",
+    "THE CONTRACTOR SHALL VERIFY ALL DIMENSIONS AND CONDITIONS AT THE SITE.",
+    "FOUNDATION LAYOUT WAS REVIEWED WITH THE GEOTECHNICAL REPORT.",
+    "ARCHITECT TO CONFIRM ROOF DRAIN LOCATIONS BEFORE THE NEXT MEETING.",
+    "SHOP DRAWINGS SHALL BE SUBMITTED FOR REVIEW PRIOR TO FABRICATION.",
+    "NEXT MEETING: TUESDAY 10:00 AM IN THE SITE TRAILER.",
+    "MECHANICAL UNITS ON THE ROOF NEED CURB DETAILS FROM THE SUPPLIER.",
+    "DO NOT SCALE DRAWINGS. REPORT ANY DISCREPANCIES TO THE ENGINEER.",
+]
+
+MATERIALS = ["STRUCTURAL STEEL", "CONCRETE MASONRY", "STEEL ROOF DECK", "DRILLED PIERS", "GLULAM",
+             "CAST-IN-PLACE CONCRETE", "PLYWOOD", "REBAR", "COLD-FORMED STEEL STRUCTURAL FRAMING"]
+
+SYSTEMS = ["SPECIAL REINFORCED MASONRY SHEAR WALLS", "SPECIAL STEEL MOMENT FRAMES",
+           "STEEL SYSTEMS NOT SPECIFICALLY DETAILED FOR SEISMIC RESISTANCE",
+           "BUCKLING-RESTRAINED BRACED FRAMES", "WOOD SHEAR WALLS"]
+
+def random_fields(rng):
+    ibc = rng.choice([2015, 2018, 2021])
+    asce = rng.choice(["10", "16", "22"])
+    aci = rng.choice(["14", "19"])
+    job = f"{rng.randint(10, 25)}.{rng.randint(0, 99):02d}.{rng.randint(0, 999):03d}.{rng.randint(0, 99):02d}"
+    return {
+        "Job_Number": job,
+        "Design_Codes": [f"{ibc} IBC", f"ASCE7-{asce}", f"ACI318-{aci}"],
+        "Risk_Category": rng.choice(["I", "II", "III", "IV"]),
+        "Site_Class": rng.choice("ABCDEF"),
+        "Seismic_Design_Category": rng.choice("ABCDEF"),
+        "Wind_Speed": f"{rng.randrange(90, 185, 5)} mph",
+        "Materials": rng.sample(MATERIALS, 3),
+        "Seismic_Resistance_System": [rng.choice(SYSTEMS)],
+        "_source": {"ibc": ibc, "asce": asce, "aci": aci},
+    }
+
+def field_lines(fields):
+    src = fields["_source"]
+    return [
+        f"PROJECT NUMBER: {fields['Job_Number']}",
+        "DESIGN CRITERIA",
+        f"1. BUILDING CODE: {src['ibc']} INTERNATIONAL BUILDING CODE, ASCE 7-{src['asce']}, ACI 318-{src['aci']}",
+        f"2. RISK CATEGORY: {fields['Risk_Category']}",
+        f"3. SITE CLASS = {fields['Site_Class']}",
+        f"4. SEISMIC DESIGN CATEGORY: {fields['Seismic_Design_Category']}",
+        f"5. ULTIMATE WIND SPEED (VULT) = {fields['Wind_Speed'].split()[0]} MPH",
+        f"6. SEISMIC FORCE RESISTING SYSTEM: {fields['Seismic_Resistance_System'][0]}",
+        "MATERIALS: " + ", ".join(fields["Materials"]),
+    ]
+
+def page_texts(rng, fields, page_count):
+    # Field lines are spread over the pages, meeting filler around them
+    lines = field_lines(fields)
+    pages = [["MEETING NOTES - PAGE %d OF %d" % (n + 1, page_count)] for n in range(page_count)]
+    pages[0].append(lines[0])
+    for line in lines[1:]:
+        pages[rng.randrange(page_count)].append(line)
+    for page in pages:
+        for _ in range(rng.randint(3, 6)):
+            page.insert(rng.randint(1, len(page)), rng.choice(FILLER))
+    return ["\n".join(page) for page in pages]
+
+def _draw_lines(page, text, kind):
+    x, y = 54, 72
+    for line in text.splitlines():
+        if kind == "rotated":
+            # One column per line, reading bottom to top
+            page.insert_text((x, page.rect.height - 54), line, fontsize=8, rotate=90)
+            x += 14
+            continue
+        if kind == "mirrored":
+            point = fitz.Point(x + 480, y)
+            page.insert_text(point, line, fontsize=8, morph=(point, fitz.Matrix(-1, 0, 0, 1, 0, 0)))
+        elif kind == "reversed":
+            page.insert_text((x, y), line[::-1], fontsize=8)
+        else:
+            page.insert_text((x, y), line, fontsize=8)
+        y += 14
+
+def build_pdf(path, texts, kind, dpi=150):
+    doc = fitz.open()
+    for text in texts:
+        page = doc.new_page(width=612, height=792)
+        _draw_lines(page, text, "digital" if kind == "scanned" else kind)
+        if kind == "scanned":
+            # Replace the page with a picture of itself: no text layer left
+            pix = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY)
+            page = doc.new_page(-1, width=612, height=792)
+            page.insert_image(page.rect, pixmap=pix)
+            doc.delete_page(doc.page_count - 2)
+    # Fixed metadata so the same seed gives byte-identical files
+    doc.set_metadata({"creationDate": "D:20240101000000", "modDate": "D:20240101000000",
+                      "producer": "synthetic", "creator": "synthetic"})
+    doc.save(path, garbage=3, deflate=True, no_new_id=True)
+    doc.close()
+
+def generate_corpus(out_dir, docs=20, seed=7):
+    # Writes the PDFs plus truth.json and returns the truth list
+    os.makedirs(out_dir, exist_ok=True)
+    rng = random.Random(seed)
+    truth = []
+    for index in range(docs):
+        kind = KINDS[index % len(KINDS)]
+        page_count = rng.randint(1, 5)
+        fields = random_fields(rng)
+        texts = page_texts(rng, fields, page_count)
+        name = f"synthetic_{index:03d}_{kind}.pdf"
+        build_pdf(os.path.join(out_dir, name), texts, kind)
+        expected = {k: v for k, v in fields.items() if not k.startswith("_")}
+        truth.append({"file": name, "kind": kind, "pages": page_count, "text": "\n".join(texts),
+                      "expected": expected})
+    with open(os.path.join(out_dir, "truth.json"), "w", encoding="utf-8") as f:
+        json.dump(truth, f, indent=1)
+    return truth
+
+# --- scoring ---
+def _as_list(value):
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [p.strip() for p in value.split(",") if p.strip()]
+    return [str(v).strip() for v in value]
+
+def field_correct(field, expected, actual):
+    if field == "Job_Number":
+        return expected in _as_list(actual)
+    if field in ("Design_Codes", "Materials", "Seismic_Resistance_System"):
+        found = {v.upper() for v in _as_list(actual)}
+        return all(v.upper() in found for v in expected)
+    return (actual or "") == expected
+
+def score_fields(expected, actual):
+    # field -> True/False
+    return {field: field_correct(field, value, (actual or {}).get(field)) for field, value in expected.items()}
@@ -0,0 +1,105 @@
+# Time budgets: some made-up PDFs make PyMuPDF stall (sleep) for --stall seconds,
+# like a malformed file that leaves an extractor spinning. A plain
+# multiprocessing.Pool waits for them; the supervised pool (mainextractor.make_pool)
+# kills the stalled worker once PyMuPDF is past --budget seconds and reruns the PDF
+# from pdfplumber on. Prints the latency per PDF (from submission to result).
+#
+#   python Benchmarks/watchdog.py --docs 24 --stalled 2 --stall 20 --budget 2
+import argparse
+import contextlib
+import io
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+from time import perf_counter, sleep
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import mainextractor  # noqa: E402
+from Datahandler.metrics import MetricsReport  # noqa: E402
+from Datahandler.workerpool import SupervisedPool  # noqa: E402
+
+def stalling_init(stall):
+    # Worker side: quiet output, no cache, and PyMuPDF stalls on "stalled_" PDFs
+    sys.stdout = open(os.devnull, "w")
+    mainextractor.CACHE_ENABLED = False
+    mainextractor.init_worker()
+    extract = mainextractor.TextExtractor.extract_with_pymupdf
+
+    def stalling(document, *args, **kwargs):
+        if document.name.startswith("stalled_"):
+            sleep(stall)
+        return extract(document, *args, **kwargs)
+
+    mainextractor.TextExtractor.extract_with_pymupdf = staticmethod(stalling)
+
+def make_pdfs(folder, docs, stalled, seed=7):
+    from synthetic import build_pdf, page_texts, random_fields
+    rng = random.Random(seed)
+    stalled_at = set(range(0, docs, max(1, docs // max(1, stalled)))[:stalled])
+    paths = []
+    for n in range(docs):
+        path = os.path.join(folder, f"{'stalled' if n in stalled_at else 'normal'}_{n:03d}.pdf")
+        build_pdf(path, page_texts(rng, random_fields(rng), 2), "digital")
+        paths.append(path)
+    return paths
+
+def latencies_plain(paths, workers, stall):
+    context = mainextractor.get_pool_context()
+    start = perf_counter()
+    out = []
+    with context.Pool(processes=workers, initializer=stalling_init, initargs=(stall,)) as pool:
+        for filename, fields in pool.imap_unordered(mainextractor.process_pdf_file, paths):
+            out.append((filename, perf_counter() - start, fields))
+    return out
+
+def latencies_supervised(paths, workers, stall, budget):
+    mainextractor.DOCUMENT_TIMEOUT = budget * 4
+    start = perf_counter()
+    out = []
+    with SupervisedPool(workers, stalling_init, (stall,), context=mainextractor.get_pool_context(),
+                        stage_timeouts={"pymupdf": budget}) as pool:
+        for filename, fields in mainextractor.run_unscheduled(pool, paths):
+            out.append((filename, perf_counter() - start, fields))
+        killed = pool.killed
+    return out, killed
+
+def report(label, results):
+    times = [seconds for _, seconds, _ in results]
+    failed = sum(1 for _, _, fields in results if not fields)
+    stages = {}
+    for _, _, fields in results:
+        if fields:
+            stages[fields["Extraction_Stage"]] = stages.get(fields["Extraction_Stage"], 0) + 1
+    p = MetricsReport.percentile
+    print(f"   {label:<22} p50 {p(times, 50):6.2f}s  p95 {p(times, 95):6.2f}s  max {max(times):6.2f}s  "
+          f"failed {failed}  stages {stages}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Time budget / watchdog benchmark")
+    parser.add_argument("--docs", type=int, default=24)
+    parser.add_argument("--stalled", type=int, default=2)
+    parser.add_argument("--stall", type=float, default=20.0, help="seconds PyMuPDF stalls on those PDFs")
+    parser.add_argument("--budget", type=float, default=2.0, help="PyMuPDF time budget")
+    parser.add_argument("--workers", type=int, default=max(2, min(4, multiprocessing.cpu_count())))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        with contextlib.redirect_stdout(io.StringIO()):
+            paths = make_pdfs(tmp, args.docs, args.stalled)
+        print(f"⚙️ {args.docs} PDF(s), {args.stalled} stalling {args.stall:g}s in PyMuPDF, "
+              f"{args.workers} worker(s), PyMuPDF budget {args.budget:g}s")
+        report("multiprocessing.Pool", latencies_plain(paths, args.workers, args.stall))
+        with contextlib.redirect_stdout(io.StringIO()) as log:
+            results, killed = latencies_supervised(paths, args.workers, args.stall, args.budget)
+        report("SupervisedPool", results)
+        print(f"   ⏰ {killed} worker(s) killed; "
+              f"{sum(1 for line in log.getvalue().splitlines() if 'trying it again' in line)} PDF(s) rerun")
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+from Datahandler.schema import FieldSchema
 import csv
 import os
 
@@ -5,7 +6,7 @@ class CSVHandler:
     headers = [
         "Source_File", "Job_Number", "Design_Codes", "Materials", "Seismic_Resistance_System",
         "Risk_Category", "Seismic_Design_Category",
-        "Site_Class", "Wind_Speed", "All_Data"
+        "Site_Class", "Wind_Speed", "Extraction_Stage", "All_Data"
     ]
 
     @staticmethod
@@ -53,6 +54,43 @@ class CSVHandler:
         elif general_notes_folder:
             print(f"📁 General Notes folder '{general_notes_folder}' does not exist. Skipping.")
 
+    @staticmethod
+    def _build_row(data_dict, source_file):
+        # Keys as search_engineering_fields returns them; lists are comma-joined
+        record = FieldSchema.record(data_dict, source_file)
+        row = {"Source_File": source_file}
+        for name in CSVHandler.headers[1:-1]:
+            value = record.get(name)
+            if isinstance(value, list):
+                value = ", ".join(value)
+            row[name] = value or "Null"
+        row["All_Data"] = record["Dump_Path"] or "See txt files in results folder"
+        return row
+
+    @staticmethod
+    def migrate_header(csv_file):
+        # A CSV written with other columns (e.g. before Extraction_Stage was added)
+        # is rewritten with the current ones, matching old columns by name, so new
+        # rows are never appended under the wrong header
+        if not os.path.isfile(csv_file) or os.path.getsize(csv_file) == 0:
+            return
+        with open(csv_file, newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            if reader.fieldnames == CSVHandler.headers:
+                return
+            old_headers = reader.fieldnames
+            rows = list(reader)
+
+        tmp_file = csv_file + ".tmp"
+        with open(tmp_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=CSVHandler.headers, restval="Null", extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(rows)
+        os.replace(tmp_file, csv_file)
+        added = [name for name in CSVHandler.headers if name not in (old_headers or [])]
+        print(f"🔧 Updated the columns of {csv_file} ({len(rows)} row(s) kept"
+              f"{', added ' + ', '.join(added) if added else ''})")
+
     @staticmethod
     def write_to_csv(data_dict, csv_file, source_file):
         # Ensure the parent directory for the CSV exists
@@ -60,22 +98,90 @@ class CSVHandler:
         if csv_dir:  # only mkdir if a directory is actually present in the path
             os.makedirs(csv_dir, exist_ok=True)
 
-        complete_data = {
-            "Source_File": source_file,
-            "Job_Number": data_dict.get("job_number") or "Null",
-            "Design_Codes": data_dict.get("design_code") or "Null",
-            "Materials": data_dict.get("materials") or "Null",
-            "Seismic_Resistance_System": data_dict.get("seismic_resistance_system") or "Null",
-            "Risk_Category": data_dict.get("risk_category") or "Null",
-            "Seismic_Design_Category": data_dict.get("seismic_design_category") or "Null",
-            "Site_Class": data_dict.get("site_class") or "Null",
-            "Wind_Speed": data_dict.get("wind_speed") or "Null",
-            "All_Data": "See txt files in results folder"
-        }
+        complete_data = CSVHandler._build_row(data_dict, source_file)
 
+        CSVHandler.migrate_header(csv_file)
         file_exists = os.path.isfile(csv_file)
         with open(csv_file, mode='a', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=CSVHandler.headers)
             if not file_exists:
                 writer.writeheader()
-            writer.writerow(complete_data)
\ No newline at end of file
+            writer.writerow(complete_data)
+
+    @staticmethod
+    def sync_rows(csv_file, updated, removed_sources=()):
+        # Incremental update: `updated` maps Source_File -> data dict. Existing rows
+        # for those files are replaced in place, rows for removed files are dropped
+        # and anything new is appended. The file is rewritten atomically.
+        csv_dir = os.path.dirname(csv_file)
+        if csv_dir:
+            os.makedirs(csv_dir, exist_ok=True)
+
+        rows = []
+        if os.path.isfile(csv_file):
+            with open(csv_file, newline='', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+
+        removed = set(removed_sources)
+        pending = dict(updated)
+        kept = []
+        for row in rows:
+            source = row.get("Source_File")
+            if source in removed:
+                continue
+            if source in pending:
+                row = CSVHandler._build_row(pending.pop(source), source)
+            kept.append(row)
+        for source, data_dict in pending.items():
+            kept.append(CSVHandler._build_row(data_dict, source))
+
+        tmp_file = csv_file + ".tmp"
+        with open(tmp_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=CSVHandler.headers, restval="Null", extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(kept)
+        os.replace(tmp_file, csv_file)
+
+class CSVBatchWriter:
+    # One CSV file handle for the whole run. Rows are buffered and written every
+    # batch_size rows (and on close), so a run that dies halfway still leaves
+    # every finished batch on disk without reopening the file for each row.
+    def __init__(self, csv_file, batch_size=20):
+        self.csv_file = csv_file
+        self.batch_size = max(1, batch_size)
+        self.rows = []
+        self.written = 0
+
+        csv_dir = os.path.dirname(csv_file)
+        if csv_dir:
+            os.makedirs(csv_dir, exist_ok=True)
+
+        CSVHandler.migrate_header(csv_file)
+        new_file = not os.path.isfile(csv_file) or os.path.getsize(csv_file) == 0
+        self.file = open(csv_file, mode='a', newline='', encoding='utf-8')
+        self.writer = csv.DictWriter(self.file, fieldnames=CSVHandler.headers)
+        if new_file:
+            self.writer.writeheader()
+
+    def write(self, data_dict, source_file):
+        self.rows.append(CSVHandler._build_row(data_dict, source_file))
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.rows:
+            self.writer.writerows(self.rows)
+            self.written += len(self.rows)
+            self.rows = []
+        self.file.flush()
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
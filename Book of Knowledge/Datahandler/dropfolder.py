@@ -0,0 +1,80 @@
+from time import time
+import os
+
+class DropFolder:
+    # Tracks the PDFs in one folder and hands each new or changed file out once it
+    # has finished being written: the same size and modified time for
+    # settle_seconds, openable, and ending in %%EOF (a PDF that never gets one is
+    # handed out after max_wait seconds anyway).
+    def __init__(self, folder, settle_seconds=2.0, max_wait=120.0, seen=None):
+        self.folder = folder
+        self.settle_seconds = settle_seconds
+        self.max_wait = max_wait
+        self.seen = dict(seen or {})  # path -> (size, mtime) already handed out
+        self.pending = {}             # path -> [(size, mtime), first seen, last change]
+
+    def poll(self):
+        # One directory listing (stat only, nothing is read): new/changed PDFs go
+        # pending, and the paths that disappeared since the last listing are returned
+        current = set()
+        with os.scandir(self.folder) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.lower().endswith(".pdf"):
+                    current.add(entry.path)
+                    self.touch(entry.path, entry.stat())
+        deleted = [path for path in self.seen if path not in current]
+        for path in deleted:
+            del self.seen[path]
+        for path in [path for path in self.pending if path not in current]:
+            del self.pending[path]
+        return deleted
+
+    def touch(self, path, stat=None):
+        # A file may have been created or changed (file system events land here too)
+        try:
+            stat = stat or os.stat(path)
+        except OSError:
+            self.pending.pop(path, None)
+            return
+        signature = (stat.st_size, stat.st_mtime)
+        if self.seen.get(path) == signature:
+            return
+        now = time()
+        entry = self.pending.get(path)
+        if entry is None:
+            self.pending[path] = [signature, now, now]
+        elif entry[0] != signature:
+            entry[0], entry[2] = signature, now
+
+    def ready(self):
+        # Pending files that have stopped changing, oldest first
+        now = time()
+        out = []
+        for path, (signature, first_seen, changed) in sorted(self.pending.items(), key=lambda item: item[1][1]):
+            if now - changed < self.settle_seconds:
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                del self.pending[path]
+                continue
+            if (stat.st_size, stat.st_mtime) != signature:
+                self.touch(path, stat)
+                continue
+            if not self.complete(path) and now - first_seen < self.max_wait:
+                continue
+            del self.pending[path]
+            self.seen[path] = signature
+            out.append(path)
+        return out
+
+    @staticmethod
+    def complete(path):
+        # Windows keeps a file locked while it is copied in; a finished PDF ends in %%EOF
+        try:
+            with open(path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - 1024))
+                return b"%%EOF" in f.read()
+        except OSError:
+            return False
@@ -0,0 +1,105 @@
+import hashlib
+import json
+import os
+
+class ExtractionCache:
+    # Bump when the cache file layout changes
+    FORMAT_VERSION = 1
+
+    def __init__(self, cache_dir="Cache", max_mb=500):
+        self.cache_dir = cache_dir
+        self.max_bytes = int(max_mb * 1024 * 1024) if max_mb else None
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    # --- keys ---
+    def key(self, document, settings):
+        # PDF content + every setting that changes the extracted text
+        h = hashlib.sha256(document.data)
+        h.update(json.dumps({"format": self.FORMAT_VERSION, **settings}, sort_keys=True).encode("utf-8"))
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    # --- lookups ---
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        # Touch on hit so eviction drops the least recently used entries first
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        self.hits += 1
+        return entry
+
+    def has(self, key):
+        # Existence check only; doesn't count as a hit or touch the entry
+        return os.path.exists(self._path(key))
+
+    def put(self, key, entry):
+        # Write to a temp file first so a crashed worker never leaves half an entry
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+
+    # --- maintenance ---
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self):
+        # Drop least recently used entries until the cache fits in max_bytes
+        if not self.max_bytes:
+            return 0
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def invalidate(self, extractor=None):
+        # No extractor: clear everything. Otherwise drop only the entries that hold
+        # text from that extractor (e.g. after changing the OCR preprocessing).
+        # Searchers always re-run on cached text, so searcher changes never need this.
+        removed = 0
+        for _, _, path in self._entries():
+            if extractor is not None:
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        if extractor not in json.load(f).get("pages", {}):
+                            continue
+                except (OSError, ValueError):
+                    pass
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
@@ -0,0 +1,69 @@
+import hashlib
+import json
+import os
+
+class FolderManifest:
+    def __init__(self, manifest_path):
+        self.manifest_path = manifest_path
+        self.entries = {}  # pdf path -> {"size", "mtime", "hash"}
+        self._hashes = {}  # hashes computed by diff(), reused by record()
+        if os.path.exists(manifest_path):
+            try:
+                with open(manifest_path, "r", encoding="utf-8") as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Could not read manifest '{manifest_path}', starting fresh: {e}")
+                self.entries = {}
+
+    @staticmethod
+    def file_hash(path, chunk_size=1024 * 1024):
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def diff(self, pdf_files):
+        # Returns (changed, deleted): new/modified paths to process and
+        # paths that were in the manifest but are gone from the folder
+        changed = []
+        current = set(pdf_files)
+        for path in pdf_files:
+            stat = os.stat(path)
+            old = self.entries.get(path)
+            # Same size + mtime: trust it without reading the file
+            if old and old["size"] == stat.st_size and old["mtime"] == stat.st_mtime:
+                continue
+            digest = self.file_hash(path)
+            self._hashes[path] = digest
+            if old and old["hash"] == digest:
+                # Touched but not modified; just remember the new mtime
+                old["mtime"] = stat.st_mtime
+                continue
+            changed.append(path)
+        deleted = [path for path in self.entries if path not in current]
+        return changed, deleted
+
+    def record(self, path):
+        stat = os.stat(path)
+        digest = self._hashes.pop(path, None) or self.file_hash(path)
+        self.entries[path] = {"size": stat.st_size, "mtime": stat.st_mtime, "hash": digest}
+
+    def in_folder(self, folder):
+        # Entries for files directly in `folder`; the manifest can be shared with
+        # runs over other folders, whose files must not look deleted from this one
+        folder = os.path.normcase(os.path.abspath(folder))
+        return {path: entry for path, entry in self.entries.items()
+                if os.path.normcase(os.path.dirname(os.path.abspath(path))) == folder}
+
+    def forget(self, path):
+        self.entries.pop(path, None)
+
+    def save(self):
+        out_dir = os.path.dirname(self.manifest_path)
+        if out_dir:
+            os.makedirs(out_dir, exist_ok=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=1)
+        os.replace(tmp_path, self.manifest_path)
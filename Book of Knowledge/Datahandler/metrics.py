@@ -0,0 +1,122 @@
+from contextlib import contextmanager
+from time import perf_counter
+import json
+import os
+
+class DocumentMetrics:
+    # Seconds spent per stage (summed when a stage runs more than once, e.g. one
+    # "ocr.tesseract" entry per page) plus plain facts about the document
+    def __init__(self, name=None):
+        self.name = name
+        self.stages = {}
+        self.info = {}
+
+    def add(self, stage, seconds):
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def merge(self, stages):
+        for stage, seconds in (stages or {}).items():
+            self.add(stage, seconds)
+
+    @contextmanager
+    def timed(self, stage):
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, perf_counter() - start)
+
+    def set(self, **info):
+        self.info.update(info)
+
+    def to_dict(self):
+        return {"file": self.name, **self.info,
+                "stages": {stage: round(seconds, 4) for stage, seconds in self.stages.items()}}
+
+# Each process works on one document at a time, so the extractors and searchers
+# record into whichever document was started last in this process
+_current = DocumentMetrics()
+
+def begin(name):
+    global _current
+    _current = DocumentMetrics(name)
+    return _current
+
+def current():
+    return _current
+
+def timed(stage):
+    return _current.timed(stage)
+
+def merge_info(target, info):
+    # Facts from OCR page tasks into a document's: dicts (e.g. ocr_confidence)
+    # are combined, counts (e.g. ocr_escalated) are added up
+    for key, value in (info or {}).items():
+        if isinstance(value, dict):
+            target.setdefault(key, {}).update(value)
+        else:
+            target[key] = target.get(key, 0) + value
+
+class MetricsReport:
+    # Parent-process side: one JSON line per document, then p50/p95 per stage
+    def __init__(self, out_path=None):
+        self.out_path = out_path
+        self.samples = {}  # stage -> [(seconds, pages of that document)]
+        self.pages = 0
+        self.bytes = 0
+        self.documents = 0
+        self.timeouts = 0  # documents that ran out of time (records with "timeout")
+        self.file = None
+        if out_path:
+            out_dir = os.path.dirname(out_path)
+            if out_dir:
+                os.makedirs(out_dir, exist_ok=True)
+            self.file = open(out_path, "a", encoding="utf-8")
+
+    def add(self, record):
+        if not record:
+            return
+        self.documents += 1
+        if record.get("timeout"):
+            self.timeouts += 1
+        pages = record.get("pages") or 0
+        self.pages += pages
+        self.bytes += record.get("bytes") or 0
+        for stage, seconds in record.get("stages", {}).items():
+            self.samples.setdefault(stage, []).append((seconds, pages))
+        if self.file:
+            self.file.write(json.dumps(record) + "\n")
+            self.file.flush()
+
+    @staticmethod
+    def percentile(values, pct):
+        # Nearest-rank percentile
+        ordered = sorted(values)
+        rank = max(1, -(-len(ordered) * pct // 100))
+        return ordered[int(rank) - 1]
+
+    def summary(self, wall_seconds):
+        print(f"\n📈 Metrics: {self.documents} document(s), {self.pages} page(s), "
+              f"{self.bytes / (1024 * 1024):.1f} MB")
+        if wall_seconds > 0:
+            print(f"   Throughput: {self.pages / wall_seconds:.2f} pages/sec, "
+                  f"{self.documents / wall_seconds:.2f} documents/sec (wall clock)")
+        if self.timeouts:
+            print(f"   Timed out: {self.timeouts} document(s) (their total is the time they were given)")
+        if not self.samples:
+            return
+        print(f"   {'stage':<32}{'docs':>6}{'p50 s':>10}{'p95 s':>10}{'total s':>10}{'pages/s':>10}")
+        # Slowest stages first; pages/s only counts documents that ran the stage
+        for stage, samples in sorted(self.samples.items(), key=lambda item: -sum(s for s, _ in item[1])):
+            values = [seconds for seconds, _ in samples]
+            total = sum(values)
+            rate = f"{sum(pages for _, pages in samples) / total:.1f}" if total > 0 else "-"
+            print(f"   {stage:<32}{len(values):>6}{self.percentile(values, 50):>10.3f}"
+                  f"{self.percentile(values, 95):>10.3f}{total:>10.2f}{rate:>10}")
+        if self.out_path:
+            print(f"   Per-document JSON lines: {self.out_path}")
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
@@ -0,0 +1,161 @@
+from datetime import datetime
+import sqlite3
+import shlex
+import os
+
+class PageIndex:
+    # Page-level full-text index (SQLite FTS5) over every processed PDF: one row per
+    # page with its text, plus one row per document with the file name, job number
+    # and the extractor the pages came from. Documents are buffered and written
+    # batch_size at a time, each batch in one transaction.
+    #
+    # Page rows use rowid = document id * PAGE_SLOTS + page number, so replacing or
+    # removing a document is a rowid range delete instead of a scan of the index.
+    PAGE_SLOTS = 100_000
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS documents (
+            id INTEGER PRIMARY KEY,
+            source_file TEXT UNIQUE NOT NULL,
+            job_number TEXT,
+            extractor TEXT,
+            page_count INTEGER,
+            dump_path TEXT,
+            indexed_at TEXT
+        );
+        CREATE VIRTUAL TABLE IF NOT EXISTS pages USING fts5(
+            text, page UNINDEXED, tokenize = 'unicode61', prefix = '2 3'
+        );
+    """
+
+    def __init__(self, db_path, batch_size=50):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.pending = {}  # source_file -> (pages, extractor, job_number, dump_path)
+        self.removed = set()
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(self.SCHEMA)
+
+    # --- writing ---
+    def add(self, source_file, pages, extractor=None, job_number=None, dump_path=None):
+        if isinstance(job_number, (list, tuple, set)):
+            job_number = ", ".join(str(j) for j in job_number)
+        self.removed.discard(source_file)
+        self.pending[source_file] = (pages, extractor, job_number, dump_path)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def remove(self, source_files):
+        for source_file in source_files:
+            self.pending.pop(source_file, None)
+            self.removed.add(source_file)
+
+    def _delete(self, source_file):
+        row = self.conn.execute("SELECT id FROM documents WHERE source_file = ?", (source_file,)).fetchone()
+        if row:
+            start = row[0] * self.PAGE_SLOTS
+            self.conn.execute("DELETE FROM pages WHERE rowid >= ? AND rowid < ?", (start, start + self.PAGE_SLOTS))
+        return row[0] if row else None
+
+    def flush(self):
+        if not self.pending and not self.removed:
+            return 0
+        indexed_at = datetime.now().isoformat(timespec="seconds")
+        with self.conn:
+            for source_file in self.removed:
+                if self._delete(source_file) is not None:
+                    self.conn.execute("DELETE FROM documents WHERE source_file = ?", (source_file,))
+            for source_file, (pages, extractor, job_number, dump_path) in self.pending.items():
+                doc_id = self._delete(source_file)
+                if doc_id is None:
+                    doc_id = self.conn.execute("INSERT INTO documents (source_file) VALUES (?)",
+                                               (source_file,)).lastrowid
+                self.conn.execute(
+                    "UPDATE documents SET job_number = ?, extractor = ?, page_count = ?, dump_path = ?, indexed_at = ? "
+                    "WHERE id = ?", (job_number, extractor, len(pages), dump_path, indexed_at, doc_id))
+                base = doc_id * self.PAGE_SLOTS
+                self.conn.executemany(
+                    "INSERT INTO pages (rowid, text, page) VALUES (?, ?, ?)",
+                    [(base + number, text, number) for number, text in enumerate(pages[:self.PAGE_SLOTS - 1], start=1)
+                     if text and text.strip()])
+        written = len(self.pending)
+        self.pending, self.removed = {}, set()
+        return written
+
+    def optimize(self):
+        # Merges the index's internal segments; worth it after a big batch run
+        with self.conn:
+            self.conn.execute("INSERT INTO pages (pages) VALUES ('optimize')")
+
+    def close(self, optimize=False):
+        if self.conn is None:
+            return
+        self.flush()
+        if optimize:
+            self.optimize()
+        self.conn.close()
+        self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # --- querying ---
+    @staticmethod
+    def to_query(text):
+        # Plain search text -> FTS5 query. "quoted words" stay a phrase, word* is a
+        # prefix search, AND / OR / NOT (upper case) pass through, every other word
+        # is quoted so punctuation like "ASCE 7-16" or "22.00.062" can't break the query.
+        terms = []
+        try:
+            tokens = shlex.split(text, posix=False)
+        except ValueError:
+            tokens = text.split()  # unbalanced quote, e.g. ARCHITECT'S
+        for token in tokens:
+            if token in ("AND", "OR", "NOT"):
+                terms.append(token)
+                continue
+            prefix = token.endswith("*")
+            word = token.rstrip("*").strip('"').replace('"', '""')
+            if word:
+                terms.append(f'"{word}"' + ("*" if prefix else ""))
+        return " ".join(terms)
+
+    def search(self, text, source_file=None, job_number=None, extractor=None, limit=20, raw=False):
+        # Best matching pages first (BM25), each with a snippet around the hits.
+        # source_file and job_number match anywhere in the name / number.
+        self.flush()
+        query = text if raw else self.to_query(text)
+        sql = [
+            "SELECT d.source_file, pages.page, d.job_number, d.extractor, bm25(pages) AS score,",
+            "       snippet(pages, 0, '[', ']', ' ... ', 16)",
+            "FROM pages JOIN documents d ON d.id = pages.rowid / ?",
+            "WHERE pages MATCH ?",
+        ]
+        params = [self.PAGE_SLOTS, query]
+        if source_file:
+            sql.append("AND d.source_file LIKE ?")
+            params.append(f"%{source_file}%")
+        if job_number:
+            sql.append("AND d.job_number LIKE ?")
+            params.append(f"%{job_number}%")
+        if extractor:
+            sql.append("AND d.extractor = ?")
+            params.append(extractor)
+        sql.append("ORDER BY score LIMIT ?")
+        params.append(limit)
+        rows = self.conn.execute("\n".join(sql), params).fetchall()
+        return [{"file": r[0], "page": r[1], "job_number": r[2], "extractor": r[3], "score": round(r[4], 3),
+                 "snippet": r[5]} for r in rows]
+
+    def stats(self):
+        documents, pages = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(page_count), 0) FROM documents").fetchone()
+        return {"documents": documents, "pages": pages}
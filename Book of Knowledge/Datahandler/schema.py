@@ -0,0 +1,65 @@
+from Fields.parameters import DesignParameterSearcher
+
+class FieldSchema:
+    # What each extracted field is, for every output (CSV, SQLite, Parquet).
+    # Multi-valued fields come back from the searchers as lists or comma-joined
+    # strings; here they always become lists, and each has its own child table.
+    MULTI = {
+        "Job_Number": "job_numbers",
+        "Design_Codes": "design_codes",
+        "Materials": "materials",
+        "Seismic_Resistance_System": "seismic_systems",
+    }
+    TEXT = ["Risk_Category", "Site_Class", "Seismic_Design_Category", "Wind_Speed", "Extraction_Stage", "Dump_Path"]
+    NUMBER = ["Quality_Score", "Processing_Time"]
+    # Design_Parameters (a dict) is spread over one numeric column per parameter
+    PARAMETERS = DesignParameterSearcher.NAMES
+
+    @staticmethod
+    def values(value):
+        # Any multi-valued field -> list of distinct non-empty strings, in order
+        if value is None:
+            return []
+        if isinstance(value, str):
+            items = value.split(",")
+        elif isinstance(value, (list, tuple, set)):
+            items = value
+        else:
+            items = [value]
+        out = []
+        for item in items:
+            item = str(item).strip()
+            if item and item not in out:
+                out.append(item)
+        return out
+
+    @staticmethod
+    def text(value):
+        if value is None:
+            return None
+        if isinstance(value, (list, tuple, set)):
+            value = ", ".join(str(v) for v in value)
+        value = str(value).strip()
+        return value or None
+
+    @staticmethod
+    def number(value):
+        try:
+            return float(value) if value is not None else None
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def record(fields, source_file):
+        # One flat, typed record per PDF (lists for the multi-valued fields)
+        record = {"Source_File": source_file, "Source_Hash": fields.get("Source_Hash")}
+        for name in FieldSchema.MULTI:
+            record[name] = FieldSchema.values(fields.get(name))
+        for name in FieldSchema.TEXT:
+            record[name] = FieldSchema.text(fields.get(name))
+        for name in FieldSchema.NUMBER:
+            record[name] = FieldSchema.number(fields.get(name))
+        parameters = fields.get("Design_Parameters") or {}
+        for name in FieldSchema.PARAMETERS:
+            record[name] = FieldSchema.number(parameters.get(name))
+        return record
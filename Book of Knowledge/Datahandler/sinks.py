@@ -0,0 +1,313 @@
+from Datahandler.csvwriter import CSVHandler, CSVBatchWriter
+from Datahandler.schema import FieldSchema
+from datetime import datetime
+import sqlite3
+import os
+
+# Every output sink takes finished PDFs with write(fields, source_file), drops
+# deleted ones with remove(source_files) and writes anything buffered on flush()
+# and close(). Pick them with OUTPUT_SINKS in mainextractor.py.
+
+class CSVSink:
+    # The CSV as before: appended in batches, or (sync=True) kept in step with the
+    # folder by rewriting changed rows in place on every flush
+    name = "csv"
+
+    def __init__(self, path, batch_size=20, sync=False):
+        self.path = path
+        self.sync = sync
+        self.updated = {}
+        self.removed = []
+        self.writer = None if sync else CSVBatchWriter(path, batch_size)
+
+    def write(self, fields, source_file):
+        if self.sync:
+            self.updated[source_file] = fields
+            if source_file in self.removed:
+                self.removed.remove(source_file)
+        else:
+            self.writer.write(fields, source_file)
+
+    def remove(self, source_files):
+        if self.sync:
+            for source_file in source_files:
+                self.updated.pop(source_file, None)
+                self.removed.append(source_file)
+        elif source_files:
+            print(f"⚠️ CSV sink: appending CSV can't drop rows for {len(source_files)} removed PDF(s)")
+
+    def flush(self):
+        if not self.sync:
+            self.writer.flush()
+        elif self.updated or self.removed:
+            CSVHandler.sync_rows(self.path, self.updated, self.removed)
+            self.updated, self.removed = {}, []
+
+    def close(self):
+        self.flush()
+        if self.writer:
+            self.writer.close()
+
+class SQLiteSink:
+    # One row per PDF file (upserted on its SHA-256 and file name, so a re-run
+    # updates the same row, and copies of one PDF under other names keep rows of
+    # their own, as in the CSV) with indexed columns, and one child table per
+    # multi-valued field, so "every PDF using GLULAM" is an index lookup:
+    #   SELECT d.* FROM documents d JOIN materials m ON m.document_id = d.id WHERE m.value = 'GLULAM'
+    # Design parameters are indexed REAL columns, so ranges are index range scans:
+    #   SELECT source_file FROM documents WHERE sds BETWEEN 0.5 AND 1.0 AND vult_mph >= 140
+    name = "sqlite"
+
+    COLUMNS = {  # column -> field
+        "job_number": None,  # first job number, for quick lookups
+        "risk_category": "Risk_Category",
+        "site_class": "Site_Class",
+        "seismic_design_category": "Seismic_Design_Category",
+        "wind_speed": "Wind_Speed",
+        "extraction_stage": "Extraction_Stage",
+        "quality_score": "Quality_Score",
+        "processing_time": "Processing_Time",
+        "dump_path": "Dump_Path",
+        **{name.lower(): name for name in FieldSchema.PARAMETERS},  # ss, sds, vult_mph, ...
+    }
+    PARAMETER_COLUMNS = [name.lower() for name in FieldSchema.PARAMETERS]
+    REAL = ["quality_score", "processing_time"] + PARAMETER_COLUMNS
+    INDEXED = ["source_file", "job_number", "risk_category", "site_class", "seismic_design_category"] \
+        + PARAMETER_COLUMNS
+
+    def __init__(self, path, batch_size=20, sync=False):
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.pending = []
+        self.removed = []
+        db_dir = os.path.dirname(path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self._migrate_key()
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self._create()
+
+    def _documents_table(self, name):
+        columns = ",\n".join(f"    {column} {self._type(column)}" for column in self.COLUMNS)
+        return (f"CREATE TABLE IF NOT EXISTS {name} (\n"
+                "    id INTEGER PRIMARY KEY,\n"
+                "    source_hash TEXT NOT NULL,\n"
+                "    source_file TEXT NOT NULL,\n"
+                f"{columns},\n"
+                "    updated_at TEXT,\n"
+                "    UNIQUE (source_hash, source_file)\n"
+                ");")
+
+    def _create(self):
+        script = [self._documents_table("documents")]
+        script += self._new_columns()
+        script += [f"CREATE INDEX IF NOT EXISTS documents_{name} ON documents ({name});" for name in self.INDEXED]
+        for table in FieldSchema.MULTI.values():
+            script.append(
+                f"CREATE TABLE IF NOT EXISTS {table} (\n"
+                "    document_id INTEGER NOT NULL REFERENCES documents (id) ON DELETE CASCADE,\n"
+                "    value TEXT NOT NULL,\n"
+                "    PRIMARY KEY (document_id, value)\n"
+                ") WITHOUT ROWID;")
+            script.append(f"CREATE INDEX IF NOT EXISTS {table}_value ON {table} (value, document_id);")
+        self.conn.executescript("\n".join(script))
+
+    def _migrate_key(self):
+        # Databases from before copies got their own rows have source_hash UNIQUE on
+        # its own. SQLite can't drop that constraint, so the table is rebuilt (with
+        # foreign keys off, so the child tables keep their rows); _create then adds
+        # the indexes back.
+        for index in self.conn.execute("PRAGMA index_list(documents)").fetchall():
+            unique, origin = index[2], index[3]
+            columns = [row[2] for row in self.conn.execute(f"PRAGMA index_info('{index[1]}')")]
+            if unique and origin == "u" and columns == ["source_hash"]:
+                break
+        else:
+            return
+        print(f"🔧 Updating {self.path}: one row per PDF file instead of per PDF content")
+        existing = [row[1] for row in self.conn.execute("PRAGMA table_info(documents)")]
+        self.conn.execute("PRAGMA foreign_keys = OFF")
+        kept = ", ".join(name for name in existing
+                         if name in self.COLUMNS or name in ("id", "source_hash", "source_file", "updated_at"))
+        with self.conn:
+            self.conn.execute(self._documents_table("documents_new"))
+            self.conn.execute(f"INSERT INTO documents_new ({kept}) SELECT {kept} FROM documents")
+            self.conn.execute("DROP TABLE documents")
+            self.conn.execute("ALTER TABLE documents_new RENAME TO documents")
+
+    def _type(self, column):
+        return "REAL" if column in self.REAL else "TEXT"
+
+    def _new_columns(self):
+        # A database from an older version gets the columns added since then
+        existing = {row[1] for row in self.conn.execute("PRAGMA table_info(documents)")}
+        if not existing:
+            return []
+        return [f"ALTER TABLE documents ADD COLUMN {name} {self._type(name)};"
+                for name in self.COLUMNS if name not in existing]
+
+    def write(self, fields, source_file):
+        record = FieldSchema.record(fields, source_file)
+        if not record["Source_Hash"]:
+            print(f"⚠️ SQLite sink: no content hash for {source_file}; skipped")
+            return
+        if source_file in self.removed:
+            self.removed.remove(source_file)
+        self.pending.append(record)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def remove(self, source_files):
+        # Dropping a file also drops a result for it that is still waiting in the batch
+        source_files = set(source_files)
+        self.pending = [record for record in self.pending if record["Source_File"] not in source_files]
+        self.removed.extend(source_files)
+
+    def flush(self):
+        if not self.pending and not self.removed:
+            return
+        updated_at = datetime.now().isoformat(timespec="seconds")
+        names = list(self.COLUMNS)
+        upsert = (f"INSERT INTO documents (source_hash, source_file, {', '.join(names)}, updated_at) "
+                  f"VALUES ({', '.join('?' * (len(names) + 3))}) "
+                  f"ON CONFLICT (source_hash, source_file) DO UPDATE SET "
+                  + ", ".join(f"{name} = excluded.{name}" for name in names)
+                  + ", updated_at = excluded.updated_at")
+        with self.conn:
+            self.conn.executemany("DELETE FROM documents WHERE source_file = ?",
+                                  [(source_file,) for source_file in self.removed])
+            for record in self.pending:
+                # An older version of the same file (different content) is replaced
+                self.conn.execute("DELETE FROM documents WHERE source_file = ? AND source_hash != ?",
+                                  (record["Source_File"], record["Source_Hash"]))
+                values = [record["Job_Number"][0] if record["Job_Number"] else None]
+                values += [record[field] for field in list(self.COLUMNS.values())[1:]]
+                self.conn.execute(upsert, [record["Source_Hash"], record["Source_File"], *values, updated_at])
+                doc_id = self.conn.execute("SELECT id FROM documents WHERE source_hash = ? AND source_file = ?",
+                                           (record["Source_Hash"], record["Source_File"])).fetchone()[0]
+                for field, table in FieldSchema.MULTI.items():
+                    self.conn.execute(f"DELETE FROM {table} WHERE document_id = ?", (doc_id,))
+                    self.conn.executemany(f"INSERT INTO {table} (document_id, value) VALUES (?, ?)",
+                                          [(doc_id, value) for value in record[field]])
+        self.pending, self.removed = [], []
+
+    def find(self, ranges=None, materials=(), design_codes=(), limit=100):
+        # ranges: {column: (low, high)}, None for an open end, e.g. {"sds": (0.5, 1.0),
+        # "vult_mph": (140, None)}; materials / design_codes must all be present.
+        # Returns one dict per PDF with its file, job number and every parameter.
+        self.flush()
+        where, params = [], []
+        for column, (low, high) in (ranges or {}).items():
+            if column not in self.COLUMNS:
+                raise ValueError(f"Unknown column '{column}' (choose from {', '.join(self.COLUMNS)})")
+            if low is not None:
+                where.append(f"d.{column} >= ?")
+                params.append(low)
+            if high is not None:
+                where.append(f"d.{column} <= ?")
+                params.append(high)
+        for table, values in (("materials", materials), ("design_codes", design_codes)):
+            for value in values:
+                where.append(f"EXISTS (SELECT 1 FROM {table} c WHERE c.document_id = d.id AND c.value = ?)")
+                params.append(value.upper())
+        columns = ["source_file", "job_number"] + self.PARAMETER_COLUMNS
+        sql = f"SELECT {', '.join('d.' + c for c in columns)} FROM documents d"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY d.source_file LIMIT ?"
+        rows = self.conn.execute(sql, params + [limit]).fetchall()
+        return [dict(zip(columns, row)) for row in rows]
+
+    def close(self):
+        if self.conn is not None:
+            self.flush()
+            self.conn.close()
+            self.conn = None
+
+class ParquetSink:
+    # Columnar export for analytics (pandas, DuckDB, Power BI): every batch becomes
+    # one part file in the folder, multi-valued fields are list<string> columns.
+    # Parts are append-only: a PDF processed twice appears twice (keep the newest
+    # updated_at per Source_File) and removed PDFs are not taken out.
+    name = "parquet"
+
+    def __init__(self, path, batch_size=500, sync=False):
+        import pyarrow  # optional dependency: pip install pyarrow
+        import pyarrow.parquet
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.pending = []
+        self.parts = 0
+        self.run_stamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
+        os.makedirs(path, exist_ok=True)
+        pa = self.pa
+        self.schema = pa.schema(
+            [("Source_File", pa.string()), ("Source_Hash", pa.string())]
+            + [(name, pa.list_(pa.string())) for name in FieldSchema.MULTI]
+            + [(name, pa.string()) for name in FieldSchema.TEXT]
+            + [(name, pa.float64()) for name in FieldSchema.NUMBER + FieldSchema.PARAMETERS]
+            + [("updated_at", pa.string())])
+
+    def write(self, fields, source_file):
+        record = FieldSchema.record(fields, source_file)
+        record["updated_at"] = datetime.now().isoformat(timespec="seconds")
+        self.pending.append(record)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def remove(self, source_files):
+        pass  # append-only; see above
+
+    def flush(self):
+        if not self.pending:
+            return
+        table = self.pa.Table.from_pylist(self.pending, schema=self.schema)
+        self.parts += 1
+        self.pq.write_table(table, os.path.join(self.path, f"documents_{self.run_stamp}_{self.parts:04d}.parquet"))
+        self.pending = []
+
+    def close(self):
+        self.flush()
+
+SINKS = {
+    CSVSink.name: CSVSink,
+    SQLiteSink.name: SQLiteSink,
+    ParquetSink.name: ParquetSink,
+}
+
+class SinkSet:
+    # Fans every call out to the selected sinks
+    def __init__(self, sinks):
+        self.sinks = sinks
+
+    def write(self, fields, source_file):
+        for sink in self.sinks:
+            sink.write(fields, source_file)
+
+    def remove(self, source_files):
+        for sink in self.sinks:
+            sink.remove(source_files)
+
+    def flush(self):
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+def open_sinks(names, paths, batch_size=20, sync=False):
+    # names: e.g. ["csv", "sqlite"]; paths: sink name -> file or folder
+    sinks = []
+    for name in names:
+        if name not in SINKS:
+            raise ValueError(f"Unknown output sink '{name}' (choose from {', '.join(SINKS)})")
+        try:
+            sinks.append(SINKS[name](paths[name], batch_size, sync))
+        except ImportError:
+            print(f"⚠️ Output sink '{name}' needs an extra package (pip install pyarrow); skipping it")
+    return SinkSet(sinks)
@@ -1,41 +1,46 @@
 # Book of Knowledge/Dumpers/page_dump_writer.py
 from __future__ import annotations
 import os
-from typing import List, Optional
+import re
+from typing import List, Optional, Tuple
+
+from Extractor.document import Document
 
 class PageDumpWriter:
+    PAGE_HEADER = re.compile(r"^={20} PAGE (\d+) ={20}$", re.M)
+
     def write_by_page(
         self,
-        pdf_path: str,
+        document,
         out_txt_path: str,
         combined_text: Optional[str] = None
     ) -> str:
-        pages: List[str] = []
+        # Accepts a Document (preferred, already parsed) or a PDF path
+        with Document.of(document) as document:
+            return self._write(document, out_txt_path, combined_text)
 
-        # 1) Try pdfplumber (page-native)
-        try:
-            import pdfplumber
-            with pdfplumber.open(pdf_path) as pdf:
-                pages = [(page.extract_text() or "") for page in pdf.pages]
-        except Exception:
-            pages = []
+    def _write(self, document, out_txt_path, combined_text=None):
+        # 1) Use the per-page text the extractors already collected
+        source = document.best_source()
+        pages: List[str] = document.best_pages()
 
-        # 2) Fallback to PyMuPDF (page-native)
+        # 2) Fallback to PyMuPDF on the already-loaded bytes (page-native)
         if not pages or not any(p.strip() for p in pages):
             try:
-                import fitz  # PyMuPDF
-                with fitz.open(pdf_path) as doc:
-                    pages = [(pg.get_text("text") or "") for pg in doc]
+                pages = [(pg.get_text("text") or "") for pg in document.fitz_doc]
+                source = "pymupdf"
             except Exception:
                 pages = []
 
         # 3) If the combined text has form-feed separators, use them
         if (not pages or not any(p.strip() for p in pages)) and isinstance(combined_text, str) and "\f" in combined_text:
             pages = combined_text.split("\f")
+            source = "combined"
 
         # 4) As a last resort, use the combined text as PAGE 1
         if not pages:
             pages = [combined_text or ""]
+            source = "combined"
 
         # Ensure output folder exists
         out_dir = os.path.dirname(out_txt_path)
@@ -44,10 +49,22 @@ class PageDumpWriter:
 
         # Write the page-segmented file (SAME path/filename you pass in)
         with open(out_txt_path, "w", encoding="utf-8") as f:
-            f.write(f"FILE: {os.path.basename(pdf_path)}\nPAGES: {len(pages)}\n\n")
+            f.write(f"FILE: {document.name}\nPAGES: {len(pages)}\nSOURCE: {source}\n\n")
             for i, text in enumerate(pages, start=1):
                 f.write(f"{'='*20} PAGE {i} {'='*20}\n")
                 f.write((text or "").strip() or "[EMPTY]")
                 f.write("\n\n")
 
-        return out_txt_path
\ No newline at end of file
+        return out_txt_path
+
+    @staticmethod
+    def read_pages(txt_path: str) -> Tuple[Optional[str], List[str]]:
+        # (extractor the pages came from, page texts) back out of a dump written above
+        with open(txt_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        source = re.search(r"^SOURCE: (.+)$", content.split("=" * 20, 1)[0], re.M)
+        parts = PageDumpWriter.PAGE_HEADER.split(content)
+        # parts: [header, "1", text, "2", text, ...]
+        pages = [text.strip() for text in parts[2::2]]
+        pages = ["" if text == "[EMPTY]" else text for text in pages]
+        return (source.group(1).strip() if source else None), pages
\ No newline at end of file
@@ -0,0 +1,295 @@
+from multiprocessing.connection import wait
+from itertools import count
+from time import monotonic
+import multiprocessing
+import threading
+import heapq
+import os
+
+# A process pool that can stop a hung task. multiprocessing.Pool can't kill one
+# worker, so a PDF that leaves pdfminer spinning holds its worker (and the end
+# of the run) for as long as it spins. Here every worker has its own pipe and the
+# parent knows what each one is running, since when and in which stage: a task
+# past its timeout, or a stage past its budget, gets its worker killed and
+# replaced, and the task's error_callback receives a TaskTimeout.
+#
+# Workers are also replaced after max_tasks tasks or once their memory (RSS)
+# goes over max_rss_mb, so a long run doesn't keep growing.
+
+class TaskTimeout(Exception):
+    # kind: "task" (the whole task's timeout) or "stage" (one stage's budget);
+    # elapsed: how long the task had been running on its worker (queue time not included)
+    def __init__(self, kind, stage, seconds, elapsed=None):
+        if kind == "stage":
+            super().__init__(f"{stage} ran past its {seconds:.0f} s budget")
+        else:
+            super().__init__(f"ran past {seconds:.0f} s" + (f" (in {stage})" if stage else ""))
+        self.kind = kind
+        self.stage = stage
+        self.seconds = seconds
+        self.elapsed = seconds if elapsed is None else elapsed
+
+class WorkerLost(Exception):
+    pass
+
+# --- worker side ---
+_conn = None  # this worker's pipe, when running under a SupervisedPool
+
+def stage(name):
+    # Called by tasks as they enter a stage (e.g. an extractor) so the parent can
+    # hold that stage to its own budget; None ends it. A no-op outside the pool.
+    if _conn is not None:
+        _conn.send(("stage", name))
+
+def rss_mb():
+    try:
+        import psutil  # optional dependency: pip install psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return None  # Windows without psutil: only max_tasks recycles
+
+def _worker_main(conn, initializer, initargs):
+    global _conn
+    _conn = conn
+    if initializer:
+        initializer(*initargs)
+    conn.send(("ready",))
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        func, args, kwds = task
+        try:
+            message = ("done", True, func(*args, **kwds))
+        except Exception as e:
+            message = ("done", False, e)
+        try:
+            conn.send(message + (rss_mb(),))
+        except Exception as e:
+            # The result or exception couldn't be pickled
+            conn.send(("done", False, RuntimeError(f"{type(e).__name__}: {e}"), rss_mb()))
+
+# --- parent side ---
+class _Task:
+    def __init__(self, func, args, kwds, callback, error_callback, timeout):
+        self.func = func
+        self.args = args
+        self.kwds = kwds
+        self.callback = callback
+        self.error_callback = error_callback
+        self.timeout = timeout
+
+class _Worker:
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.ready = False
+        self.task = None
+        self.started = 0.0
+        self.stage = None
+        self.stage_started = 0.0
+        self.tasks = 0
+
+class SupervisedPool:
+    # The apply_async / with-block part of multiprocessing.Pool, plus:
+    #   apply_async(..., timeout=seconds)   limit for that one task
+    #   apply_async(..., priority=n)        lower n is handed out first; ties go in submission order
+    #   stage_timeouts={stage: seconds}    budget for each stage reported with stage()
+    # Callbacks run on the pool's own thread, like Pool's result handler.
+    MAX_START_FAILURES = 3
+
+    def __init__(self, processes, initializer=None, initargs=(), context=None,
+                 stage_timeouts=None, max_tasks=None, max_rss_mb=None):
+        self.context = context or multiprocessing.get_context()
+        self.processes = max(1, processes)
+        self.initializer = initializer
+        self.initargs = initargs
+        self.stage_timeouts = {k: v for k, v in (stage_timeouts or {}).items() if v}
+        self.max_tasks = max_tasks
+        self.max_rss_mb = max_rss_mb
+        self.queue = []  # heap of (priority, submission number, _Task)
+        self.submitted = count()
+        self.lock = threading.Lock()
+        self.closing = False
+        self.start_failures = 0
+        self.recycled = 0
+        self.killed = 0
+        self.wake_r, self.wake_w = multiprocessing.Pipe(duplex=False)
+        self.workers = [self._start_worker() for _ in range(self.processes)]
+        self.thread = threading.Thread(target=self._run, name="SupervisedPool", daemon=True)
+        self.thread.start()
+
+    def apply_async(self, func, args=(), kwds=None, callback=None, error_callback=None, timeout=None,
+                    priority=0):
+        with self.lock:
+            if self.closing:
+                raise ValueError("Pool not running")
+            task = _Task(func, args, kwds or {}, callback, error_callback, timeout)
+            heapq.heappush(self.queue, (priority, next(self.submitted), task))
+            self.wake_w.send(None)  # also called from callbacks on the pool's thread
+
+    def terminate(self):
+        with self.lock:
+            if self.closing:
+                return
+            self.closing = True
+            self.wake_w.send(None)
+        self.thread.join()
+        for worker in self.workers:
+            self._stop(worker, kill=worker.task is not None)
+        self.wake_r.close()
+        self.wake_w.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.terminate()
+
+    # --- workers ---
+    def _start_worker(self):
+        parent_conn, child_conn = self.context.Pipe()
+        process = self.context.Process(target=_worker_main, args=(child_conn, self.initializer, self.initargs),
+                                       daemon=True)
+        process.start()
+        child_conn.close()
+        return _Worker(process, parent_conn)
+
+    def _stop(self, worker, kill=False):
+        if kill:
+            worker.process.kill()
+        else:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+        worker.process.join(timeout=5)
+        if worker.process.is_alive():
+            worker.process.kill()
+            worker.process.join()
+        worker.conn.close()
+
+    def _replace(self, worker, kill):
+        self.workers.remove(worker)
+        self._stop(worker, kill)
+        if not self.closing:
+            self.workers.append(self._start_worker())
+
+    # --- dispatcher thread ---
+    @staticmethod
+    def _call(function, value):
+        if function is None:
+            return
+        try:
+            function(value)
+        except Exception as e:
+            print(f"⚠️ Pool callback failed: {e}")
+
+    def _assign(self):
+        for worker in self.workers:
+            if not worker.ready or worker.task is not None:
+                continue
+            with self.lock:
+                if not self.queue:
+                    return
+                task = heapq.heappop(self.queue)[2]
+            try:
+                worker.conn.send((task.func, task.args, task.kwds))
+            except Exception as e:
+                self._call(task.error_callback, e)
+                continue
+            worker.task = task
+            worker.started = monotonic()
+            worker.stage = None
+
+    def _deadline(self, worker):
+        # (when, kind) of the first limit this worker's task will hit, or None
+        limits = []
+        if worker.task.timeout:
+            limits.append((worker.started + worker.task.timeout, "task"))
+        budget = self.stage_timeouts.get(worker.stage)
+        if budget:
+            limits.append((worker.stage_started + budget, "stage"))
+        return min(limits) if limits else None
+
+    def _receive(self, worker):
+        while worker.conn.poll():
+            message = worker.conn.recv()
+            if message[0] == "stage":
+                worker.stage = message[1]
+                worker.stage_started = monotonic()
+            elif message[0] == "ready":
+                worker.ready = True
+                self.start_failures = 0
+            elif message[0] == "done":
+                _, ok, value, rss = message
+                task, worker.task, worker.stage = worker.task, None, None
+                worker.tasks += 1
+                self._call(task.callback if ok else task.error_callback, value)
+                if (self.max_tasks and worker.tasks >= self.max_tasks) or \
+                        (self.max_rss_mb and rss and rss > self.max_rss_mb):
+                    self.recycled += 1
+                    self._replace(worker, kill=False)
+                    return
+
+    def _lost(self, worker):
+        # The worker died by itself (crash, out of memory, killed from outside)
+        task = worker.task
+        if not worker.ready:
+            self.start_failures += 1
+        self._replace(worker, kill=True)
+        if task:
+            self._call(task.error_callback, WorkerLost(f"worker exited with code {worker.process.exitcode}"))
+        if self.start_failures >= self.MAX_START_FAILURES * self.processes:
+            # The initializer keeps failing: fail everything instead of restarting forever
+            with self.lock:
+                self.closing = True
+                pending, self.queue = [task for _, _, task in sorted(self.queue)], []
+            for task in pending:
+                self._call(task.error_callback, WorkerLost("workers keep exiting during startup"))
+
+    def _expire(self, now):
+        for worker in list(self.workers):
+            if worker.task is None:
+                continue
+            deadline = self._deadline(worker)
+            if deadline and now >= deadline[0]:
+                kind = deadline[1]
+                seconds = now - (worker.started if kind == "task" else worker.stage_started)
+                task, stage = worker.task, worker.stage
+                self.killed += 1
+                self._replace(worker, kill=True)
+                self._call(task.error_callback, TaskTimeout(kind, stage, seconds, now - worker.started))
+
+    def _run(self):
+        while not self.closing:
+            self._assign()
+            deadlines = [d[0] for d in (self._deadline(w) for w in self.workers if w.task) if d]
+            timeout = max(0.0, min(deadlines) - monotonic()) if deadlines else None
+            waitables = {self.wake_r: None}
+            for worker in self.workers:
+                waitables[worker.conn] = worker
+                waitables[worker.process.sentinel] = worker
+            ready = wait(list(waitables), timeout)
+            if self.wake_r in ready:
+                while self.wake_r.poll():
+                    self.wake_r.recv()
+            for handle in ready:
+                worker = waitables[handle]
+                if worker is None or worker not in self.workers:
+                    continue
+                try:
+                    self._receive(worker)
+                except (EOFError, OSError):
+                    pass
+                if worker in self.workers and not worker.process.is_alive():
+                    self._lost(worker)
+            self._expire(monotonic())
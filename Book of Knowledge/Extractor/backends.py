@@ -0,0 +1,73 @@
+from Datahandler.metrics import timed
+from time import perf_counter
+import importlib
+
+# Third-party libraries behind the extractors, by short name. Each is imported the
+# first time something asks for it, so a worker whose PDFs never reach pdfminer
+# or OCR never pays for importing them (pytesseract alone pulls in pandas).
+BACKENDS = {
+    "pymupdf": "fitz",
+    "pdfplumber": "pdfplumber",
+    "pdfminer": "pdfminer.high_level",
+    "numpy": "numpy",
+    "opencv": "cv2",
+    "pytesseract": "pytesseract",
+}
+
+# Extractor name (as in mainextractor.py) -> the backends it uses
+EXTRACTORS = {
+    "pymupdf": ["pymupdf"],
+    "pdfplumber": ["pdfplumber"],
+    "pdfminer": ["pdfminer"],
+    "ocr": ["pymupdf", "numpy", "opencv", "pytesseract"],
+}
+
+_modules = {}
+_hooks = {}  # backend -> setup functions run once, right after it is imported
+
+def on_load(name, setup):
+    # setup(module) runs when the backend is first loaded in this process, or now
+    # if it already was (e.g. pointing pytesseract at the Tesseract executable)
+    if name in _modules:
+        setup(_modules[name])
+    else:
+        _hooks.setdefault(name, []).append(setup)
+
+def load(name):
+    module = _modules.get(name)
+    if module is None:
+        if name not in BACKENDS:
+            raise ValueError(f"Unknown backend '{name}' (choose from {', '.join(BACKENDS)})")
+        # Shows up as import.<name> in the metrics of the document that needed it first
+        with timed(f"import.{name}"):
+            module = importlib.import_module(BACKENDS[name])
+        for setup in _hooks.pop(name, []):
+            setup(module)
+        _modules[name] = module
+    return module
+
+def names(extractors):
+    # Extractor or backend names -> backend names, in order, without repeats
+    out = []
+    for name in extractors:
+        for backend in EXTRACTORS.get(name, [name]):
+            if backend not in out:
+                out.append(backend)
+    return out
+
+def modules(extractors):
+    # Importable module names, e.g. for a forkserver's preload list
+    return [BACKENDS[name] for name in names(extractors) if name in BACKENDS]
+
+def preload(extractors):
+    # Imports everything those extractors need now; returns {backend: seconds}
+    timings = {}
+    for name in names(extractors):
+        start = perf_counter()
+        try:
+            load(name)
+        except ImportError as e:
+            print(f"⚠️ Could not preload '{name}': {e}")
+            continue
+        timings[name] = round(perf_counter() - start, 4)
+    return timings
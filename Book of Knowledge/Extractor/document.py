@@ -0,0 +1,108 @@
+from Extractor import backends
+from contextlib import contextmanager
+import hashlib
+import io
+import os
+
+class Document:
+    # Order used when a caller just wants "the" per-page text
+    # ("merged" is the consensus of the others, see Extractor/merge.py)
+    PAGE_SOURCES = ["merged", "pdfplumber", "pymupdf", "pdfminer", "ocr"]
+
+    def __init__(self, pdf_path):
+        self.path = pdf_path
+        self.name = os.path.basename(pdf_path)
+
+        # Read the file once; every backend parses from these bytes
+        with open(pdf_path, "rb") as f:
+            self.data = f.read()
+
+        # extractor name -> list of per-page text (filled in by TextExtractor)
+        self.pages = {}
+
+        self._fitz_doc = None
+        self._plumber_pdf = None
+        self._content_hash = None
+        self._mirrored = {}
+
+    @classmethod
+    @contextmanager
+    def of(cls, source):
+        # with Document.of(source) as document: takes a Document or a path. A Document
+        # passed in stays open (whoever opened it closes it); one opened here from a
+        # path is closed at the end of the block.
+        if isinstance(source, cls):
+            yield source
+        else:
+            with cls(source) as document:
+                yield document
+
+    # --- parsed backends (opened once, on first use) ---
+    @property
+    def fitz_doc(self):
+        if self._fitz_doc is None:
+            self._fitz_doc = backends.load("pymupdf").open(stream=self.data, filetype="pdf")
+        return self._fitz_doc
+
+    @property
+    def plumber_pdf(self):
+        if self._plumber_pdf is None:
+            self._plumber_pdf = backends.load("pdfplumber").open(io.BytesIO(self.data))
+        return self._plumber_pdf
+
+    @property
+    def page_count(self):
+        return self.fitz_doc.page_count
+
+    @property
+    def size(self):
+        return len(self.data)
+
+    @property
+    def content_hash(self):
+        # SHA-256 of the file bytes: the same PDF under any name or folder
+        if self._content_hash is None:
+            self._content_hash = hashlib.sha256(self.data).hexdigest()
+        return self._content_hash
+
+    def mirrored_lines(self, index):
+        # Text of the lines on page `index` that PyMuPDF found running right to left
+        # (drawn through a mirror matrix); other extractors often read those back to front
+        if index not in self._mirrored:
+            lines = []
+            if index < self.page_count:
+                for block in self.fitz_doc[index].get_text("dict")["blocks"]:
+                    for line in block.get("lines", []):
+                        if line["dir"][0] < 0:
+                            lines.append("".join(span["text"] for span in line["spans"]))
+            self._mirrored[index] = lines
+        return self._mirrored[index]
+
+    def best_source(self):
+        # First extractor (in PAGE_SOURCES order) that produced any text
+        for source in self.PAGE_SOURCES:
+            pages = self.pages.get(source)
+            if pages and any(p.strip() for p in pages):
+                return source
+        return None
+
+    def best_pages(self):
+        source = self.best_source()
+        return self.pages[source] if source else []
+
+    def close(self):
+        if self._plumber_pdf is not None:
+            self._plumber_pdf.close()
+            self._plumber_pdf = None
+        if self._fitz_doc is not None:
+            self._fitz_doc.close()
+            self._fitz_doc = None
+
+    def __str__(self):
+        return self.path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
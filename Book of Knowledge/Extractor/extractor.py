@@ -1,67 +1,246 @@
-from pdfminer.high_level import extract_text as pdfminer_extract_text
-from pdf2image import convert_from_path
-import numpy as np
-import pytesseract
-import pdfplumber
-import fitz
-import cv2
+from Extractor.ocrengine import get_engine
+from Extractor.document import Document
+from Extractor import backends
+from Datahandler.metrics import timed, current
+import io
 import re
 
 class TextExtractor:
+    # Bump whenever extraction output changes so cached text gets re-extracted
+    VERSION = 3
+
     # --- internal helpers ---
     @staticmethod
     def _normalize_space(s: str) -> str:
         return re.sub(r"\s+", " ", (s or "").strip())
 
+    # Page count (used to score text density per page); 1 if the PDF can't be opened
+    @staticmethod
+    def page_count(source):
+        try:
+            with Document.of(source) as document:
+                return document.page_count or 1
+        except Exception:
+            return 1
+
+    # Render one page straight to an 8-bit grayscale pixmap. Huge drawing sheets
+    # drop to a lower DPI so a single page never exceeds max_pixels bytes.
+    # clip renders only that part of the page.
+    @staticmethod
+    def _render_gray(page, dpi=150, max_pixels=None, clip=None):
+        if max_pixels:
+            rect = clip or page.rect
+            area_sq_in = (rect.width / 72) * (rect.height / 72)
+            dpi = max(72, min(dpi, int((max_pixels / area_sq_in) ** 0.5)))
+        return page.get_pixmap(dpi=dpi, colorspace=backends.load("pymupdf").csGRAY, alpha=False, clip=clip)
+
+    # Rasterize one page (or one clip of it), binarize it in the pixmap's own buffer
+    # and run Tesseract through the selected engine. Only one image is alive at a time.
+    @staticmethod
+    def _ocr_page(page, dpi=150, max_pixels=None, engine="pytesseract", clip=None,
+                  adaptive=False, high_dpi=300, min_confidence=70):
+        if adaptive:
+            return TextExtractor._ocr_page_adaptive(page, dpi, max_pixels, engine, clip, high_dpi, min_confidence)
+        np, cv2 = backends.load("numpy"), backends.load("opencv")
+        with timed("ocr.rasterize"):
+            pix = TextExtractor._render_gray(page, dpi, max_pixels, clip)
+            gray = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.stride)[:, :pix.width]
+            cv2.threshold(gray, 150, 255, cv2.THRESH_BINARY, dst=gray)
+        with timed("ocr.tesseract"):
+            text = get_engine(engine).image_to_string(gray)
+        del gray, pix
+        return text
+
+    # Straighten a binarized scan: small rotations are tried on a shrunken copy and
+    # the one whose text rows line up best (sharpest row-sum profile) is applied
+    @staticmethod
+    def _deskew(binary, max_angle=5.0, step=0.5):
+        np, cv2 = backends.load("numpy"), backends.load("opencv")
+        scale = min(1.0, 800 / max(binary.shape))
+        ink = cv2.resize(255 - binary, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        height, width = ink.shape
+        best_angle, best_score = 0.0, -1.0
+        for angle in np.arange(-max_angle, max_angle + step / 2, step):
+            matrix = cv2.getRotationMatrix2D((width / 2, height / 2), float(angle), 1.0)
+            rows = cv2.warpAffine(ink, matrix, (width, height)).sum(axis=1, dtype=np.float64)
+            score = float(np.var(rows))
+            if score > best_score:
+                best_angle, best_score = float(angle), score
+        if abs(best_angle) < step:
+            return binary
+        height, width = binary.shape
+        matrix = cv2.getRotationMatrix2D((width / 2, height / 2), best_angle, 1.0)
+        return cv2.warpAffine(binary, matrix, (width, height), flags=cv2.INTER_NEAREST, borderValue=255)
+
+    # One OCR read for adaptive mode: "otsu" picks the threshold from the page's own
+    # histogram (clean scans), "adaptive" thresholds each neighbourhood separately
+    # (faint or unevenly lit scans). Returns (text, mean word confidence 0-100).
+    @staticmethod
+    def _ocr_pass(page, dpi, max_pixels, engine, clip=None, threshold="otsu", deskew=False):
+        np, cv2 = backends.load("numpy"), backends.load("opencv")
+        with timed("ocr.rasterize"):
+            pix = TextExtractor._render_gray(page, dpi, max_pixels, clip)
+            gray = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.stride)[:, :pix.width]
+            if threshold == "otsu":
+                cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU, dst=gray)
+            else:
+                gray = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 15)
+            if deskew:
+                gray = TextExtractor._deskew(gray)
+        with timed("ocr.tesseract"):
+            text, confidence = get_engine(engine).image_to_data(gray)
+        del gray, pix
+        return text, confidence
+
+    # Adaptive OCR: a quick Otsu pass at dpi; a page (or clip) whose confidence is
+    # under min_confidence is read again at high_dpi, deskewed and adaptively
+    # thresholded, and the more confident read is kept. Confidence per page (the
+    # lowest clip's, for region OCR) goes into the document's metrics.
+    @staticmethod
+    def _ocr_page_adaptive(page, dpi=100, max_pixels=None, engine="pytesseract", clip=None,
+                           high_dpi=300, min_confidence=70):
+        text, confidence = TextExtractor._ocr_pass(page, dpi, max_pixels, engine, clip)
+        info = current().info
+        if confidence < min_confidence and high_dpi > dpi:
+            info["ocr_escalated"] = info.get("ocr_escalated", 0) + 1
+            retry_text, retry_confidence = TextExtractor._ocr_pass(page, high_dpi, max_pixels, engine, clip,
+                                                                   "adaptive", deskew=True)
+            if retry_confidence > confidence:
+                text, confidence = retry_text, retry_confidence
+        page_confidence = info.setdefault("ocr_confidence", {})
+        key = str(page.number + 1)
+        page_confidence[key] = round(min(confidence, page_confidence.get(key, 100.0)), 1)
+        return text
+
+    # Layout-aware OCR: when the page's template has known title block / notes
+    # regions (see Extractor/regions.py), only those are OCR'd, at region_dpi.
+    # Falls back to the whole page when there are none or they read as nothing useful.
+    @staticmethod
+    def _ocr_page_regions(page, dpi=150, max_pixels=None, engine="pytesseract", regions=None, region_dpi=200,
+                          adaptive=False, high_dpi=300, min_confidence=70):
+        rects = regions.template_rects(page) if regions else None
+        if rects:
+            text = "\n".join(TextExtractor._ocr_page(page, region_dpi, max_pixels, engine, rect,
+                                                     adaptive, high_dpi, min_confidence)
+                             for rect in rects)
+            if regions.matches(text):
+                return text
+        return TextExtractor._ocr_page(page, dpi, max_pixels, engine, None, adaptive, high_dpi, min_confidence)
+
+    # Fraction of the page area covered by placed images (scans are ~1.0)
+    @staticmethod
+    def _image_coverage(page):
+        Rect = backends.load("pymupdf").Rect
+        page_area = abs(page.rect) or 1
+        covered = 0.0
+        for info in page.get_image_info():
+            bbox = Rect(info["bbox"]) & page.rect
+            covered += abs(bbox)
+        return min(1.0, covered / page_area)
+
+    # A page needs OCR when it has (almost) no text layer, or is mostly a scanned
+    # image with only a few stray characters of text on top
+    @staticmethod
+    def _page_needs_ocr(page, page_text, min_chars=50, image_coverage=0.6):
+        chars = len((page_text or "").strip())
+        if chars < min_chars:
+            return True
+        return chars < min_chars * 4 and TextExtractor._image_coverage(page) >= image_coverage
+
+    # Each extractor takes a Document (or a path, which gets wrapped in one),
+    # stores its per-page text in document.pages[<name>] and returns the
+    # normalized full-document text
+
     # PDFPlumber extractor (full-document text)
     @staticmethod
-    def extract_with_pdfplumber(pdf_path):
+    def extract_with_pdfplumber(source):
         try:
-            text = ""
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            return TextExtractor._normalize_space(text)
+            with Document.of(source) as document:
+                pages = [(page.extract_text() or "") for page in document.plumber_pdf.pages]
+                document.pages["pdfplumber"] = pages
+            return TextExtractor._normalize_space("\n".join(p for p in pages if p))
         except Exception:
             return ""
 
     # PyMuPDF extractor (full-document text)
     @staticmethod
-    def extract_with_pymupdf(pdf_path):
+    def extract_with_pymupdf(source):
         try:
-            doc = fitz.open(pdf_path)
-            text = ""
-            for page in doc:
-                text += page.get_text() or ""
-            return TextExtractor._normalize_space(text)
+            with Document.of(source) as document:
+                pages = [(page.get_text() or "") for page in document.fitz_doc]
+                document.pages["pymupdf"] = pages
+            return TextExtractor._normalize_space("".join(pages))
         except Exception:
             return ""
 
     # PDFMiner extractor (full-document text)
     @staticmethod
-    def extract_with_pdfminer(pdf_path):
+    def extract_with_pdfminer(source):
         try:
-            full_text = pdfminer_extract_text(pdf_path)
+            with Document.of(source) as document:
+                full_text = backends.load("pdfminer").extract_text(io.BytesIO(document.data))
+                # pdfminer ends every page with a form feed
+                pages = full_text.split("\f")
+                if len(pages) > 1 and not pages[-1].strip():
+                    pages = pages[:-1]
+                document.pages["pdfminer"] = pages
             return TextExtractor._normalize_space(full_text)
         except Exception as e:
-            print(f"⚠️ PDFMiner failed for {pdf_path}: {e}")
+            print(f"⚠️ PDFMiner failed for {source}: {e}")
             return ""
 
+    # Both OCR extractors take ocr_pages: {0-based page index: text} for pages that
+    # were already OCR'd as separate pool tasks, so only the rest are OCR'd here.
+    # adaptive=True starts at dpi and only re-reads low-confidence pages at high_dpi.
+
     # OCR extractor (full-document text)
     @staticmethod
-    def extract_with_ocr_fast(pdf_path, dpi=150):
+    def extract_with_ocr_fast(source, dpi=150, max_pixels=None, engine="pytesseract", ocr_pages=None,
+                              adaptive=False, high_dpi=300, min_confidence=70):
         try:
-            images = convert_from_path(pdf_path, dpi=dpi)
-            text = ""
-            for img in images:
-                img_np = np.array(img)
-                gray = cv2.cvtColor(img_np, cv2.COLOR_RGB2GRAY)
-                _, thresh = cv2.threshold(gray, 150, 255, cv2.THRESH_BINARY)
-                ocr_text = pytesseract.image_to_string(thresh)
-                text += ocr_text + "\n"
-            return TextExtractor._normalize_space(text)
+            with Document.of(source) as document:
+                done = ocr_pages or {}
+                pages = [done[i] if i in done else TextExtractor._ocr_page(page, dpi, max_pixels, engine, None,
+                                                                           adaptive, high_dpi, min_confidence)
+                         for i, page in enumerate(document.fitz_doc)]
+                document.pages["ocr"] = pages
+            return TextExtractor._normalize_space("\n".join(pages))
         except Exception as e:
-            print(f"⚠️ OCR failed for {pdf_path}: {e}")
-            return ""
\ No newline at end of file
+            print(f"⚠️ OCR failed for {source}: {e}")
+            return ""
+
+    # Hybrid OCR extractor (full-document text): keeps the text layer where a page
+    # has one and only rasterizes + OCRs the pages that don't, in page order
+    @staticmethod
+    def extract_with_hybrid_ocr(source, dpi=150, min_chars=50, image_coverage=0.6, max_pixels=None,
+                                engine="pytesseract", ocr_pages=None, regions=None, region_dpi=200,
+                                adaptive=False, high_dpi=300, min_confidence=70):
+        try:
+            with Document.of(source) as document:
+                done = ocr_pages or {}
+                # Reuse the PyMuPDF text if that extractor already ran on this document
+                layer_pages = document.pages.get("pymupdf")
+                pages = []
+                rasterized = []
+                for index, page in enumerate(document.fitz_doc, start=1):
+                    page_text = layer_pages[index - 1] if layer_pages else (page.get_text() or "")
+                    if index - 1 in done:
+                        page_text = done[index - 1]
+                        rasterized.append(index)
+                    elif TextExtractor._page_needs_ocr(page, page_text, min_chars, image_coverage):
+                        # A failed page keeps whatever text layer it had
+                        try:
+                            page_text = TextExtractor._ocr_page_regions(page, dpi, max_pixels, engine,
+                                                                        regions, region_dpi,
+                                                                        adaptive, high_dpi, min_confidence)
+                            rasterized.append(index)
+                        except Exception as e:
+                            print(f"⚠️ OCR failed for page {index} of {source}: {e}")
+                    pages.append(page_text)
+                document.pages["ocr"] = pages
+            if rasterized:
+                print(f"🔍 Hybrid OCR rasterized page(s) {rasterized} of {source}")
+            return TextExtractor._normalize_space("\n".join(pages))
+        except Exception as e:
+            print(f"⚠️ Hybrid OCR failed for {source}: {e}")
+            return ""
@@ -0,0 +1,64 @@
+import re
+
+class PageMerger:
+    # Merges the per-page text of every extractor into one consensus text per page.
+    # The base for each page is the extractor output that agrees most with the
+    # others; lines another extractor found that the base is missing are appended.
+    # Field searchers then see each piece of text once instead of once per extractor.
+    WORD = re.compile(r"[A-Z0-9]+")
+
+    def __init__(self, sources=("pdfplumber", "pymupdf", "pdfminer", "ocr"), shingle=3, covered=0.5):
+        self.sources = list(sources)  # tie-break order
+        self.shingle = shingle        # words per shingle used to compare texts
+        self.covered = covered        # a line is "already there" above this shingle overlap
+
+    def shingles(self, text, shorter=False):
+        # Word n-grams, so line wrapping and spacing differences between extractors don't
+        # matter. A text shorter than one shingle is a single shorter n-gram; shorter=True
+        # also adds every shorter n-gram so those can be looked up.
+        words = self.WORD.findall((text or "").upper())
+        if len(words) < self.shingle and not shorter:
+            return {tuple(words)} if words else set()
+        sizes = range(1, self.shingle + 1) if shorter else (self.shingle,)
+        return {tuple(words[i:i + n]) for n in sizes for i in range(len(words) - n + 1)}
+
+    def merge_page(self, texts):
+        # texts: extractor name -> text of one page
+        candidates = [(name, texts[name]) for name in self.sources if (texts.get(name) or "").strip()]
+        if not candidates:
+            return ""
+        if len(candidates) == 1:
+            return candidates[0][1]
+
+        shingle_sets = {name: self.shingles(text) for name, text in candidates}
+
+        def agreement(name):
+            own = shingle_sets[name]
+            return sum(len(own & other) for n, other in shingle_sets.items() if n != name)
+
+        base_name, base_text = max(candidates, key=lambda c: agreement(c[0]))  # first wins ties
+        seen = self.shingles(base_text, shorter=True)
+        extra = []
+        for name, text in candidates:
+            if name == base_name:
+                continue
+            for line in text.splitlines():
+                line_shingles = self.shingles(line)
+                if not line_shingles:
+                    continue
+                if len(line_shingles & seen) / len(line_shingles) > self.covered:
+                    continue
+                extra.append(line.strip())
+                seen |= self.shingles(line, shorter=True)
+
+        return "\n".join([base_text.rstrip()] + extra) if extra else base_text
+
+    def merge(self, pages):
+        # pages: extractor name -> list of per-page text (document.pages).
+        # Extractors are aligned by page index.
+        per_source = {name: pages.get(name) or [] for name in self.sources}
+        page_count = max((len(p) for p in per_source.values()), default=0)
+        return [
+            self.merge_page({name: p[i] for name, p in per_source.items() if i < len(p)})
+            for i in range(page_count)
+        ]
@@ -0,0 +1,109 @@
+from Fields.keywords import load_vocabulary, DATA_DIR
+import os
+import re
+
+class MirrorFixer:
+    # Finds lines whose characters came out back to front (mirrored title blocks,
+    # text drawn right to left: "REBMUN TCEJORP :2.260.00.22") and reverses them,
+    # the same per-line flip flip.py does by hand. A line is flipped on its own
+    # when at least MIN_REVERSED of its words are known words read backwards and
+    # they outnumber the ones read forwards by REVERSED_MARGIN; words that are
+    # words both ways ("SAW"/"WAS") don't count. A line PyMuPDF drew through a
+    # mirror needs just one more backwards word than forwards. Lines short of that
+    # (numbers, names like "yawhgiH", a lone "TON") follow their neighbours, so a
+    # whole reversed block flips together and a stray word in normal text doesn't.
+    WORD = re.compile(r"[A-Za-z]{3,}")
+    KEY = re.compile(r"[^A-Z0-9]")
+    MIN_REVERSED = 2
+    REVERSED_MARGIN = 2
+
+    def __init__(self, words_file="common_words.txt", vocabularies=("materials.txt", "seismic_systems.txt")):
+        self.words = set()
+        with open(os.path.join(DATA_DIR, words_file), "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.lstrip().startswith("#"):
+                    self.words.update(w.upper() for w in self.WORD.findall(line))
+        for filename in vocabularies:
+            for _, names in load_vocabulary(filename):
+                for name in names:
+                    self.words.update(w.upper() for w in self.WORD.findall(name))
+
+    def count(self, line):
+        # (known words read forwards, known words read backwards)
+        forward = backward = 0
+        for word in self.WORD.findall(line):
+            word = word.upper()
+            if word in self.words and word[::-1] in self.words:
+                continue
+            forward += word in self.words
+            backward += word[::-1] in self.words
+        return forward, backward
+
+    def vote(self, line, mirrored=False):
+        # +1 reversed, -1 reads fine, 0 can't tell
+        forward, backward = self.count(line)
+        if mirrored and backward > forward:
+            return 1
+        if backward >= self.MIN_REVERSED and backward - forward >= self.REVERSED_MARGIN:
+            return 1
+        if forward > backward:
+            return -1
+        return 0
+
+    @classmethod
+    def _key(cls, line):
+        return cls.KEY.sub("", line.upper())
+
+    def fix_text(self, text, mirrored_lines=None):
+        # Returns (fixed text, number of lines flipped); line endings are kept.
+        # mirrored_lines() gives the lines PyMuPDF found drawn through a mirror on
+        # this page; only asked for when a line has too few backwards words to decide
+        if not text:
+            return text, 0
+        lines = text.splitlines(keepends=True)
+        votes = [self.vote(line) for line in lines]
+        weak = [i for i, line in enumerate(lines)
+                if votes[i] == 0 and self.vote(line, mirrored=True) == 1]
+        if weak and mirrored_lines:
+            mirrored = "|".join(self._key(line) for line in mirrored_lines())
+            for i in weak:
+                key = self._key(lines[i])
+                if mirrored and key and (key in mirrored or key[::-1] in mirrored):
+                    votes[i] = 1
+        if 1 not in votes:
+            return text, 0
+
+        # Undecided lines take the nearest decided line on each side: flip only if
+        # every decided neighbour is flipped
+        decided = [i for i, v in enumerate(votes) if v]
+        flips = []
+        for i, v in enumerate(votes):
+            if v:
+                flips.append(v == 1)
+                continue
+            before = next((votes[j] for j in reversed(decided) if j < i), 0)
+            after = next((votes[j] for j in decided if j > i), 0)
+            flips.append(1 in (before, after) and -1 not in (before, after))
+
+        out = []
+        flipped = 0
+        for line, flip in zip(lines, flips):
+            if flip:
+                core = line.rstrip("\r\n")
+                out.append(core[::-1] + line[len(core):])
+                flipped += 1
+            else:
+                out.append(line)
+        return "".join(out), flipped
+
+    def fix_pages(self, pages, mirrored_lines=None):
+        # Returns (fixed pages, number of lines flipped). mirrored_lines(page index)
+        # gives PyMuPDF's mirrored lines for a page (e.g. Document.mirrored_lines)
+        fixed = []
+        flipped = 0
+        for index, page in enumerate(pages):
+            lookup = (lambda index=index: mirrored_lines(index)) if mirrored_lines else None
+            text, count = self.fix_text(page, lookup)
+            fixed.append(text)
+            flipped += count
+        return fixed, flipped
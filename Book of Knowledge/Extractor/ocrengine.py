@@ -0,0 +1,77 @@
+from Extractor import backends
+
+class PytesseractEngine:
+    # One tesseract subprocess (plus a temp image file) per call
+    name = "pytesseract"
+
+    def __init__(self):
+        self.pytesseract = backends.load("pytesseract")
+
+    def image_to_string(self, gray):
+        return self.pytesseract.image_to_string(gray)
+
+    def image_to_data(self, gray):
+        # (text, mean word confidence 0-100); lines rebuilt from Tesseract's word boxes
+        data = self.pytesseract.image_to_data(gray, output_type=self.pytesseract.Output.DICT)
+        lines = {}
+        confidences = []
+        for i, word in enumerate(data["text"]):
+            if not word.strip():
+                continue
+            lines.setdefault((data["block_num"][i], data["par_num"][i], data["line_num"][i]), []).append(word)
+            confidence = float(data["conf"][i])
+            if confidence >= 0:
+                confidences.append(confidence)
+        text = "\n".join(" ".join(words) for words in lines.values())
+        return text, (sum(confidences) / len(confidences) if confidences else 0.0)
+
+    def close(self):
+        pass
+
+class TesserocrEngine:
+    # Keeps one Tesseract API handle loaded; images go in as raw bytes, no
+    # temp files and no process startup per page
+    name = "tesserocr"
+
+    def __init__(self, tessdata_path=None, lang="eng"):
+        import tesserocr  # optional dependency: pip install tesserocr
+        self.np = backends.load("numpy")
+        if tessdata_path:
+            self.api = tesserocr.PyTessBaseAPI(path=tessdata_path, lang=lang)
+        else:
+            self.api = tesserocr.PyTessBaseAPI(lang=lang)
+
+    def image_to_string(self, gray):
+        gray = self.np.ascontiguousarray(gray, dtype=self.np.uint8)
+        height, width = gray.shape[:2]
+        self.api.SetImageBytes(gray.tobytes(), width, height, 1, width)
+        return self.api.GetUTF8Text()
+
+    def image_to_data(self, gray):
+        # (text, mean word confidence 0-100) from the same recognition pass
+        text = self.image_to_string(gray)
+        return text, float(self.api.MeanTextConf()) if text.strip() else 0.0
+
+    def close(self):
+        self.api.End()
+
+ENGINES = {
+    PytesseractEngine.name: PytesseractEngine,
+    TesserocrEngine.name: TesserocrEngine,
+}
+
+# One engine per name per process, so a pool worker loads Tesseract once
+_loaded = {}
+
+def get_engine(name="pytesseract", **options):
+    engine = _loaded.get(name)
+    if engine is None:
+        if name not in ENGINES:
+            raise ValueError(f"Unknown OCR engine '{name}' (choose from {', '.join(ENGINES)})")
+        try:
+            engine = ENGINES[name](**options)
+        except ImportError:
+            print(f"⚠️ OCR engine '{name}' is not installed; falling back to pytesseract")
+            engine = get_engine(PytesseractEngine.name)
+        _loaded[name] = engine
+    return engine
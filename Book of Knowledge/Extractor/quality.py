@@ -0,0 +1,56 @@
+import re
+
+class TextQualityScorer:
+    # Labels that show up on almost every set of meeting notes / general notes
+    ANCHORS = [
+        r"SEISMIC\s+DESIGN\s+CATEGORY",
+        r"PROJECT\s+(?:NUMBER|NO\.?)",
+        r"RISK\s+CATEGORY",
+        r"SITE\s+CLASS",
+        r"BUILDING\s+CODE|IBC|ASCE\s*7",
+        r"WIND\s+SPEED|VULT",
+    ]
+
+    def __init__(self, target_chars_per_page=800, weights=(0.4, 0.3, 0.3)):
+        self.target_chars_per_page = target_chars_per_page
+        self.weights = weights
+        self.anchor_patterns = [re.compile(a, re.IGNORECASE) for a in self.ANCHORS]
+
+        # "Dictionary-like" token: real words or all-caps drawing labels, not OCR noise
+        self.word_pattern = re.compile(r"^(?:[A-Za-z][a-z]+|[A-Z]{2,}|\d+(?:[.,]\d+)*)$")
+        self.vowel_pattern = re.compile(r"[AEIOUYaeiouy]")
+
+    def word_ratio(self, text):
+        tokens = [t.strip(".,:;()[]\"'") for t in text.split()]
+        tokens = [t for t in tokens if t]
+        if not tokens:
+            return 0.0
+        good = 0
+        for t in tokens:
+            if not self.word_pattern.match(t):
+                continue
+            # Letters without vowels ("XQZT") are almost always garbage
+            if t[0].isalpha() and len(t) > 3 and not self.vowel_pattern.search(t):
+                continue
+            good += 1
+        return good / len(tokens)
+
+    def anchor_ratio(self, text):
+        hits = sum(1 for p in self.anchor_patterns if p.search(text))
+        # A couple of anchors is plenty; most notes never carry every label
+        return min(1.0, hits / 2)
+
+    def score(self, text, page_count=1):
+        text = text or ""
+        if not text.strip():
+            return 0.0
+        per_page = len(text.strip()) / max(1, page_count or 1)
+        density = min(1.0, per_page / self.target_chars_per_page)
+
+        w_density, w_words, w_anchors = self.weights
+        return round(
+            w_density * density
+            + w_words * self.word_ratio(text)
+            + w_anchors * self.anchor_ratio(text),
+            3,
+        )
@@ -0,0 +1,132 @@
+from Extractor import backends
+import re
+
+def _rect(*args):
+    # fitz.Rect, with PyMuPDF loaded through backends like everything else
+    return backends.load("pymupdf").Rect(*args)
+
+class RegionFinder:
+    # Finds the parts of a page the fields actually live in: the sheet title block
+    # (project / job number, sheet number, drawn by ...) and the "GENERAL NOTES" /
+    # "DESIGN CRITERIA" column, using PyMuPDF's text block coordinates.
+    #
+    # Where each region sits is remembered per template (page size + rotation), so
+    # scanned pages of a drawing set that was already seen with a text layer can be
+    # OCR'd region by region instead of as a whole page.
+    NOTES_HEADING = re.compile(
+        r"^\s*(?:GENERAL\s+(?:STRUCTURAL\s+)?NOTES|STRUCTURAL\s+(?:GENERAL\s+)?NOTES|"
+        r"DESIGN\s+(?:CRITERIA|DATA|LOADS)|CODES?\s+(?:AND\s+STANDARDS|USED|SUMMARY))\b", re.I)
+    TITLE_LABEL = re.compile(
+        r"\b(?:PROJECT|JOB)\s*(?:NO\b|NUMBER|#)|\bSHEET\s*(?:NO\b|NUMBER|TITLE)|"
+        r"\bDRAWN\s+BY|\bCHECKED\s+BY|\bISSUE\s+DATE", re.I)
+
+    def __init__(self, min_seen=3, max_gap=36, indent=36, edge=0.25, max_area=0.5):
+        self.min_seen = min_seen        # pages of a template seen before its regions are trusted for OCR
+        self.max_gap = max_gap          # points between blocks before a notes column ends
+        self.indent = indent            # notes blocks start at most this far right of their heading
+        self.edge = edge                # title blocks sit in this right/bottom fraction of the page
+        self.max_area = max_area        # a template whose regions cover more than this is not used for OCR
+        self.templates = {}             # template key -> {"seen": pages, "rects": {kind: normalized rect}}
+
+    # --- finding regions on a page with a text layer ---
+    @staticmethod
+    def _blocks(page):
+        return [(_rect(b[:4]), b[4]) for b in page.get_text("blocks") if b[6] == 0 and b[4].strip()]
+
+    def _notes_regions(self, page, blocks):
+        # A notes heading plus every block below it that starts in the heading's
+        # column (numbered / indented notes), until a gap
+        regions = []
+        ordered = sorted(blocks, key=lambda b: (b[0].y0, b[0].x0))
+        for rect, text in ordered:
+            if not self.NOTES_HEADING.match(text):
+                continue
+            if any(rect in r for r in regions):
+                continue
+            region = _rect(rect)
+            left, right = rect.x0 - 6, rect.x0 + self.indent
+            for other, _ in ordered:
+                if other.y0 < rect.y0 or not left <= other.x0 < right:
+                    continue
+                if other.y0 - region.y1 > self.max_gap:
+                    break
+                region |= other
+            regions.append(region)
+        return regions
+
+    def _title_region(self, page, blocks):
+        # Title block labels along the right or bottom edge take the whole edge strip;
+        # a label in the body (e.g. "PROJECT NUMBER:" on meeting notes) is just its block
+        labels = [rect for rect, text in blocks if self.TITLE_LABEL.search(text)]
+        if not labels:
+            return []
+        page_rect = page.rect
+        right = [r for r in labels if r.x0 >= page_rect.x1 - page_rect.width * self.edge]
+        bottom = [r for r in labels if r.y0 >= page_rect.y1 - page_rect.height * self.edge]
+        if right:
+            x0 = min(r.x0 for r in right) - 6
+            return [_rect(x0, page_rect.y0, page_rect.x1, page_rect.y1)]
+        if bottom:
+            y0 = min(r.y0 for r in bottom) - 6
+            return [_rect(page_rect.x0, y0, page_rect.x1, page_rect.y1)]
+        return labels
+
+    def find(self, page):
+        # [(kind, rect)] in page coordinates; empty when nothing recognizable is on the page
+        blocks = self._blocks(page)
+        found = [("notes", r) for r in self._notes_regions(page, blocks)]
+        found += [("title", r) for r in self._title_region(page, blocks)]
+        return found
+
+    def page_text(self, page, found):
+        # Text of every block inside a region, top to bottom
+        blocks = sorted(self._blocks(page), key=lambda b: (b[0].y0, b[0].x0))
+        return "".join(text for rect, text in blocks if any(rect.intersects(r) for _, r in found))
+
+    # --- templates ---
+    @staticmethod
+    def template_key(page):
+        return (round(page.rect.width), round(page.rect.height), page.rotation)
+
+    def learn(self, page, found):
+        # Remember where this template's regions are (union of every page seen)
+        if not found:
+            return
+        template = self.templates.setdefault(self.template_key(page), {"seen": 0, "rects": {}})
+        template["seen"] += 1
+        width, height = page.rect.width or 1, page.rect.height or 1
+        for kind, rect in found:
+            norm = _rect(rect.x0 / width, rect.y0 / height, rect.x1 / width, rect.y1 / height)
+            old = template["rects"].get(kind)
+            template["rects"][kind] = norm if old is None else old | norm
+
+    def template_rects(self, page):
+        # Page rects to OCR for a page with no text layer, or None for "OCR the whole page"
+        template = self.templates.get(self.template_key(page))
+        if not template or template["seen"] < self.min_seen:
+            return None
+        rects = list(template["rects"].values())
+        if sum(abs(r) for r in rects) > self.max_area:
+            return None
+        width, height = page.rect.width, page.rect.height
+        return [_rect(r.x0 * width, r.y0 * height, r.x1 * width, r.y1 * height) for r in rects]
+
+    def matches(self, text):
+        # Did region OCR actually land on a title block or notes column?
+        return bool(self.TITLE_LABEL.search(text or "")) or any(
+            self.NOTES_HEADING.match(line) for line in (text or "").splitlines())
+
+    # --- whole document ---
+    def extract(self, document, fallback_pages):
+        # Region text per page. Pages with no recognizable regions (no text layer,
+        # or nothing that looks like a title block / notes) keep fallback_pages' text.
+        pages = []
+        for index, page in enumerate(document.fitz_doc):
+            fallback = fallback_pages[index] if index < len(fallback_pages) else ""
+            found = self.find(page)
+            if found:
+                self.learn(page, found)
+                pages.append(self.page_text(page, found))
+            else:
+                pages.append(fallback)
+        return pages
@@ -86,6 +86,21 @@ class BuildingCodeSearcher:
             re.IGNORECASE
         )
 
+        # Standardization patterns, compiled once with the searcher
+        self.fragment_pattern = re.compile(r'\b(INTERNATIONAL\s+BUILDING\s+CODE|IBC)[,\s]+(20\d{2})\b', re.IGNORECASE)
+        compact = lambda m: m.group(0).replace(" ", "").upper()
+        self.replacements = [(re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in [
+            (r'\b2018\s+International\s+Building\s+Code\b', '2018 IBC'),
+            (r'\b2015\s+International\s+Building\s+Code\b', '2015 IBC'),
+            (r'\b2021\s+International\s+Building\s+Code\b', '2021 IBC'),
+            (r'\bNorth\s+Carolina\s+State\s+Building\s+Code\b', '2018 NCBC'),
+            (r'\bNorth\s+Carolina\s+Building\s+Code\b', 'NCBC'),
+            (r'\bNational\s+Design\s+Specification\s+for\s+Wood\s+Construction\b', 'NDS'),
+            (r'\bASCE\s*7[-–]?\d{2}\b', compact),
+            (r'\bACI\s*318[-–]?\d{2}\b', compact),
+            (r'\bAISC\s*360[-–]?\d{2}\b', compact),
+        ]]
+
     def search_codes(self, text):
         matches = [m.group(0) for m in self.pattern.finditer(text)]
         return ', '.join(set(matches)) if matches else None 
@@ -95,28 +110,11 @@ class BuildingCodeSearcher:
             return None
 
         # Fix fragmented phrases
-        code_string = re.sub(
-            r'\b(INTERNATIONAL\s+BUILDING\s+CODE|IBC)[,\s]+(20\d{2})\b',
-            r'\2 IBC',
-            code_string,
-            flags=re.IGNORECASE
-        )
+        code_string = self.fragment_pattern.sub(r'\2 IBC', code_string)
 
         # replacements
-        replacements = {
-            r'\b2018\s+International\s+Building\s+Code\b': '2018 IBC',
-            r'\b2015\s+International\s+Building\s+Code\b': '2015 IBC',
-            r'\b2021\s+International\s+Building\s+Code\b': '2021 IBC',
-            r'\bNorth\s+Carolina\s+State\s+Building\s+Code\b': '2018 NCBC',
-            r'\bNorth\s+Carolina\s+Building\s+Code\b': 'NCBC',
-            r'\bNational\s+Design\s+Specification\s+for\s+Wood\s+Construction\b': 'NDS',
-            r'\bASCE\s*7[-–]?\d{2}\b': lambda m: m.group(0).replace(" ", "").upper(),
-            r'\bACI\s*318[-–]?\d{2}\b': lambda m: m.group(0).replace(" ", "").upper(),
-            r'\bAISC\s*360[-–]?\d{2}\b': lambda m: m.group(0).replace(" ", "").upper(),
-        }
-
-        for pattern, replacement in replacements.items():
-            code_string = re.sub(pattern, replacement, code_string, flags=re.IGNORECASE)
+        for pattern, replacement in self.replacements:
+            code_string = pattern.sub(replacement, code_string)
 
         # Normalize case, split, and deduplicate
         parts = [p.strip().upper() for p in code_string.split(',')]
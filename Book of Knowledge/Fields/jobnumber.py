@@ -1,6 +1,8 @@
 from collections import Counter
 import re
 
+_NON_NUMERIC = re.compile(r"[^\d.]")
+
 class JobNumberSearcher:
     def __init__(self):
         # Step 1: dotted format (22.00.062.02, 19150.000)
@@ -34,6 +36,17 @@ class JobNumberSearcher:
         # 🔹 NEW: helper regex/sets for cleanup
         self.pattern_year_dash = re.compile(r"\b20\d{2}-\d{2,3}\b")  # e.g., 2019-95 / 2020-101
         self.stopwords = {"DATE", "REVISION", "REVISIONS", "SHEET", "SHEETS", "DRAWING", "DRAWINGS"}
+        self.pattern_core = re.compile(r"^(\d{4,6})")
+
+        # Step 4: standalone dotted numbers, no label
+        self.pattern_standalone_dotted = re.compile(r"\b(\d{2,6}(?:\.\d{2,6}){2,3})\b")
+
+        # Cleanup passes used by clean()
+        self.pattern_spaces = re.compile(r"[^\S\r\n]+")
+        self.pattern_digit_comma = re.compile(r"(?<=\d),(?=\d)")
+        self.pattern_broken_dot = re.compile(r"(\d)\s*\.\s*(\d)")
+        self.pattern_broken_dotted = re.compile(r"(\d+)\s*\.\s*(\d+)")
+        self.pattern_snippet = re.compile(r"(PROJECT.{0,100})", re.IGNORECASE)
 
     def _prefer_longest_dotted(self, matches):
         # Prefer job numbers with 2+ dots (like 22.00.092)
@@ -44,7 +57,7 @@ class JobNumberSearcher:
     def _most_frequent_core_short_digits(self, candidates):
         cores = []
         for c in candidates:
-            m = re.match(r"^(\d{4,6})", str(c))
+            m = self.pattern_core.match(str(c))
             if m:
                 cores.append(m.group(1))
         if not cores:
@@ -54,32 +67,43 @@ class JobNumberSearcher:
         best_core, _ = max(counter.items(), key=lambda kv: (kv[1], int(kv[0])))
         return best_core
 
-    def search(self, text):
+    # Helper to numerically compare job numbers
+    @staticmethod
+    def _to_number(val):
+        try:
+            return float(_NON_NUMERIC.sub("", val).replace(".", ""))
+        except:
+            return 0
+
+    def clean(self, text):
         # Clean and normalize whitespace
-        cleaned_text = re.sub(r"[^\S\r\n]+", " ", text)
+        cleaned_text = self.pattern_spaces.sub(" ", text)
         cleaned_text = cleaned_text.replace("\n", " ").replace("\r", " ")
 
         # 🛠️ Fix common formatting errors
         # 1. Turn commas between digits into dots (e.g. 20.00,092 → 20.00.092)
-        cleaned_text = re.sub(r"(?<=\d),(?=\d)", ".", cleaned_text)
+        cleaned_text = self.pattern_digit_comma.sub(".", cleaned_text)
         # 2. Collapse broken dotted numbers
-        cleaned_text = re.sub(r"(\d)\s*\.\s*(\d)", r"\1.\2", cleaned_text)
+        cleaned_text = self.pattern_broken_dot.sub(r"\1.\2", cleaned_text)
         for _ in range(2):
-            cleaned_text = re.sub(r"(\d+)\s*\.\s*(\d+)", r"\1.\2", cleaned_text)
+            cleaned_text = self.pattern_broken_dotted.sub(r"\1.\2", cleaned_text)
+        return cleaned_text
+
+    def search(self, text):
+        cleaned_text = self.clean(text)
 
         # Debug: snippet near PROJECT
-        snippet = re.search(r"(PROJECT.{0,100})", cleaned_text, re.IGNORECASE)
+        snippet = self.pattern_snippet.search(cleaned_text)
         if snippet:
             print("📝 OCR Snippet Near 'PROJECT':", snippet.group(1))
         else:
             print("🚫 No 'PROJECT' snippet found.")
 
-        # Helper to numerically compare job numbers
-        def to_number(val):
-            try:
-                return float(re.sub(r"[^\d.]", "", val).replace(".", ""))
-            except:
-                return 0
+        return self.search_labeled(cleaned_text) or self.search_standalone(cleaned_text)
+
+    # Steps 1-3: numbers that follow a job/project number label (text already cleaned)
+    def search_labeled(self, cleaned_text):
+        to_number = self._to_number
 
         # Step 1: Dotted (unchanged)
         matches = self.pattern_dotted.findall(cleaned_text)
@@ -132,8 +156,12 @@ class JobNumberSearcher:
                 largest = max(filtered, key=to_number)
                 return [largest]
 
-        # Step 4: Raw dotted number fallback (standalone like 22.00.092) (unchanged)
-        fallback_dotted_raw = re.findall(r"\b(\d{2,6}(?:\.\d{2,6}){2,3})\b", cleaned_text)
+        return []
+
+    # Step 4: Raw dotted number fallback (standalone like 22.00.092) (unchanged)
+    def search_standalone(self, cleaned_text):
+        to_number = self._to_number
+        fallback_dotted_raw = self.pattern_standalone_dotted.findall(cleaned_text)
         if fallback_dotted_raw:
             fallback_dotted_raw = self._prefer_longest_dotted(fallback_dotted_raw)
             print("🧩 Standalone fallback dotted numbers:", fallback_dotted_raw)
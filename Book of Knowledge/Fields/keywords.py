@@ -0,0 +1,142 @@
+from collections import deque
+import os
+import re
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+def load_vocabulary(filename):
+    # One entry per line: "CANONICAL NAME" or "CANONICAL NAME | alias | alias".
+    # Blank lines and lines starting with # are ignored.
+    path = filename if os.path.isabs(filename) else os.path.join(DATA_DIR, filename)
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            names = [name.strip() for name in line.split("|") if name.strip()]
+            entries.append((names[0].upper(), names))
+    return entries
+
+class KeywordMatcher:
+    # Aho-Corasick automaton over word tokens. Whitespace and hyphens only separate
+    # tokens, so "CAST-IN-PLACE", "cast in place" and "Cast - in - place" are the same
+    # phrase, and matches always start and end on whole words. Punctuation other than
+    # hyphens is its own token and breaks a phrase. Matching is linear in the text
+    # length no matter how many phrases are loaded.
+    TOKEN = re.compile(r"\w+|[^\w\s-]")
+
+    def __init__(self, entries, plural_variants=False):
+        self.goto = [{}]        # state -> {token: next state}
+        self.fail = [0]
+        self.output = [None]    # state -> (phrase length in tokens, canonical) ending here
+        self.dict_link = [0]    # state -> nearest state down the fail chain with an output
+
+        for canonical, names in entries:
+            for name in names:
+                tokens = self.tokenize(name)
+                variants = self._singular_variants(tokens) if plural_variants else [tokens]
+                for variant in variants:
+                    self._add(variant, canonical)
+        self._build()
+
+        # canonical -> every other canonical phrase found inside it
+        self.contained = {}
+        for canonical, names in entries:
+            inside = set()
+            for name in names:
+                inside.update(c for _, _, c in self._all_matches(self.tokenize(name)))
+            inside.discard(canonical)
+            self.contained[canonical] = inside
+
+    @classmethod
+    def from_file(cls, filename, **options):
+        return cls(load_vocabulary(filename), **options)
+
+    @classmethod
+    def tokenize(cls, text):
+        return cls.TOKEN.findall((text or "").upper())
+
+    # --- automaton construction ---
+    @staticmethod
+    def _singular_variants(tokens):
+        # Every mix of plural/singular for plural-looking words:
+        # DUAL SYSTEMS WITH MOMENT FRAMES -> ... DUAL SYSTEM WITH MOMENT FRAME
+        variants = [[]]
+        for token in tokens:
+            forms = [token]
+            if len(token) > 3 and token.endswith("S") and not token.endswith("SS"):
+                forms.append(token[:-1])
+            variants = [v + [form] for v in variants for form in forms]
+        return variants
+
+    def _add(self, tokens, canonical):
+        if not tokens:
+            return
+        state = 0
+        for token in tokens:
+            nxt = self.goto[state].get(token)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(None)
+                self.dict_link.append(0)
+                self.goto[state][token] = nxt
+            state = nxt
+        # First entry wins if two lines normalize to the same tokens
+        if self.output[state] is None:
+            self.output[state] = (len(tokens), canonical)
+
+    def _build(self):
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and token not in self.goto[f]:
+                    f = self.fail[f]
+                target = self.goto[f].get(token, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                fail_state = self.fail[nxt]
+                self.dict_link[nxt] = fail_state if self.output[fail_state] else self.dict_link[fail_state]
+
+    # --- matching ---
+    def _all_matches(self, tokens):
+        # Every (start, end, canonical) occurrence, overlapping ones included
+        state = 0
+        for i, token in enumerate(tokens):
+            while state and token not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(token, 0)
+            hit = state if self.output[state] else self.dict_link[state]
+            while hit:
+                length, canonical = self.output[hit]
+                yield i + 1 - length, i + 1, canonical
+                hit = self.dict_link[hit]
+
+    def finditer(self, text):
+        # Leftmost-longest, non-overlapping matches as (start token, end token, canonical)
+        best = {}
+        for start, end, canonical in self._all_matches(self.tokenize(text)):
+            if start not in best or end > best[start][0]:
+                best[start] = (end, canonical)
+        position = 0
+        for start in sorted(best):
+            if start < position:
+                continue
+            end, canonical = best[start]
+            yield start, end, canonical
+            position = end
+
+    def findall(self, text):
+        # Canonical names in order of appearance, duplicates removed
+        return list(dict.fromkeys(canonical for _, _, canonical in self.finditer(text)))
+
+    def drop_contained(self, names):
+        # Remove names that are part of a longer name in the same list
+        inside = set()
+        for name in names:
+            inside.update(self.contained.get(name, ()))
+        return [name for name in names if name not in inside]
@@ -0,0 +1,114 @@
+import re
+
+class DesignParameterSearcher:
+    # Numeric design parameters from the design criteria, as plain numbers in one
+    # unit each (the unit is part of the name): spectral accelerations in g, wind
+    # speed in mph, loads in psf. Returns {name: value} for the ones found.
+    #
+    # name -> (label pattern, unit kind, lowest, highest believable value)
+    # Bare symbols ("R", "CD", "SS") only count when followed by ":", "=" or dot leaders
+    # (after a closing bracket if the symbol is in one: "(SDS):"), so a stray "SS 304"
+    # or "R 6\"" isn't read as a parameter.
+    SET = r"(?=\s*[)\]]?\s*(?:[:=]|\.{2,}))"
+    PARAMETERS = {
+        "Ss": (r"\bS[ _]?S\b" + SET, "accel", 0.0, 5.0),
+        "S1": (r"\bS[ _]?1\b" + SET, "accel", 0.0, 3.0),
+        "SDS": (r"\bS[ _]?DS\b" + SET, "accel", 0.0, 4.0),
+        "SD1": (r"\bS[ _]?D1\b" + SET, "accel", 0.0, 2.5),
+        "Vult_mph": (r"\bV[ _]?ULT\b|\bULTIMATE\s+(?:DESIGN\s+)?WIND\s+SPEED\b", "speed", 60.0, 320.0),
+        "Ground_Snow_Load_psf": (r"\bGROUND\s+SNOW\s+LOAD\b(?:\s*,?\s*P[ _]?G\b)?|\bP[ _]?G\b" + SET,
+                                 "pressure", 0.0, 400.0),
+        "Roof_Live_Load_psf": (r"\bROOF\s+LIVE\s+LOAD\b(?:\s*,?\s*L[ _]?R\b)?|\bL[ _]?R\b" + SET,
+                               "pressure", 0.0, 200.0),
+        "R": (r"\bRESPONSE\s+MODIFICATION\s+(?:COEFFICIENT|FACTOR)\b(?:\s*,?\s*\(?R\)?)?|\bR\b(?=\s*(?:=|\.{2,}))",
+              "none", 1.0, 8.0),
+        "Cd": (r"\bDEFLECTION\s+AMPLIFICATION\s+FACTOR\b(?:\s*,?\s*\(?C[ _]?D\)?)?|\bC[ _]?D\b" + SET,
+               "none", 1.0, 8.0),
+        "Omega0": (r"\b(?:SYSTEM\s+)?OVER\s*STRENGTH\s+FACTOR\b(?:\s*,?\s*\(?(?:[\u03a9\u2126]|OMEGA)[ _]?[0O]?\)?)?"
+                   r"|(?:[\u03a9\u2126]|\bOMEGA)[ _]?[0O]?" + SET, "none", 1.0, 3.5),
+        "Ie": (r"\bSEISMIC\s+IMPORTANCE\s+FACTOR\b(?:\s*,?\s*\(?I[ _]?E\)?)?|\bI[ _]?E\b" + SET,
+               "none", 0.8, 1.6),
+    }
+    # Floor live loads are usually a list ("LIVE LOADS: OFFICE 50 PSF, CORRIDORS
+    # 100 PSF"). Only the highest value after the label is kept (100 here), the
+    # one that governs the design; the rest of the list is not stored.
+    LIVE_LOAD = "Floor_Live_Load_psf"
+    LIVE_LABEL = r"(?<!ROOF\s)\b(?:FLOOR\s+)?LIVE\s+LOADS?\b"
+    LIVE_RANGE = (0.0, 2000.0)
+    LIVE_WINDOW = 200
+    LIVE_STOP = re.compile(r"\n\s*\n|\b(?:ROOF|SNOW|WIND|DEAD|SEISMIC)\b", re.IGNORECASE)
+
+    NAMES = list(PARAMETERS) + [LIVE_LOAD]
+
+    UNITS = {
+        "accel": r"%\s*G\b|%|G\b",
+        "speed": r"M\.?P\.?H\.?|M/SEC\b|M/S\b|KM/HR?\b|KPH\b",
+        "pressure": r"PSF\b|LBS?/SQ\.?\s*FT\b|LBS?/(?:FT2|FT\u00b2|SF)\b|KPA\b|KN/M2\b|KN/M\u00b2",
+        "none": None,
+    }
+    # Unit (lowercase, no spaces or dots) -> factor to the unit in the name
+    FACTORS = {
+        "%g": 0.01, "%": 0.01, "g": 1.0,
+        "mph": 1.0, "m/s": 2.23694, "m/sec": 2.23694, "km/h": 0.621371, "km/hr": 0.621371, "kph": 0.621371,
+        "psf": 1.0, "kpa": 20.8854, "kn/m2": 20.8854, "kn/m\u00b2": 20.8854,
+    }
+    DEFAULT_UNITS = {"accel": "g", "speed": "mph", "pressure": "psf", "none": ""}
+
+    NUMBER = r"\d+(?:\.\d+)?|\.\d+"
+    # Between label and value: the ")" or "]" closing a bracketed label ("(VULT):"),
+    # "(VULT)", dot leaders, then ":", "=" or a dash
+    SEPARATOR = r"(?:\s*[)\]])?(?:\s*\([^)\n]{0,40}\)|\s*\.{2,})*\s*[:=\u2013\-,]?\s*"
+    # "R = 6" but not "R = 6\"" or "R = 6 FT"
+    NOT_LENGTH = r"(?!\s*(?:\"|'|IN\b|FT\b|MM\b))"
+
+    def __init__(self):
+        # One pass over the text for every parameter: each is a named alternative
+        alternatives = []
+        for name, (label, kind, _, _) in self.PARAMETERS.items():
+            unit = self.UNITS[kind]
+            value = f"(?P<{name}_value>{self.NUMBER}){self.NOT_LENGTH}"
+            unit = rf"\s*(?P<{name}_unit>{unit})?" if unit else ""
+            alternatives.append(f"(?P<{name}>(?:{label}){self.SEPARATOR}{value}{unit})")
+        alternatives.append(f"(?P<{self.LIVE_LOAD}>{self.LIVE_LABEL})")
+        # The leading character class (first letters of every label) lets the regex
+        # engine skip most positions without trying each alternative
+        self.pattern = re.compile("(?=[CDFGILOPRSUV\u03a9\u2126])(?:" + "|".join(alternatives) + ")",
+                                  re.IGNORECASE)
+        self.live_value = re.compile(rf"({self.NUMBER})\s*({self.UNITS['pressure']})", re.IGNORECASE)
+
+    def to_number(self, value, unit, kind):
+        unit = re.sub(r"[\s.]", "", (unit or self.DEFAULT_UNITS[kind]).lower())
+        unit = unit.replace("lbs", "lb").replace("lb/sqft", "psf").replace("lb/ft2", "psf") \
+                   .replace("lb/ft\u00b2", "psf").replace("lb/sf", "psf")
+        return round(float(value) * self.FACTORS.get(unit, 1.0), 3)
+
+    def _live_load(self, text, end):
+        # The list ends at a blank line, another load type or the next parameter
+        window = text[end:end + self.LIVE_WINDOW]
+        for pattern in (self.LIVE_STOP, self.pattern):
+            stop = pattern.search(window)
+            if stop:
+                window = window[:stop.start()]
+        low, high = self.LIVE_RANGE
+        values = [self.to_number(value, unit, "pressure") for value, unit in self.live_value.findall(window)]
+        values = [v for v in values if low <= v <= high]
+        return max(values) if values else None
+
+    def search(self, text):
+        found = {}
+        for match in self.pattern.finditer(text or ""):
+            name = match.lastgroup
+            if name in found:
+                continue
+            if name == self.LIVE_LOAD:
+                value = self._live_load(text, match.end())
+            else:
+                _, kind, low, high = self.PARAMETERS[name]
+                unit = match.groupdict().get(f"{name}_unit")
+                value = self.to_number(match.group(f"{name}_value"), unit, kind)
+                if not low <= value <= high:
+                    value = None
+            if value is not None:
+                found[name] = value
+        # Same order every time, whatever order the notes list them in
+        return {name: found[name] for name in self.NAMES if name in found}
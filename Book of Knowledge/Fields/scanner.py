@@ -0,0 +1,202 @@
+from Fields.seismicdesign import SeismicDesignCategorySearcher
+from Fields.seismicresistance import SeismicResistanceSearcher
+from Fields.riskcategory import RiskCategorySearcher
+from Fields.designcode import BuildingCodeSearcher
+from Fields.siteclass import SiteClassSearcher
+from Fields.windspeed import WindSpeedSearcher
+from Fields.jobnumber import JobNumberSearcher
+from Fields.materials import MaterialsSearcher
+from Fields.parameters import DesignParameterSearcher
+from Datahandler.metrics import timed
+import string
+import re
+
+# ASCII-only uppercase keeps string length (and so every offset) unchanged
+_UPPER = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+
+class FieldScanner:
+    # Anchor labels, found together in ONE case-sensitive pass over an uppercased
+    # copy of the text. Each is a lookahead so overlapping anchors are all reported;
+    # at any one position the first alternative that matches wins, so no two
+    # alternatives may start on the same text.
+    ANCHORS = [
+        ("site", r"\bSITE\s+CLASS\b"),
+        ("risk", r"\b(?:SEISMIC\s+)?RISK\s+CATEGORY\b"),
+        ("sdc", r"\bSEISMIC\s+DESIGN\s+CATEGORY"),
+        ("job", r"\b(?:B\s*&\s*P\s*JOB\s*NUMBER|PROJECT\s*NUMBER|PROJECT\s*NO)"),
+        ("mph", r"M\.?P\.?H"),
+        # Every design code alternative contains one of these
+        ("code", r"\b(?:BUILDING\s+CODE|RESIDENTIAL\s+CODE|MASONRY\s+CODE|IBC|UBC|CBC|FBC|IRC|NYBC|NYC"
+                 r"|ASCE|CIVIL\s+ENGINEERS|ACI|CONCRETE\s+INSTITUTE|AISC|STEEL\s+CONSTRUCTION|AISI|TMS"
+                 r"|NDS|NATIONAL\s+DESIGN|AWS|WELDING\s+SOCIETY|AASHTO|NFPA|FIRE\s+PROTECTION"
+                 r"|BS\s*8110|BRITISH\s+STANDARD)"),
+    ]
+
+    # How far around an anchor a field's detailed pattern may reach (characters)
+    WINDOWS = {
+        "job": (0, 60),
+        "mph": (120, 2),
+        "code": (120, 120),
+    }
+
+    def __init__(self):
+        self.code_searcher = BuildingCodeSearcher()
+        self.risk_searcher = RiskCategorySearcher()
+        self.site_searcher = SiteClassSearcher()
+        self.seismic_searcher = SeismicDesignCategorySearcher()
+        self.seismicR_searcher = SeismicResistanceSearcher()
+        self.wind_searcher = WindSpeedSearcher()
+        self.jobnumber_searcher = JobNumberSearcher()
+        self.materials_searcher = MaterialsSearcher()
+        self.parameter_searcher = DesignParameterSearcher()
+
+        # The leading character class (first letters of every anchor) lets the regex
+        # engine skip most positions without trying each alternative
+        self.anchor_pattern = re.compile(
+            "(?=[ABCFIMNPRSTUW])(?="
+            + "|".join(f"(?P<{name}>{pattern})" for name, pattern in self.ANCHORS)
+            + ")"
+        )
+
+    # --- text helpers ---
+    @staticmethod
+    def normalize(text):
+        # The one normalization pass: collapse runs of spaces/tabs, keep line breaks.
+        # It is the same first step MaterialsSearcher and JobNumberSearcher take, and
+        # every other searcher matches whitespace with \s, so results don't change.
+        return re.sub(r"[^\S\r\n]+", " ", text or "")
+
+    def find_anchors(self, text):
+        anchors = {name: [] for name, _ in self.ANCHORS}
+        for m in self.anchor_pattern.finditer(text.translate(_UPPER)):
+            name = m.lastgroup
+            anchors[name].append((m.start(), m.end(name)))
+        return anchors
+
+    @staticmethod
+    def _snap_back(text, pos):
+        # Move back to just after whitespace so a window never starts mid-word
+        if pos <= 0:
+            return 0
+        while pos > 0 and not text[pos - 1].isspace():
+            pos -= 1
+        return pos
+
+    @staticmethod
+    def _snap_forward(text, pos):
+        # Move forward to whitespace so a window never ends mid-word
+        n = len(text)
+        while pos < n and not text[pos].isspace():
+            pos += 1
+        return min(pos, n)
+
+    def regions(self, text, hits, before, after):
+        # Merge the windows around each anchor hit into non-overlapping (start, end) spans
+        spans = []
+        for start, end in hits:
+            lo = self._snap_back(text, start - before) if before else start
+            hi = self._snap_forward(text, end + after)
+            if spans and lo <= spans[-1][1]:
+                spans[-1] = (spans[-1][0], max(spans[-1][1], hi))
+            else:
+                spans.append((lo, hi))
+        return spans
+
+    @staticmethod
+    def _anchored_matches(pattern, text, hits):
+        # Same matches as pattern.finditer(text) for patterns that can only start on
+        # an anchor: try each anchor in order, skipping ones inside the last match
+        last_end = -1
+        for start, _ in hits:
+            if start < last_end:
+                continue
+            m = pattern.match(text, start)
+            if m:
+                last_end = m.end()
+                yield m
+
+    # --- per-field scanners (same results as the matching Searcher.search) ---
+    def _site_class(self, text, anchors):
+        matches = [m.group(1) for m in self._anchored_matches(self.site_searcher.pattern, text, anchors["site"])]
+        valid_classes = {'A', 'B', 'C', 'D', 'E', 'F'}
+        filtered = [m.upper() for m in matches if m.upper() in valid_classes]
+        return ', '.join(sorted(set(filtered))) if filtered else None
+
+    def _risk_category(self, text, anchors):
+        matches = [m.group(1) for m in self._anchored_matches(self.risk_searcher.pattern, text, anchors["risk"])]
+        valid_roman = {'I', 'II', 'III', 'IV'}
+        valid_numeric = {'1', '2', '3', '4'}
+        filtered = [m.upper() for m in matches if m.upper() in valid_roman or m in valid_numeric]
+        return ', '.join(sorted(set(filtered))) if filtered else None
+
+    def _seismic_design_category(self, text, anchors):
+        for pattern in self.seismic_searcher.patterns:
+            for start, _ in anchors["sdc"]:
+                match = pattern.match(text, start)
+                if match:
+                    return match.group(1).upper()
+        return None
+
+    def _wind_speed(self, text, anchors):
+        before, after = self.WINDOWS["mph"]
+        # Labeled speed first, then any "### mph"; both always end on an mph anchor
+        for pattern, lead in zip(self.wind_searcher.patterns, (before, 12)):
+            for start, end in anchors["mph"]:
+                match = pattern.search(text, max(0, start - lead), min(len(text), end + after))
+                if match:
+                    return f"{match.group(1)} mph"
+        return None
+
+    def _job_number(self, text, anchors):
+        searcher = self.jobnumber_searcher
+        before, after = self.WINDOWS["job"]
+        spans = self.regions(text, anchors["job"], before, after)
+        if spans:
+            labeled_text = " ".join(searcher.clean(text[lo:hi]) for lo, hi in spans)
+            found = searcher.search_labeled(labeled_text)
+            if found:
+                return found
+        # Standalone dotted numbers can be anywhere, so this fallback needs the whole text
+        return searcher.search_standalone(searcher.clean(text))
+
+    def _design_codes(self, text, anchors):
+        before, after = self.WINDOWS["code"]
+        pattern = self.code_searcher.pattern
+        matches = []
+        for lo, hi in self.regions(text, anchors["code"], before, after):
+            matches.extend(m.group(0) for m in pattern.finditer(text, lo, hi))
+        return ', '.join(set(matches)) if matches else None
+
+    # Keyword fields are already a single linear pass (Aho-Corasick), no anchors needed
+    def _seismic_resistance(self, text):
+        return self.seismicR_searcher.search(text)
+
+    def _materials(self, text):
+        return self.materials_searcher.search(text)
+
+    # Numeric parameters: one combined pattern, one pass
+    def _design_parameters(self, text):
+        return self.parameter_searcher.search(text)
+
+    # --- public ---
+    def scan(self, text):
+        with timed("search.anchors"):
+            text = self.normalize(text)
+            anchors = self.find_anchors(text)
+
+        fields = {
+            "Job_Number": lambda: self._job_number(text, anchors),
+            "Design_Codes": lambda: self.code_searcher.standardize_design_codes(self._design_codes(text, anchors)),
+            "Materials": lambda: self._materials(text),
+            "Seismic_Resistance_System": lambda: self._seismic_resistance(text),
+            "Risk_Category": lambda: self.risk_searcher.standardize(self._risk_category(text, anchors)),
+            "Site_Class": lambda: self.site_searcher.standardize(self._site_class(text, anchors)),
+            "Seismic_Design_Category": lambda: self._seismic_design_category(text, anchors),
+            "Wind_Speed": lambda: self._wind_speed(text, anchors),
+            "Design_Parameters": lambda: self._design_parameters(text),
+        }
+        results = {}
+        for name, run in fields.items():
+            with timed(f"search.{name}"):
+                results[name] = run()
+        return results
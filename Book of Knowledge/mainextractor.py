@@ -1,30 +1,214 @@
-from Fields.seismicdesign import SeismicDesignCategorySearcher  # For searching seismic design categories
-from Fields.seismicresistance import SeismicResistanceSearcher  # For searching seismic resistance systems
-from Fields.riskcategory import RiskCategorySearcher            # For searching risk categories
-from Fields.designcode import BuildingCodeSearcher              # For searching engineering codes
-from Fields.siteclass import SiteClassSearcher                  # For searching site classes
-from Fields.windspeed import WindSpeedSearcher                  # For searching wind speeds
-from Fields.jobnumber import JobNumberSearcher                  # For searching job numbers
-from Fields.materials import MaterialsSearcher                  # For searching materials
+from Fields.scanner import FieldScanner                          # For single-pass field scanning
 from Fields.alldata import AllDataExtractor                     # For extracting all raw data 
 
 from Datahandler.txtseperator import PageDumpWriter             # Sepreates pages in txt file
 from Extractor.extractor import TextExtractor                   # For extracting text from PDF files
-from Datahandler.csvwriter import CSVHandler                    # For writing to CSV
-
-from multiprocessing import Pool, cpu_count                     # For Multi Processing
+from Extractor.document import Document                         # Reads/parses each PDF once for every extractor
+from Extractor.ocrengine import get_engine                      # For loading the OCR engine once per worker
+from Extractor import backends                                  # For importing PDF/OCR libraries on first use
+from Extractor.quality import TextQualityScorer                 # For scoring extracted text in cascade mode
+from Extractor.merge import PageMerger                          # For merging extractor outputs page by page
+from Extractor.mirror import MirrorFixer                        # For flipping back-to-front (mirrored) text
+from Extractor.regions import RegionFinder                      # For title block / general notes regions
+from Datahandler.extractcache import ExtractionCache            # For skipping extraction on unchanged PDFs
+from Datahandler.manifest import FolderManifest                 # For incremental folder sync
+from Datahandler.csvwriter import CSVHandler                    # For clearing old CSV output
+from Datahandler.sinks import open_sinks                        # For writing results (CSV, SQLite, Parquet)
+from Datahandler import metrics                                 # For per-stage timing of each document
+from Datahandler.pageindex import PageIndex                     # For the searchable page index
+from Datahandler.workerpool import SupervisedPool, TaskTimeout  # For time budgets and worker recycling
+from Datahandler import workerpool                              # For reporting which extractor is running
+
+from multiprocessing import cpu_count                           # For Multi Processing
+import multiprocessing                                          # For choosing how workers start
 from datetime import datetime                                   # For timestamping the output file 
 from time import time                                           # For timing the execution
+import queue                                                    # For collecting scheduled pool results
 
-import pytesseract                                              # For OCR                                 
 import os                                                       # For file operations
 
 # === CONFIGURATION ===
 TESSERACT_PATH = r"C:\\Program Files\\Tesseract-OCR\\tesseract.exe"
-pytesseract.pytesseract.tesseract_cmd = TESSERACT_PATH
+# Applied when pytesseract is first imported (the first OCR'd page), not at startup
+backends.on_load("pytesseract", lambda module: setattr(module.pytesseract, "tesseract_cmd", TESSERACT_PATH))
+
+# Cascade mode runs the cheap text-layer extractors first and stops at the first
+# one whose text scores at or above CASCADE_THRESHOLD (0-1). Set to False to run
+# every extractor (and OCR) on every PDF like before. A text stage that scores
+# lower is still accepted when every page has a text layer and at least
+# CASCADE_MIN_WORD_RATIO of its words read as real words: short notes sheets
+# without the usual labels can't reach the threshold, but OCR wouldn't do better.
+CASCADE_MODE = True
+CASCADE_THRESHOLD = 0.6
+CASCADE_MIN_WORD_RATIO = 0.8
+
+# "hybrid" only rasterizes + OCRs pages without a usable text layer,
+# "full" OCRs every page of the PDF
+OCR_MODE = "hybrid"
+
+# "pytesseract" starts a tesseract process per page; "tesserocr" (pip install tesserocr)
+# keeps one Tesseract API loaded per worker and is much faster on many pages
+OCR_ENGINE = "pytesseract"
+
+# OCR renders one page at a time. Pages bigger than OCR_MAX_PIXELS (grayscale
+# bytes) are rendered at a lower DPI so a huge drawing sheet can't blow up memory.
+OCR_MAX_PIXELS = 40_000_000
+
+# Adaptive OCR: each page is first read at OCR_LOW_DPI with an Otsu threshold, and
+# only pages whose Tesseract word confidence is below OCR_MIN_CONFIDENCE are read
+# again at OCR_HIGH_DPI, deskewed and adaptively thresholded. Clean scans get
+# cheaper, faint ones more readable; each page's confidence goes into the metrics.
+# False reads every page once at 150 dpi with a fixed threshold.
+OCR_ADAPTIVE = True
+OCR_LOW_DPI = 100
+OCR_HIGH_DPI = 300
+OCR_MIN_CONFIDENCE = 70
+
+# Memory ceiling per pool worker in MB. When set, the number of workers is picked
+# from available RAM (never more than the CPU count); None keeps min(8, cpu_count()).
+WORKER_MEMORY_MB = None
+
+# Worker startup. PDF and OCR libraries are imported the first time a PDF needs
+# them (see Extractor/backends.py), except those of the extractors listed in
+# WORKER_PRELOAD ("pymupdf", "pdfplumber", "pdfminer", "ocr"), which every worker
+# imports before its first PDF. START_METHOD = "forkserver" (Linux/macOS) imports
+# them once in a server process and starts every worker as a copy of it; Windows
+# only has "spawn", where each worker imports them itself. None = platform default.
+# Compare the options on your machine with: python Benchmarks/startup.py
+WORKER_PRELOAD = ["pymupdf"]
+START_METHOD = "forkserver"
+
+# Time budgets in seconds (None = no limit), enforced by the pool from outside the
+# worker: a PDF gets DOCUMENT_TIMEOUT in all and each extractor its
+# EXTRACTOR_TIMEOUTS budget. An extractor past its budget gets its worker killed
+# and replaced, and the PDF runs again without it, so the next extractor in line
+# takes over; a PDF past DOCUMENT_TIMEOUT is recorded as timed out and skipped
+# (sync mode retries it next run). One OCR page task gets OCR_PAGE_TIMEOUT.
+# Workers are replaced after WORKER_MAX_TASKS tasks, or after a task that leaves
+# them above WORKER_MAX_RSS_MB of memory.
+DOCUMENT_TIMEOUT = 600
+EXTRACTOR_TIMEOUTS = {"pymupdf": 60, "pdfplumber": 120, "pdfminer": 120, "ocr": None}
+OCR_PAGE_TIMEOUT = 120
+WORKER_MAX_TASKS = 200
+WORKER_MAX_RSS_MB = 1500
+
+# Merge the extractors' output page by page into one consensus text (filling in
+# lines only some extractors found) instead of joining every extractor's full text.
+# Field searchers then see each page once, whichever extractors succeeded.
+MERGE_PAGES = True
+
+# Lines that come out of an extractor back to front (mirrored title blocks,
+# "REBMUN TCEJORP") are detected with a word list (helped by the lines PyMuPDF
+# reports as mirrored) and flipped right after each extractor runs, so cascade
+# scoring and field search see readable text.
+MIRROR_FIX = True
+
+# Layout-aware mode: fields are searched in the sheet title block and the
+# "GENERAL NOTES" / "DESIGN CRITERIA" column only (found from PyMuPDF block
+# positions), which cuts false matches from plan callouts. Each worker remembers
+# where those regions sit per page size, and scanned pages of a known layout are
+# OCR'd region by region at REGION_OCR_DPI instead of as a whole page.
+# REGION_FALLBACK searches the full text for any field the regions didn't have.
+REGION_MODE = False
+REGION_OCR_DPI = 200
+REGION_FALLBACK = True
+
+# The fused scanner normalizes the text once, finds every field's anchor label in
+# one pass and only runs each field's detailed pattern around its anchors. It gives
+# the same fields as the individual searchers (FUSED_FIELD_SCAN = False).
+FUSED_FIELD_SCAN = True
+
+# Extracted per-page text is cached on disk, keyed by the PDF content and the
+# extraction settings above, so re-runs only re-run the field searchers.
+# Set CACHE_CLEAR = True for one run after changing an extractor by hand.
+CACHE_ENABLED = True
+CACHE_DIR = "Cache"
+CACHE_MAX_MB = 500
+CACHE_CLEAR = False
+
+# Incremental sync mode (non-interactive): keeps a manifest of every PDF's size,
+# mtime and content hash, only processes new or modified PDFs, updates their CSV
+# rows in place and removes rows for PDFs that were deleted from input_folder.
+SYNC_MODE = False
+
+# Results stream back from the pool as each PDF finishes; CSV rows are written
+# CSV_BATCH_SIZE at a time through one open file.
+CSV_BATCH_SIZE = 20
+
+# Where results go: any of "csv", "sqlite" and "parquet" (needs pyarrow). SQLite
+# keeps one row per PDF (keyed on its SHA-256) with indexed columns plus a child
+# table per multi-valued field (job_numbers, design_codes, materials,
+# seismic_systems); Parquet writes one part file per batch into PARQUET_DIR.
+OUTPUT_SINKS = ["csv", "sqlite"]
+SQLITE_PATH = os.path.join("CSV_Result", "meeting_notes.db")
+PARQUET_DIR = os.path.join("CSV_Result", "parquet")
+
+# Scheduling: PDFs are looked at biggest file first, each one checked for how many
+# pages will need OCR and then run straight away. A PDF with at least
+# PAGE_OCR_MIN_PAGES OCR pages gets those pages OCR'd as separate pool tasks (spread
+# over all workers), and its own task, which puts the pages back in order, goes to
+# the front of the queue once they are done. An OCR page counts OCR_PAGE_COST times
+# a text page in a plan's cost estimate. False runs whole PDFs in folder order.
+PAGE_SCHEDULING = True
+PAGE_OCR_MIN_PAGES = 2
+OCR_PAGE_COST = 20
+
+# Per-document stage timings (extractors, rasterization, Tesseract, each field
+# searcher, dump writes) plus page count, bytes and cache/cascade decisions are
+# appended as JSON lines to METRICS_DIR; the run ends with p50/p95 per stage.
+METRICS_ENABLED = True
+METRICS_DIR = "Metrics"
+
+# Every processed page goes into a SQLite full-text index (INDEX_PATH) with its
+# file, page number, extractor and job number; search it with search.py.
+# Documents are written INDEX_BATCH_SIZE at a time, one transaction per batch.
+INDEX_ENABLED = True
+INDEX_PATH = os.path.join("Index", "pages.db")
+INDEX_BATCH_SIZE = 50
+
+_cache = None
+_field_scanner = None
+_mirror_fixer = None
+_region_finder = None
+
+def get_region_finder():
+    # Learned region positions live as long as the worker process
+    global _region_finder
+    if _region_finder is None:
+        _region_finder = RegionFinder()
+    return _region_finder
+
+def get_mirror_fixer():
+    # Word list loaded once per process
+    global _mirror_fixer
+    if _mirror_fixer is None:
+        _mirror_fixer = MirrorFixer()
+    return _mirror_fixer
+
+def get_field_scanner():
+    # Builds the eight searchers (and compiles every pattern) once per process.
+    # The FieldScanner holds them, so the legacy per-searcher path reuses them too.
+    global _field_scanner
+    if _field_scanner is None:
+        _field_scanner = FieldScanner()
+    return _field_scanner
+
+def get_cache():
+    global _cache
+    if CACHE_ENABLED and _cache is None:
+        _cache = ExtractionCache(CACHE_DIR, CACHE_MAX_MB)
+    return _cache
 
 # === FIELD SEARCHING ===
-def search_engineering_fields(full_pdf_text):
+def search_engineering_fields(full_pdf_text, fused: bool = FUSED_FIELD_SCAN):
+    if fused:
+        fields = get_field_scanner().scan(full_pdf_text)
+        print("--------------------------------")
+        for name, value in fields.items():
+            print(f"🎯 {name.replace('_', ' ')}:", value)
+        print("🎯 All data:", "See txt files in results folder")
+        return fields
+
     def try_search(searcher, method='search', standardize_method='standardize',
                    bad_values=None):
         search_method = getattr(searcher, method)
@@ -50,25 +234,29 @@ def search_engineering_fields(full_pdf_text):
                 return {str(x).upper()}
             return not to_upstrings(val).isdisjoint({b.upper() for b in bad_values})
 
-        raw = search_method(primary_text)
-        if is_bad(raw) and secondary_text:
-            raw = search_method(secondary_text)
+        with metrics.timed(f"search.{type(searcher).__name__}"):
+            raw = search_method(primary_text)
+            if is_bad(raw) and secondary_text:
+                raw = search_method(secondary_text)
 
         return standardize(raw)
 
-    # Initialize searchers
-    code_searcher = BuildingCodeSearcher()
-    risk_searcher = RiskCategorySearcher()
-    site_searcher = SiteClassSearcher()
-    seismic_searcher = SeismicDesignCategorySearcher()
-    seismicR_searcher = SeismicResistanceSearcher()
-    wind_searcher = WindSpeedSearcher()
-    jobnumber_searcher = JobNumberSearcher()
-    materials_searcher = MaterialsSearcher()
+    # Searchers are built once per process (see get_field_scanner)
+    scanner = get_field_scanner()
+    code_searcher = scanner.code_searcher
+    risk_searcher = scanner.risk_searcher
+    site_searcher = scanner.site_searcher
+    seismic_searcher = scanner.seismic_searcher
+    seismicR_searcher = scanner.seismicR_searcher
+    wind_searcher = scanner.wind_searcher
+    jobnumber_searcher = scanner.jobnumber_searcher
+    materials_searcher = scanner.materials_searcher
+    parameter_searcher = scanner.parameter_searcher
 
     # Perform extraction from full PDF only
-    design_codes = code_searcher.search_codes(full_pdf_text)
-    standardized_codes = code_searcher.standardize_design_codes(design_codes)
+    with metrics.timed(f"search.{type(code_searcher).__name__}"):
+        design_codes = code_searcher.search_codes(full_pdf_text)
+        standardized_codes = code_searcher.standardize_design_codes(design_codes)
 
     risk_category = try_search(risk_searcher)
     site_class = try_search(site_searcher)
@@ -81,6 +269,9 @@ def search_engineering_fields(full_pdf_text):
 
     materials = try_search(materials_searcher, standardize_method=None)
 
+    # Ss, S1, SDS, SD1, Vult, snow / live loads, R, Cd, Omega0, Ie as numbers
+    design_parameters = try_search(parameter_searcher, standardize_method=None)
+
     print("--------------------------------")
     print("🎯 Raw job number:", job_number)
     print("🎯 Raw design codes:", design_codes)
@@ -90,6 +281,7 @@ def search_engineering_fields(full_pdf_text):
     print("🎯 Raw site class:", site_class)
     print("🎯 Raw seismic design category:", seismic_design_category)
     print("🎯 Raw wind speed:", wind_speed)
+    print("🎯 Raw design parameters:", design_parameters)
     print("🎯 Raw all data:", "See txt files in results folder")
 
     # Build fields dict with standardized codes
@@ -102,75 +294,531 @@ def search_engineering_fields(full_pdf_text):
         "Site_Class": site_class,
         "Seismic_Design_Category": seismic_design_category,
         "Wind_Speed": wind_speed,
+        "Design_Parameters": design_parameters,
     }
 
     return fields
 
 # === SMART TEXT EXTRACTION ===
-def extract_text_smart(pdf_path, return_raw: bool = False):
-    text_parts = []
+def _run_extractor(name, extractor, document, mirror_fix=MIRROR_FIX):
+    workerpool.stage(name)  # starts this extractor's time budget
+    try:
+        with metrics.timed(f"extract.{name}"):
+            text = extractor(document)
+        if isinstance(text, list):
+            text = "\n".join([t for t in text if t])
+        if mirror_fix and document.pages.get(name):
+            with metrics.timed("mirror_fix"):
+                fixed, flipped = get_mirror_fixer().fix_pages(document.pages[name], document.mirrored_lines)
+            if flipped:
+                document.pages[name] = fixed
+                text = TextExtractor._normalize_space("\n".join(fixed))
+                print(f"🪞 {name}: flipped {flipped} back-to-front line(s)")
+                doc_info = metrics.current().info
+                doc_info["mirrored_lines"] = doc_info.get("mirrored_lines", 0) + flipped
+        char_count = len((text or "").strip())
+        print(f"📝 {name} extracted {char_count} characters")
+        return text or ""
+    except Exception as e:
+        print(f"❌ Extractor {name} failed: {e}")
+        return ""
+    finally:
+        workerpool.stage(None)
 
-    extractors = [
-        TextExtractor.extract_with_pdfplumber,             # list[str] or str depending on impl
-        TextExtractor.extract_with_pymupdf,                # str
-        TextExtractor.extract_with_pdfminer,               # str
-        lambda p: TextExtractor.extract_with_ocr_fast(p),  # str (OCR fallback)
-    ]
+def _extract_document(document, cascade, threshold, ocr_mode, merge=MERGE_PAGES, ocr_pages=None,
+                      mirror_fix=MIRROR_FIX, regions=REGION_MODE, skip=()):
+    text_parts = []
 
-    for extractor in extractors:
-        try:
-            text = extractor(pdf_path)
-            if isinstance(text, list):
-                text = "\n".join([t for t in text if t])
-            name = getattr(extractor, "__name__", "extractor")
-            char_count = len((text or "").strip())
-            print(f"📝 {name} extracted {char_count} characters")
+    ocr_options = {"max_pixels": OCR_MAX_PIXELS, "engine": OCR_ENGINE, "ocr_pages": ocr_pages,
+                   **_adaptive_options()}
+    if ocr_mode == "hybrid":
+        ocr_extractor = TextExtractor.extract_with_hybrid_ocr
+        if regions:
+            ocr_options.update(regions=get_region_finder(), region_dpi=REGION_OCR_DPI)
+    else:
+        ocr_extractor = TextExtractor.extract_with_ocr_fast
+    # Only OCRs the pages without a usable text layer (used after the text layer passes)
+    page_ocr = lambda d: TextExtractor.extract_with_hybrid_ocr(d, **ocr_options)
+
+    extractors = {
+        "pdfplumber": TextExtractor.extract_with_pdfplumber,       # list[str] or str depending on impl
+        "pymupdf": TextExtractor.extract_with_pymupdf,             # str
+        "pdfminer": TextExtractor.extract_with_pdfminer,           # str
+        "ocr": lambda d: ocr_extractor(d, **ocr_options),  # str (OCR fallback)
+    }
+    for name in skip:
+        # Ran past its time budget on an earlier attempt at this PDF
+        print(f"⏰ Skipping {name} (ran past its {EXTRACTOR_TIMEOUTS.get(name)} s budget last time)")
+        extractors.pop(name, None)
+
+    if cascade:
+        # Cheapest first; OCR only runs if every text layer scores too low
+        order = [name for name in ["pymupdf", "pdfplumber", "pdfminer", "ocr"] if name in extractors]
+        scorer = TextQualityScorer()
+        page_count = TextExtractor.page_count(document)
+        stage, score = None, 0.0
+        flagged = None  # pages without a usable text layer, worked out when first needed
+        for name in order:
+            text = _run_extractor(name, extractors[name], document, mirror_fix)
+            if text:
+                text_parts.append(text)
+            stage = name
+            score = scorer.score(text, page_count)
+            print(f"📊 {name} quality score: {score:.2f} (threshold {threshold:.2f})")
+            metrics.current().info.setdefault("cascade_scores", {})[name] = round(score, 3)
+            if score >= threshold:
+                break
+            if name != "ocr" and text:
+                if flagged is None:
+                    flagged = _pages_needing_ocr(document, document.pages.get("pymupdf"))
+                if _layer_covers(scorer, text, flagged):
+                    print(f"📄 Every page has a text layer and {name} reads as real words; accepting it")
+                    metrics.current().info["accepted_on_coverage"] = name
+                    break
+        else:
+            print("⚠️ No extractor reached the quality threshold; using everything collected")
+        if stage != "ocr" and "ocr" in extractors:
+            # The document scored well enough, but scanned pages inside it still need OCR
+            if flagged is None:
+                flagged = _pages_needing_ocr(document, document.pages.get("pymupdf"))
+            if flagged:
+                print(f"🔍 {len(flagged)} page(s) have no usable text layer; OCR'ing just those")
+                text = _run_extractor("ocr", page_ocr, document, mirror_fix)
+                if text:
+                    text_parts.append(text)
+                stage = f"{stage}+ocr"
+                metrics.current().info["ocr_pages"] = len(flagged)
+    else:
+        stage, score = "all", None
+        for name, extractor in extractors.items():
+            text = _run_extractor(name, extractor, document, mirror_fix)
             if text:
                 text_parts.append(text)
-        except Exception as e:
-            name = getattr(extractor, "__name__", "extractor")
-            print(f"❌ Extractor {name} failed: {e}")
 
-    # Combine all extractor outputs (no mirrored-text fixing)
-    combined_text = "\n".join([t for t in text_parts if t]) if text_parts else ""
+    if merge and document.pages:
+        with metrics.timed("merge"):
+            merged = PageMerger().merge(document.pages)
+        document.pages["merged"] = merged
+        combined_text = "\n".join([p for p in merged if p])
+        print(f"🧩 Merged {len(document.pages) - 1} extractor(s): {len(combined_text)} of "
+              f"{sum(len(t) for t in text_parts)} characters kept")
+    else:
+        # Combine all extractor outputs (no mirrored-text fixing)
+        combined_text = "\n".join([t for t in text_parts if t]) if text_parts else ""
+
+    if regions:
+        with metrics.timed("regions"):
+            region_pages = get_region_finder().extract(document, document.best_pages())
+            if mirror_fix:
+                region_pages = get_mirror_fixer().fix_pages(region_pages, document.mirrored_lines)[0]
+        document.pages["regions"] = region_pages
+    return combined_text, stage, score
+
+def _pages_needing_ocr(document, layer=None):
+    # Indexes of the pages whose text layer is missing or mostly a scanned image
+    return [i for i, page in enumerate(document.fitz_doc)
+            if TextExtractor._page_needs_ocr(page, layer[i] if layer else page.get_text() or "")]
+
+def _layer_covers(scorer, text, flagged, min_word_ratio=CASCADE_MIN_WORD_RATIO):
+    # Every page has a text layer and it reads as real words: good enough without OCR
+    return not flagged and scorer.word_ratio(text) >= min_word_ratio
+
+def _adaptive_options():
+    # Resolution / confidence settings shared by the OCR extractors and page tasks
+    if not OCR_ADAPTIVE:
+        return {}
+    return {"dpi": OCR_LOW_DPI, "adaptive": True, "high_dpi": OCR_HIGH_DPI, "min_confidence": OCR_MIN_CONFIDENCE}
+
+def _cache_settings(cascade, threshold, ocr_mode, merge, mirror_fix, regions):
+    # Every setting that changes the extracted text (part of the cache key)
+    return {
+        "extractor_version": TextExtractor.VERSION,
+        "cascade": cascade,
+        "threshold": threshold,
+        "min_word_ratio": CASCADE_MIN_WORD_RATIO,
+        "ocr_mode": ocr_mode,
+        "ocr_engine": OCR_ENGINE,
+        "ocr_max_pixels": OCR_MAX_PIXELS,
+        "ocr_adaptive": _adaptive_options(),
+        "merge_pages": merge,
+        "mirror_fix": mirror_fix,
+        "regions": regions,
+    }
 
-    # Write page-segmented dump from the combined text
-    debug_txt_output_path = os.path.join(
-        "TxT_Results", f"{os.path.basename(pdf_path)}_textdump.txt"
-    )
-    try:
-        PageDumpWriter().write_by_page(pdf_path, debug_txt_output_path, combined_text)
-        print(f"💾 Wrote page-segmented dump: {debug_txt_output_path}")
-    except Exception as e:
-        print(f"⚠️ Page dump failed (continuing): {e}")
+def _fill_missing(fields, fallback_text):
+    # Fields the title block / notes regions didn't have come from the full text
+    missing = [name for name, value in fields.items() if not value]
+    if missing:
+        print(f"🔁 Not in the regions, searching the full text for: {', '.join(missing)}")
+        full = search_engineering_fields(fallback_text)
+        for name in missing:
+            fields[name] = full.get(name)
+    return fields
 
-    # Downstream uses the raw combined text
-    fields = search_engineering_fields(combined_text)
+def extract_text_smart(pdf_path, return_raw: bool = False,
+                       cascade: bool = CASCADE_MODE, threshold: float = CASCADE_THRESHOLD,
+                       ocr_mode: str = OCR_MODE, merge: bool = MERGE_PAGES, ocr_pages=None,
+                       mirror_fix: bool = MIRROR_FIX, regions: bool = REGION_MODE, skip=()):
+    # skip: extractors that ran past their time budget on an earlier attempt
+    # One disk read and one parse per backend, shared by every extractor and the page dump
+    doc_metrics = metrics.begin(os.path.basename(pdf_path))
+    extract_start = time()
+    with Document(pdf_path) as document:
+        cache = get_cache()
+        cached = None
+        if cache:
+            with doc_metrics.timed("cache.lookup"):
+                cache_key = cache.key(document, _cache_settings(cascade, threshold, ocr_mode, merge, mirror_fix,
+                                                                regions))
+                cached = cache.get(cache_key)
+
+        if cached:
+            print(f"♻️ Cache hit for {document.name}; skipping extraction")
+            document.pages = cached["pages"]
+            combined_text, stage, score = cached["combined_text"], cached["stage"], cached["score"]
+        else:
+            combined_text, stage, score = _extract_document(document, cascade, threshold, ocr_mode, merge,
+                                                            ocr_pages, mirror_fix, regions, skip)
+            if cache and not skip:  # a full run may still do better next time
+                try:
+                    with doc_metrics.timed("cache.write"):
+                        cache.put(cache_key, {
+                            "file": document.name,
+                            "pages": document.pages,
+                            "combined_text": combined_text,
+                            "stage": stage,
+                            "score": score,
+                        })
+                except OSError as e:
+                    print(f"⚠️ Could not write cache entry (continuing): {e}")
+
+        # Write page-segmented dump from the per-page text the extractors collected
+        debug_txt_output_path = os.path.join(
+            "TxT_Results", f"{document.name}_textdump.txt"
+        )
+        try:
+            with doc_metrics.timed("dump"):
+                PageDumpWriter().write_by_page(document, debug_txt_output_path, combined_text)
+            print(f"💾 Wrote page-segmented dump: {debug_txt_output_path}")
+        except Exception as e:
+            print(f"⚠️ Page dump failed (continuing): {e}")
+            debug_txt_output_path = None
+        doc_metrics.set(pages=TextExtractor.page_count(document), bytes=document.size, cache_hit=bool(cached),
+                        stage=stage, score=score, ocr_pages_from_tasks=len(ocr_pages or {}))
+        source_hash = document.content_hash
+        region_text = "\n".join(p for p in document.pages.get("regions") or [] if p.strip()) if regions else ""
+        if regions:
+            doc_metrics.set(region_chars=len(region_text))
+        if skip:
+            doc_metrics.set(timed_out=list(skip))
+    extract_time = time() - extract_start
+
+    # Downstream uses the raw combined text (or the title block / notes regions in region mode)
+    search_start = time()
+    if region_text:
+        fields = search_engineering_fields(region_text)
+        if REGION_FALLBACK:
+            fields = _fill_missing(fields, combined_text)
+    else:
+        fields = search_engineering_fields(combined_text)
+    fields["Extraction_Stage"] = stage
+    fields["Quality_Score"] = score
+    fields["Cache_Hit"] = bool(cached)
+    fields["Dump_Path"] = debug_txt_output_path
+    fields["Source_Hash"] = source_hash
+    fields["Extract_Time"] = round(extract_time, 3)
+    fields["Search_Time"] = round(time() - search_start, 3)
+    fields["Metrics"] = doc_metrics.to_dict()
     raw_text_container = AllDataExtractor(combined_text)
 
     return (fields, raw_text_container) if return_raw else fields
 
 # === PARALLEL WORKER ===
-def process_pdf_file(pdf_path):
+def init_worker(preload=None):
+    # Runs once in each pool process: import the preloaded backends (and load the
+    # OCR engine if OCR is one of them) and build the field searchers before the
+    # first PDF instead of for every PDF
+    preload = WORKER_PRELOAD if preload is None else preload
+    backends.preload(preload)
+    if "ocr" in preload:
+        get_engine(OCR_ENGINE)
+    get_field_scanner()
+    get_mirror_fixer()
+    get_region_finder()
+
+
+def process_pdf_file(pdf_path, ocr_pages=None, skip=()):
+    # ocr_pages: {page index: text} already OCR'd by ocr_page_task, if any
+    # skip: extractors to leave out (they ran past their time budget before)
     try:
         filename = os.path.basename(pdf_path)
         print(f"\n📄 Processing: {filename}\n")
         start = time()
-        fields, raw_text_obj = extract_text_smart(pdf_path, return_raw=True)
+        # The worker already wrote the text dump, so only the small record (fields,
+        # dump path, timings) is pickled back to the parent, never the document text
+        fields = extract_text_smart(pdf_path, ocr_pages=ocr_pages, skip=skip)
         duration = time() - start
         print(f"⏱️  Processing time for {filename}: {duration:.2f} seconds")
         print("--------------------------------")
 
-        complete_data = {**fields, **raw_text_obj.to_dict()}
+        fields["Metrics"]["stages"]["total"] = round(duration, 4)
+        complete_data = {**fields, "Processing_Time": round(duration, 2)}
         return (filename, complete_data)
 
     except Exception as e:
         print(f"❌ Error processing {pdf_path}: {e}")
         return (os.path.basename(pdf_path), None)
 
+# === SCHEDULING ===
+def plan_pdf_file(pdf_path, cascade=CASCADE_MODE, threshold=CASCADE_THRESHOLD, ocr_mode=OCR_MODE,
+                  merge=MERGE_PAGES, mirror_fix=MIRROR_FIX, regions=REGION_MODE):
+    # Cheap look at one PDF (text layer only): (path, estimated cost, pages that will need OCR)
+    try:
+        with Document(pdf_path) as document:
+            cache = get_cache()
+            settings = _cache_settings(cascade, threshold, ocr_mode, merge, mirror_fix, regions)
+            if cache and cache.has(cache.key(document, settings)):
+                return (pdf_path, 0, [])
+            layer = [page.get_text() or "" for page in document.fitz_doc]
+            flagged = _pages_needing_ocr(document, layer)
+            ocr_pages = flagged if ocr_mode == "hybrid" else list(range(len(layer)))
+            # Same first step as the cascade: a good text layer means only the pages
+            # without one get OCR'd
+            if ocr_pages and cascade and len(ocr_pages) > len(flagged):
+                if mirror_fix:
+                    layer = get_mirror_fixer().fix_pages(layer, document.mirrored_lines)[0]
+                text = TextExtractor._normalize_space("".join(layer))
+                scorer = TextQualityScorer()
+                if scorer.score(text, len(layer) or 1) >= threshold or _layer_covers(scorer, text, flagged):
+                    ocr_pages = flagged
+            return (pdf_path, len(layer) + OCR_PAGE_COST * len(ocr_pages), ocr_pages)
+    except Exception as e:
+        print(f"⚠️ Could not plan {pdf_path} (scheduling it as a whole PDF): {e}")
+        return (pdf_path, 0, [])
+
+def ocr_page_task(pdf_path, index):
+    # One page of OCR as its own pool task; None tells the PDF's task to OCR it itself.
+    # Its stage timings are added to the PDF's metrics by run_scheduled.
+    page_metrics = metrics.begin(f"{os.path.basename(pdf_path)}#{index + 1}")
+    try:
+        with Document(pdf_path) as document:
+            page = document.fitz_doc[index]
+            if REGION_MODE:
+                text = TextExtractor._ocr_page_regions(page, max_pixels=OCR_MAX_PIXELS, engine=OCR_ENGINE,
+                                                       regions=get_region_finder(), region_dpi=REGION_OCR_DPI,
+                                                       **_adaptive_options())
+            else:
+                text = TextExtractor._ocr_page(page, max_pixels=OCR_MAX_PIXELS, engine=OCR_ENGINE,
+                                               **_adaptive_options())
+        return (pdf_path, index, text, page_metrics.stages, page_metrics.info)
+    except Exception as e:
+        print(f"⚠️ OCR failed for page {index + 1} of {pdf_path}: {e}")
+        return (pdf_path, index, None, page_metrics.stages, page_metrics.info)
+
+def submit_pdf(pool, pdf_path, on_done, ocr_pages=None, on_timeout=None, priority=0):
+    # Runs process_pdf_file on the pool within DOCUMENT_TIMEOUT and calls
+    # on_done((filename, fields or None)) once, from the pool's thread. When an
+    # extractor runs past its EXTRACTOR_TIMEOUTS budget the PDF goes back on the
+    # pool without it, on what is left of its own budget; a PDF that runs out of
+    # budget altogether is passed to on_timeout as a metrics record. Only time
+    # spent running on a worker counts, not time waiting in the pool's queue.
+    # Retries keep the PDF's priority.
+    filename = os.path.basename(pdf_path)
+    used = 0.0
+    skip = []
+
+    def left():
+        return DOCUMENT_TIMEOUT - used if DOCUMENT_TIMEOUT else None
+
+    def attempt():
+        # At least a second, so a retry is never started with no time at all
+        timeout = max(left(), 1.0) if DOCUMENT_TIMEOUT else None
+        pool.apply_async(process_pdf_file, (pdf_path, ocr_pages, list(skip)), callback=on_done,
+                         error_callback=failed, timeout=timeout, priority=priority)
+
+    def failed(error):
+        nonlocal used
+        if not isinstance(error, TaskTimeout):
+            print(f"❌ Error processing {pdf_path}: {error}")
+            on_done((filename, None))
+            return
+        used += error.elapsed
+        if error.kind == "stage" and (left() is None or left() >= 1.0):
+            print(f"⏰ {filename}: {error}; trying it again without {error.stage}")
+            skip.append(error.stage)
+            attempt()
+            return
+        print(f"⏰ {filename} timed out: {error}; moving on")
+        if on_timeout:
+            on_timeout({"file": filename, "timeout": error.stage or "document", "timed_out": list(skip),
+                        "stages": {"total": round(used, 4)}})
+        on_done((filename, None))
+
+    attempt()
+
+def run_unscheduled(pool, pdf_files, on_timeout=None):
+    # Yields (filename, fields) as PDFs finish, handed out in folder order
+    finished = queue.Queue()  # filled from the pool's thread
+    for pdf_path in pdf_files:
+        submit_pdf(pool, pdf_path, finished.put, on_timeout=on_timeout)
+    for _ in pdf_files:
+        yield finished.get()
+
+# Pool priorities for run_scheduled (lower goes first)
+PRIORITY_ASSEMBLY = 0  # a split PDF whose OCR pages are all back
+PRIORITY_RUN = 1       # a planned PDF, or one of its OCR pages
+PRIORITY_PLAN = 2      # a PDF waiting to be planned
+
+def _file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+def run_scheduled(pool, pdf_files, on_timeout=None):
+    # Yields (filename, fields) as PDFs finish, like run_unscheduled.
+    # File size is the cheap estimate of a PDF's work, so the biggest files are
+    # planned first, and each PDF runs as soon as its own plan is back instead of
+    # waiting for every other plan. Big OCR jobs are split into page tasks so one
+    # scanned set can't keep a single core busy while the rest sit idle.
+    finished = queue.Queue()  # filled from the pool's thread
+
+    def unplanned(pdf_path, error):
+        print(f"⚠️ Could not plan {pdf_path} (scheduling it as a whole PDF): {error}")
+        finished.put(("plan", pdf_path, (pdf_path, 0, [])))
+
+    # Planning only reads the text layer, so it gets the PyMuPDF budget
+    for pdf_path in sorted(pdf_files, key=_file_size, reverse=True):
+        pool.apply_async(plan_pdf_file, (pdf_path,), callback=lambda plan: finished.put(("plan", plan[0], plan)),
+                         error_callback=lambda e, p=pdf_path: unplanned(p, e),
+                         timeout=EXTRACTOR_TIMEOUTS.get("pymupdf"), priority=PRIORITY_PLAN)
+
+    def page_failed(pdf_path, index, error):
+        # A page that timed out comes back empty so the PDF's task doesn't OCR it again
+        if isinstance(error, TaskTimeout):
+            print(f"⏰ OCR of page {index + 1} of {os.path.basename(pdf_path)} {error}; leaving it empty")
+        finished.put(("page", pdf_path, (pdf_path, index, "" if isinstance(error, TaskTimeout) else None, {}, {})))
+
+    def submit(pdf_path, ocr_pages=None, priority=PRIORITY_RUN):
+        submit_pdf(pool, pdf_path, lambda result: finished.put(("pdf", pdf_path, result)), ocr_pages, on_timeout,
+                   priority)
+
+    collected = {}    # pdf path -> {page index: text} from finished page tasks
+    remaining = {}    # pdf path -> page tasks still running
+    page_stages = {}  # pdf path -> stage timings summed over its page tasks
+    outstanding = len(pdf_files)
+    while outstanding:
+        kind, pdf_path, result = finished.get()
+        if kind == "plan":
+            ocr_pages = result[2]
+            if len(ocr_pages) >= PAGE_OCR_MIN_PAGES:
+                print(f"🗂️ Splitting {os.path.basename(pdf_path)} into {len(ocr_pages)} OCR page task(s)")
+                collected[pdf_path] = {}
+                remaining[pdf_path] = len(ocr_pages)
+                page_stages[pdf_path] = metrics.DocumentMetrics()
+                for index in ocr_pages:
+                    pool.apply_async(ocr_page_task, (pdf_path, index),
+                                     callback=lambda result: finished.put(("page", result[0], result)),
+                                     error_callback=lambda e, p=pdf_path, i=index: page_failed(p, i, e),
+                                     timeout=OCR_PAGE_TIMEOUT, priority=PRIORITY_RUN)
+            else:
+                submit(pdf_path)
+        elif kind == "page":
+            _, index, text, stages, info = result
+            if text is not None:
+                collected[pdf_path][index] = text
+            page_stages[pdf_path].merge(stages)
+            metrics.merge_info(page_stages[pdf_path].info, info)
+            remaining[pdf_path] -= 1
+            if remaining[pdf_path] == 0:
+                # Every page is back: the PDF's own task reassembles them in page order,
+                # ahead of anything else waiting
+                submit(pdf_path, collected.pop(pdf_path), PRIORITY_ASSEMBLY)
+        else:
+            outstanding -= 1
+            fields = result[1]
+            split = page_stages.pop(pdf_path, None)
+            if split and fields:
+                # OCR done in page tasks counts toward this PDF's own stages
+                stages = fields["Metrics"]["stages"]
+                for stage, seconds in split.stages.items():
+                    stages[stage] = round(stages.get(stage, 0.0) + seconds, 4)
+                metrics.merge_info(fields["Metrics"], split.info)
+            yield result
+
+# === INDEXING ===
+def index_result(index, filename, fields):
+    # The worker already wrote the page dump, so the parent reads the pages back
+    # from it instead of having them pickled across with the result
+    dump_path = fields.get("Dump_Path")
+    if not dump_path:
+        return
+    try:
+        source, pages = PageDumpWriter.read_pages(dump_path)
+    except OSError as e:
+        print(f"⚠️ Could not index {filename} (continuing): {e}")
+        return
+    index.add(filename, pages, source, fields.get("Job_Number"), dump_path)
+
+# === POOL SIZING ===
+def available_memory_mb():
+    try:
+        import psutil
+        return psutil.virtual_memory().available // (1024 * 1024)
+    except ImportError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        pass
+    try:
+        # Windows has no sysconf; ask the kernel directly
+        import ctypes
+
+        class MEMORYSTATUSEX(ctypes.Structure):
+            _fields_ = [
+                ("dwLength", ctypes.c_ulong), ("dwMemoryLoad", ctypes.c_ulong),
+                ("ullTotalPhys", ctypes.c_ulonglong), ("ullAvailPhys", ctypes.c_ulonglong),
+                ("ullTotalPageFile", ctypes.c_ulonglong), ("ullAvailPageFile", ctypes.c_ulonglong),
+                ("ullTotalVirtual", ctypes.c_ulonglong), ("ullAvailVirtual", ctypes.c_ulonglong),
+                ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+            ]
+
+        status = MEMORYSTATUSEX()
+        status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+        ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status))
+        return status.ullAvailPhys // (1024 * 1024)
+    except Exception:
+        return None
+
+def choose_pool_size(worker_memory_mb=WORKER_MEMORY_MB):
+    if not worker_memory_mb:
+        return min(8, cpu_count())
+    available = available_memory_mb()
+    if available is None:
+        print("⚠️ Could not read available memory; using min(8, cpu_count())")
+        return min(8, cpu_count())
+    workers = max(1, min(cpu_count(), available // worker_memory_mb))
+    print(f"🧠 {available} MB available, {worker_memory_mb} MB per worker -> {workers} worker(s)")
+    return workers
+
+def get_pool_context(start_method=START_METHOD, preload=WORKER_PRELOAD):
+    # Falls back to the platform default where the start method doesn't exist
+    if start_method not in multiprocessing.get_all_start_methods():
+        start_method = None
+    context = multiprocessing.get_context(start_method)
+    if context.get_start_method() == "forkserver":
+        # The server imports the main script and the preloaded backends once
+        context.set_forkserver_preload(["__main__"] + backends.modules(preload))
+    return context
+
+def make_pool(processes, initializer=init_worker):
+    # One task per worker at a time, each held to its time budget (see DOCUMENT_TIMEOUT)
+    return SupervisedPool(processes, initializer, context=get_pool_context(), stage_timeouts=EXTRACTOR_TIMEOUTS,
+                          max_tasks=WORKER_MAX_TASKS, max_rss_mb=WORKER_MAX_RSS_MB)
+
 # === MAIN EXECUTION ===
 if __name__ == "__main__":
-    from multiprocessing import Pool, cpu_count
     from datetime import datetime
 
     input_folder = r"C:\\Users\\leben\\Downloads\\BOK_PDFs"
@@ -182,11 +830,21 @@ if __name__ == "__main__":
     # Only create the Results directory; do NOT create CSV_Txt Results
     os.makedirs(results_dir, exist_ok=True)
 
-    output_csv = os.path.join(output_dir, f"extracted_meeting_notes_{timestamp}.csv")
     output_notes = None
 
-    # Keep your clear call as-is (it should handle missing dirs gracefully in your CSVHandler)
-    CSVHandler.prompt_clear_all(output_csv, results_dir, general_notes_folder=None)
+    if SYNC_MODE:
+        # One long-lived CSV that is kept in step with the folder
+        output_csv = os.path.join(output_dir, "extracted_meeting_notes.csv")
+        manifest = FolderManifest(os.path.join(output_dir, "manifest.json"))
+    else:
+        output_csv = os.path.join(output_dir, f"extracted_meeting_notes_{timestamp}.csv")
+
+        # Keep your clear call as-is (it should handle missing dirs gracefully in your CSVHandler)
+        CSVHandler.prompt_clear_all(output_csv, results_dir, general_notes_folder=None)
+
+    cache = get_cache()
+    if cache and CACHE_CLEAR:
+        print(f"🧹 Cleared {cache.invalidate()} cached extraction(s).")
 
     total_start = time()
 
@@ -196,17 +854,108 @@ if __name__ == "__main__":
         if f.lower().endswith(".pdf")
     ]
 
-    with Pool(processes=min(8, cpu_count())) as pool:
-        results = pool.map(process_pdf_file, pdf_files)
-
-    all_results = []
-
-    for filename, fields in results:
-        if fields:
-            fields["Source_File"] = filename
-            all_results.append(fields)
-            CSVHandler.write_to_csv(fields, output_csv, filename)
+    if SYNC_MODE:
+        pdf_files, deleted_files = manifest.diff(pdf_files)
+        print(f"🔄 Sync: {len(pdf_files)} new/modified PDF(s), {len(deleted_files)} deleted")
+
+    # Results arrive in completion order, so map them back to their paths by name
+    paths_by_name = {os.path.basename(p): p for p in pdf_files}
+    summaries = []  # small per-file stats for the end-of-run summary
+    synced = 0
+    failed = 0
+
+    workers = choose_pool_size()
+    timeouts = []  # metrics records of PDFs that ran out of time (appended from the pool's thread)
+    sinks = open_sinks(OUTPUT_SINKS, {"csv": output_csv, "sqlite": SQLITE_PATH, "parquet": PARQUET_DIR},
+                       CSV_BATCH_SIZE, sync=SYNC_MODE)
+    index = PageIndex(INDEX_PATH, INDEX_BATCH_SIZE) if INDEX_ENABLED else None
+    report = None
+    if METRICS_ENABLED:
+        run_stamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
+        report = metrics.MetricsReport(os.path.join(METRICS_DIR, f"metrics_{run_stamp}.jsonl"))
+    try:
+        with make_pool(workers) as pool:
+            if PAGE_SCHEDULING:
+                results = run_scheduled(pool, pdf_files, timeouts.append)
+            else:
+                results = run_unscheduled(pool, pdf_files, timeouts.append)
+            for done, (filename, fields) in enumerate(results, start=1):
+                print(f"📦 [{done}/{len(pdf_files)}] {filename}{'' if fields else ' (failed)'}")
+                if not fields:
+                    failed += 1
+                    continue
+                if report:
+                    report.add(fields.pop("Metrics", None))
+                if index:
+                    index_result(index, filename, fields)
+                summaries.append({
+                    "Extraction_Stage": fields.get("Extraction_Stage"),
+                    "Processing_Time": fields.get("Processing_Time", 0.0),
+                    "Cache_Hit": fields.get("Cache_Hit"),
+                })
+                sinks.write(fields, filename)
+                if SYNC_MODE:
+                    synced += 1
+                    manifest.record(paths_by_name[filename])
+            if pool.killed or pool.recycled:
+                print(f"\n♻️ Workers: {pool.killed} killed over a time budget, {pool.recycled} recycled "
+                      f"(every {WORKER_MAX_TASKS} tasks or over {WORKER_MAX_RSS_MB} MB)")
+        if report:
+            for record in timeouts:
+                report.add(record)
+        if SYNC_MODE:
+            removed = [os.path.basename(p) for p in deleted_files]
+            sinks.remove(removed)
+    finally:
+        sinks.close()
+        if report:
+            report.close()
+
+    if SYNC_MODE:
+        if index:
+            index.remove(removed)
+        for pdf_path, filename in zip(deleted_files, removed):
+            manifest.forget(pdf_path)
+            dump_path = os.path.join(results_dir, f"{filename}_textdump.txt")
+            if os.path.exists(dump_path):
+                os.remove(dump_path)
+        # Failed PDFs are left out of the manifest so the next sync retries them
+        manifest.save()
+        print(f"🔄 Sync: updated {synced} row(s), removed {len(removed)} row(s)")
+
+    # Which stage produced the text, and how long those files took
+    stage_totals = {}
+    for fields in summaries:
+        count, seconds = stage_totals.get(fields.get("Extraction_Stage"), (0, 0.0))
+        stage_totals[fields.get("Extraction_Stage")] = (count + 1, seconds + fields.get("Processing_Time", 0.0))
+    print("\n📊 Extraction stages:")
+    for stage, (count, seconds) in stage_totals.items():
+        print(f"   {stage}: {count} file(s), {seconds:.2f} seconds")
+
+    if cache:
+        hits = sum(1 for fields in summaries if fields.get("Cache_Hit"))
+        print(f"\n♻️ Cache: {hits} hit(s), {len(summaries) - hits} miss(es)")
+        evicted = cache.evict()
+        if evicted:
+            print(f"🧹 Evicted {evicted} old cache entry(ies) to stay under {CACHE_MAX_MB} MB")
+
+    if index:
+        index.flush()
+        stats = index.stats()
+        index.close(optimize=True)
+        print(f"\n🔎 Page index: {stats['documents']} document(s), {stats['pages']} page(s) in {INDEX_PATH}")
+
+    if failed:
+        print(f"\n⚠️ {failed} PDF(s) failed; see the errors above")
+    if timeouts:
+        print(f"⏰ {len(timeouts)} of them ran past DOCUMENT_TIMEOUT ({DOCUMENT_TIMEOUT} s): "
+              f"{', '.join(record['file'] for record in timeouts)}")
 
     total_duration = time() - total_start
+    if report:
+        report.summary(total_duration)
     print(f"\n⏳ Total processing time for all PDFs: {total_duration:.2f} seconds")
-    print("✅ Structured data saved to:", output_csv)
\ No newline at end of file
+    if "csv" in OUTPUT_SINKS:
+        print("✅ Structured data saved to:", output_csv)
+    if "sqlite" in OUTPUT_SINKS:
+        print("✅ SQLite results saved to:", SQLITE_PATH)
\ No newline at end of file
@@ -0,0 +1,90 @@
+# Finds PDFs by their design parameters in the results database (SQLITE_PATH).
+#
+#   python query.py "SDS=0.5..1.0" "Vult>=140"
+#   python query.py "Pg>20" --material GLULAM
+#   python query.py "R<=3" "Ie=1.25" --code ASCE7-16 --limit 50
+#
+# Parameters: Ss, S1, SDS, SD1, Vult (mph), Pg (ground snow, psf), Lr (roof live,
+# psf), LL (floor live, psf), R, Cd, Omega0, Ie. Each is an indexed column, so
+# every condition is an index range scan, not a search through the text dumps.
+from Datahandler.sinks import SQLiteSink                        # For the results database
+from mainextractor import SQLITE_PATH                           # Where the database lives
+
+from time import perf_counter                                   # For timing the query
+import argparse                                                 # For the command line
+import re                                                       # For reading the conditions
+import os                                                       # For file operations
+
+# Short names people type -> column
+ALIASES = {
+    "vult": "vult_mph",
+    "pg": "ground_snow_load_psf",
+    "snow": "ground_snow_load_psf",
+    "lr": "roof_live_load_psf",
+    "ll": "floor_live_load_psf",
+    "live": "floor_live_load_psf",
+    "omega": "omega0",
+}
+
+CONDITION = re.compile(r"^\s*([^<>=\s]+)\s*(>=|<=|=|<|>)\s*(\d*\.?\d+)(?:\s*\.\.\s*(\d*\.?\d+))?\s*$")
+
+def parse_condition(text):
+    # "SDS=0.5..1.0" -> ("sds", (0.5, 1.0)); "Vult>=140" -> ("vult_mph", (140, None))
+    # ("<" and ">" are read as "<=" and ">=")
+    match = CONDITION.match(text)
+    if not match:
+        raise ValueError(f"Can't read condition {text!r} (try SDS=0.5..1.0 or Vult>=140)")
+    name, op, value, upper = match.groups()
+    column = ALIASES.get(name.lower(), name.lower())
+    if column not in SQLiteSink.PARAMETER_COLUMNS:
+        raise ValueError(f"Unknown parameter '{name}' "
+                         f"(choose from {', '.join(SQLiteSink.PARAMETER_COLUMNS)} or {', '.join(ALIASES)})")
+    value = float(value)
+    if upper is not None:
+        if op != "=":
+            raise ValueError(f"Use = with a range: {name}={value}..{upper}")
+        return column, (value, float(upper))
+    if op == "=":
+        return column, (value, value)
+    return column, (value, None) if op.startswith(">") else (None, value)
+
+def main():
+    parser = argparse.ArgumentParser(description="Find PDFs by design parameter ranges")
+    parser.add_argument("conditions", nargs="*", help="e.g. SDS=0.5..1.0 Vult>=140 R<=3")
+    parser.add_argument("--material", action="append", default=[], help="only PDFs with this material")
+    parser.add_argument("--code", action="append", default=[], help="only PDFs citing this design code")
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--db", default=SQLITE_PATH)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"⚠️ No results database at {args.db}; run mainextractor.py with \"sqlite\" in OUTPUT_SINKS first")
+        return
+    ranges = {}
+    try:
+        for text in args.conditions:
+            column, (low, high) = parse_condition(text)
+            old_low, old_high = ranges.get(column, (None, None))
+            # "SDS>=0.5" "SDS<=1.0" together are one range
+            ranges[column] = (low if low is not None else old_low, high if high is not None else old_high)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+
+    sink = SQLiteSink(args.db)
+    try:
+        start = perf_counter()
+        rows = sink.find(ranges, args.material, args.code, args.limit)
+        elapsed = (perf_counter() - start) * 1000
+    finally:
+        sink.close()
+
+    shown = list(ranges) or ["sds", "sd1", "vult_mph"]
+    for row in rows:
+        values = ", ".join(f"{column} {row[column]:g}" if row[column] is not None else f"{column} -"
+                           for column in shown)
+        print(f"📄 {row['source_file']}  (job {row['job_number'] or '-'})  {values}")
+    print(f"\n🔎 {len(rows)} PDF(s) in {elapsed:.1f} ms")
+
+if __name__ == "__main__":
+    main()
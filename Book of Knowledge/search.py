@@ -0,0 +1,65 @@
+# Searches the page index built by mainextractor.py / watcher.py (INDEX_PATH).
+#
+#   python search.py "drilled piers"                   (phrase)
+#   python search.py glulam wood*                      (all words; * = starts with)
+#   python search.py "concrete NOT masonry" --job 22.00.062
+#   python search.py steel --file Covington --extractor ocr --limit 50
+#
+# Best matches come first (BM25), each with the page it is on and the hits in [brackets].
+from Datahandler.pageindex import PageIndex                     # For the searchable page index
+from mainextractor import INDEX_PATH                            # Where the index lives
+
+from time import perf_counter                                   # For timing the query
+import argparse                                                 # For the command line
+import sqlite3                                                  # For reporting bad queries
+import os                                                       # For file operations
+
+def build_query(arguments):
+    # The shell drops the quotes around "drilled piers", so an argument with spaces
+    # is a phrase again, unless it uses AND / OR / NOT or a prefix*
+    parts = []
+    for argument in arguments:
+        words = argument.split()
+        if len(words) > 1 and not argument.startswith('"') and not any(
+                word in ("AND", "OR", "NOT") or word.endswith("*") for word in words):
+            parts.append(f'"{argument}"')
+        else:
+            parts.append(argument)
+    return " ".join(parts)
+
+def main():
+    parser = argparse.ArgumentParser(description="Search every indexed PDF page")
+    parser.add_argument("query", nargs="+", help='words, "a phrase", prefix*, AND / OR / NOT')
+    parser.add_argument("--job", help="only documents whose job number contains this")
+    parser.add_argument("--file", help="only documents whose file name contains this")
+    parser.add_argument("--extractor", help="only pages from this extractor (merged, pymupdf, ocr, ...)")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--raw", action="store_true", help="pass the query to SQLite FTS5 unchanged")
+    parser.add_argument("--index", default=INDEX_PATH)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.index):
+        print(f"⚠️ No index at {args.index}; run mainextractor.py or watcher.py first")
+        return
+    query = " ".join(args.query) if args.raw else build_query(args.query)
+
+    with PageIndex(args.index) as index:
+        start = perf_counter()
+        try:
+            results = index.search(query, source_file=args.file, job_number=args.job,
+                                   extractor=args.extractor, limit=args.limit, raw=args.raw)
+        except sqlite3.OperationalError as e:
+            print(f"❌ Bad query {query!r}: {e}")
+            return
+        elapsed = (perf_counter() - start) * 1000
+
+        for result in results:
+            print(f"\n📄 {result['file']}  page {result['page']}  (job {result['job_number'] or '-'}, "
+                  f"{result['extractor']}, score {result['score']})")
+            print("   " + " ".join(result["snippet"].split()))
+        stats = index.stats()
+        print(f"\n🔎 {len(results)} result(s) in {elapsed:.1f} ms across {stats['documents']} document(s), "
+              f"{stats['pages']} page(s)")
+
+if __name__ == "__main__":
+    main()
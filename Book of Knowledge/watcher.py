@@ -0,0 +1,257 @@
+# Long-running ingestion service: watches a drop folder and runs every new or
+# changed PDF through the same pipeline as mainextractor.py, keeping one CSV
+# (shared with SYNC_MODE) up to date within seconds. No prompts; stop with Ctrl+C.
+#
+#   python watcher.py "C:\path\to\drop folder" --ocr 2 --text 4
+from mainextractor import init_worker, plan_pdf_file, submit_pdf, get_cache        # The extraction pipeline
+from mainextractor import make_pool, EXTRACTOR_TIMEOUTS
+from mainextractor import index_result, INDEX_ENABLED, INDEX_PATH, INDEX_BATCH_SIZE
+from mainextractor import OUTPUT_SINKS, SQLITE_PATH, PARQUET_DIR
+from Datahandler.dropfolder import DropFolder                   # For spotting finished PDFs in the folder
+from Datahandler.manifest import FolderManifest                 # For remembering what was already processed
+from Datahandler.sinks import open_sinks                        # For writing results (CSV, SQLite, Parquet)
+from Datahandler import metrics                                 # For per-stage timing of each document
+from Datahandler.pageindex import PageIndex                     # For the searchable page index
+
+from datetime import datetime                                   # For timestamping the metrics file
+from time import time                                           # For flush timing
+import argparse                                                 # For the command line
+import asyncio                                                  # For running the watcher, queues and workers together
+import signal                                                   # For leaving Ctrl+C to the main process
+import os                                                       # For file operations
+
+# === CONFIGURATION ===
+WATCH_FOLDER = r"C:\\Users\\leben\\Downloads\\BOK_Drop"
+
+# The folder is listed every POLL_SECONDS (every RESCAN_SECONDS when the optional
+# "watchdog" package delivers file system events instead). A PDF is picked up once
+# its size and modified time haven't changed for SETTLE_SECONDS and it ends
+# properly; one still growing after MAX_WAIT_SECONDS is picked up anyway.
+POLL_SECONDS = 1.0
+RESCAN_SECONDS = 30.0
+SETTLE_SECONDS = 2.0
+MAX_WAIT_SECONDS = 120.0
+
+# Finished PDFs wait in a queue of QUEUE_SIZE; when it is full the watcher stops
+# handing out files until workers catch up (they stay in the folder, nothing is lost).
+# PDFs that need OCR and PDFs with a usable text layer get their own lanes, so a
+# stack of scans can't hold up the quick ones; the pool has one process per slot.
+QUEUE_SIZE = 16
+OCR_CONCURRENCY = 2
+TEXT_CONCURRENCY = 4
+
+# Finished rows are written to the CSV (and the manifest saved) every FLUSH_SECONDS
+FLUSH_SECONDS = 2.0
+
+OUTPUT_CSV = os.path.join("CSV_Result", "extracted_meeting_notes.csv")
+MANIFEST_PATH = os.path.join("CSV_Result", "manifest.json")
+RESULTS_DIR = "TxT_Results"
+METRICS_DIR = "Metrics"
+
+# === RESULTS ===
+class ResultWriter:
+    # Collects finished PDFs and deletions, then writes them to every sink at once
+    def __init__(self, sinks, manifest, report=None, index=None):
+        self.sinks = sinks
+        self.manifest = manifest
+        self.report = report
+        self.index = index
+        self.paths = {}     # Source_File -> pdf path (recorded in the manifest on flush)
+        self.removed = []   # pdf paths deleted from the folder
+        self.processed = 0
+        self.failed = 0
+
+    def timed_out(self, record):
+        if self.report:
+            self.report.add(record)
+
+    def add(self, pdf_path, filename, fields):
+        if not fields:
+            # Left out of the manifest, so it is retried on the next start
+            self.failed += 1
+            print(f"⚠️ {filename} failed; it will be retried when it changes or on restart")
+            return
+        if self.report:
+            self.report.add(fields.pop("Metrics", None))
+        else:
+            fields.pop("Metrics", None)
+        if self.index:
+            index_result(self.index, filename, fields)
+        self.sinks.write(fields, filename)
+        self.paths[filename] = pdf_path
+        self.processed += 1
+
+    def remove(self, pdf_paths):
+        self.removed.extend(pdf_paths)
+
+    def flush(self):
+        if not self.paths and not self.removed:
+            return
+        removed = [os.path.basename(p) for p in self.removed]
+        self.sinks.remove(removed)
+        self.sinks.flush()
+        if self.index:
+            self.index.remove(removed)
+            self.index.flush()
+        for filename, pdf_path in self.paths.items():
+            try:
+                self.manifest.record(pdf_path)
+            except OSError:
+                pass  # deleted again before the flush
+        for pdf_path, filename in zip(self.removed, removed):
+            self.manifest.forget(pdf_path)
+            dump_path = os.path.join(RESULTS_DIR, f"{filename}_textdump.txt")
+            if os.path.exists(dump_path):
+                os.remove(dump_path)
+        self.manifest.save()
+        print(f"✅ Results updated: {len(self.paths)} row(s) written, {len(removed)} removed "
+              f"({self.processed} processed so far)")
+        self.paths, self.removed = {}, []
+
+# === SERVICE ===
+def init_watch_worker():
+    # Ctrl+C stops the service from the main process, which then shuts the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    init_worker()
+
+def run_in_pool(pool, pdf_path, writer):
+    # An asyncio future for one PDF, held to its time budgets; the pool's thread resolves it
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(result):
+        if not future.done():
+            future.set_result(result)
+
+    submit_pdf(pool, pdf_path, lambda result: loop.call_soon_threadsafe(resolve, result),
+               on_timeout=lambda record: loop.call_soon_threadsafe(writer.timed_out, record))
+    return future
+
+def start_observer(drop):
+    # File system events (inotify / ReadDirectoryChangesW) when "pip install watchdog"
+    # is available; None means plain polling
+    try:
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+    except ImportError:
+        return None
+    loop = asyncio.get_running_loop()
+
+    class Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if event.is_directory:
+                return
+            for path in (event.src_path, getattr(event, "dest_path", None)):
+                if path and path.lower().endswith(".pdf"):
+                    loop.call_soon_threadsafe(drop.touch, path)
+
+    observer = Observer()
+    observer.schedule(Handler(), drop.folder, recursive=False)
+    observer.start()
+    return observer
+
+async def discover(drop, incoming, writer, rescan_seconds):
+    last_listing = 0.0
+    while True:
+        if time() - last_listing >= rescan_seconds:
+            deleted = drop.poll()
+            last_listing = time()
+            if deleted:
+                print(f"🗑️ {len(deleted)} PDF(s) removed from the folder")
+                writer.remove(deleted)
+        for pdf_path in drop.ready():
+            print(f"📥 Queued {os.path.basename(pdf_path)} ({incoming.qsize() + 1}/{incoming.maxsize})")
+            await incoming.put(pdf_path)  # waits while the queue is full
+        await asyncio.sleep(POLL_SECONDS)
+
+async def classify(incoming, lanes):
+    # The same cheap text-layer check the batch scheduler uses, run in a thread so
+    # it never waits behind long OCR jobs in the pool. A thread can't be killed, so
+    # one that hangs is left behind and the PDF goes to the OCR lane.
+    while True:
+        pdf_path = await incoming.get()
+        try:
+            _, _, ocr_pages = await asyncio.wait_for(asyncio.to_thread(plan_pdf_file, pdf_path),
+                                                     EXTRACTOR_TIMEOUTS.get("pymupdf"))
+        except asyncio.TimeoutError:
+            print(f"⏰ Checking {os.path.basename(pdf_path)} took too long; sending it to the OCR lane")
+            ocr_pages = True
+        await lanes["ocr" if ocr_pages else "text"].put(pdf_path)
+        incoming.task_done()
+
+async def work(lane, pool, writer):
+    while True:
+        pdf_path = await lane.get()
+        try:
+            filename, fields = await run_in_pool(pool, pdf_path, writer)
+        except Exception as e:
+            print(f"❌ Error processing {pdf_path}: {e}")
+            filename, fields = os.path.basename(pdf_path), None
+        writer.add(pdf_path, filename, fields)
+        lane.task_done()
+
+async def flush_periodically(writer):
+    while True:
+        await asyncio.sleep(FLUSH_SECONDS)
+        writer.flush()
+
+async def serve(folder, pool, writer, ocr_concurrency, text_concurrency):
+    # Only this folder's PDFs count as already seen, so only they can be reported deleted
+    drop = DropFolder(folder, SETTLE_SECONDS, MAX_WAIT_SECONDS,
+                      seen={path: (entry["size"], entry["mtime"])
+                            for path, entry in writer.manifest.in_folder(folder).items()})
+    observer = start_observer(drop)
+    print(f"👀 Watching {folder} ({'file system events' if observer else f'polling every {POLL_SECONDS}s'}, "
+          f"{ocr_concurrency} OCR + {text_concurrency} text worker(s))")
+
+    incoming = asyncio.Queue(maxsize=QUEUE_SIZE)
+    lanes = {"ocr": asyncio.Queue(maxsize=QUEUE_SIZE), "text": asyncio.Queue(maxsize=QUEUE_SIZE)}
+    tasks = [
+        asyncio.create_task(discover(drop, incoming, writer, RESCAN_SECONDS if observer else POLL_SECONDS)),
+        asyncio.create_task(classify(incoming, lanes)),
+        asyncio.create_task(flush_periodically(writer)),
+    ]
+    tasks += [asyncio.create_task(work(lanes["ocr"], pool, writer)) for _ in range(ocr_concurrency)]
+    tasks += [asyncio.create_task(work(lanes["text"], pool, writer)) for _ in range(text_concurrency)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        if observer:
+            observer.stop()
+            observer.join()
+        writer.flush()
+
+# === MAIN EXECUTION ===
+def main():
+    parser = argparse.ArgumentParser(description="Watch a folder and extract every PDF dropped into it")
+    parser.add_argument("folder", nargs="?", default=WATCH_FOLDER)
+    parser.add_argument("--ocr", type=int, default=OCR_CONCURRENCY, help="PDFs needing OCR processed at once")
+    parser.add_argument("--text", type=int, default=TEXT_CONCURRENCY, help="text-layer PDFs processed at once")
+    parser.add_argument("--csv", default=OUTPUT_CSV)
+    args = parser.parse_args()
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    get_cache()
+    report = metrics.MetricsReport(os.path.join(METRICS_DIR, f"watch_{datetime.now():%Y-%m-%d_%H%M%S}.jsonl"))
+    index = PageIndex(INDEX_PATH, INDEX_BATCH_SIZE) if INDEX_ENABLED else None
+    sinks = open_sinks(OUTPUT_SINKS, {"csv": args.csv, "sqlite": SQLITE_PATH, "parquet": PARQUET_DIR}, sync=True)
+    writer = ResultWriter(sinks, FolderManifest(MANIFEST_PATH), report, index)
+    start = time()
+    try:
+        with make_pool(args.ocr + args.text, init_watch_worker) as pool:
+            asyncio.run(serve(os.path.abspath(args.folder), pool, writer, args.ocr, args.text))
+    except KeyboardInterrupt:
+        print("\n🛑 Stopped")
+    finally:
+        sinks.close()
+        report.close()
+        if index:
+            index.close()
+        if writer.failed:
+            print(f"⚠️ {writer.failed} PDF(s) failed; see the errors above")
+        report.summary(time() - start)
+
+if __name__ == "__main__":
+    main()